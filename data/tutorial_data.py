@@ -1,90 +0,0 @@
-# Law NPCs with detailed information
-laws_info = [
-    {
-        "title": "Freedom of Expression",
-        "description": "Freedom of expression is protected under the Canadian Charter of Rights and Freedoms.",
-        "details": [
-            "Includes freedom of speech, press, and other forms of communication",
-            "Has reasonable limits to prevent hate speech",
-            "Protects peaceful protests and demonstrations",
-            "Applies to various forms of expression including art and music"
-        ]
-    },
-    {
-        "title": "Privacy Rights",
-        "description": "Personal information is protected under Canadian privacy laws.",
-        "details": [
-            "Organizations must get consent to collect personal data",
-            "Individuals have the right to access their personal information",
-            "Companies must protect stored personal information",
-            "Privacy breaches must be reported to affected individuals"
-        ]
-    },
-    {
-        "title": "Property Laws",
-        "description": "Canadian law protects property rights and establishes ownership rules.",
-        "details": [
-            "Defines ownership and transfer of property",
-            "Protects against theft and damage",
-            "Establishes rules for landlords and tenants",
-            "Covers both physical and intellectual property"
-        ]
-    },
-    {
-        "title": "Anti-Discrimination",
-        "description": "The Canadian Human Rights Act prohibits discrimination based on protected grounds.",
-        "details": [
-            "Protects against discrimination in employment",
-            "Covers housing and public services",
-            "Includes multiple protected grounds like race, gender, and disability",
-            "Requires reasonable accommodation"
-        ]
-    },
-    {
-        "title": "Right to Assembly",
-        "description": "Canadians have the right to peaceful assembly and association.",
-        "details": [
-            "Allows for peaceful protests and demonstrations",
-            "Protects formation of unions and associations",
-            "Must be conducted peacefully and lawfully",
-            "May require permits for large gatherings"
-        ]
-    }
-]
-
-
-# Scenario-based quiz questions
-scenarios = [
-    {
-        "scenario": "Sarah wants to organize a peaceful protest against climate change at a public park. The protest will include speeches and signs.",
-        "question": "Is Sarah's planned protest protected under Canadian law?",
-        "answer": "yes",
-        "explanation": "Yes, peaceful protests are protected under freedom of expression and right to assembly, though permits may be required."
-    },
-    {
-        "scenario": "A company wants to share its customer database with partners without getting permission from customers.",
-        "question": "Is this practice allowed under privacy laws?",
-        "answer": "no",
-        "explanation": "No, companies must obtain consent before sharing personal information with third parties."
-    },
-    {
-        "scenario": "Alex borrowed their neighbor's lawn mower and decided to keep it without permission.",
-        "question": "Is this action legal under property laws?",
-        "answer": "no",
-        "explanation": "No, this would be considered theft and violates property laws."
-    },
-    {
-        "scenario": "An employer refuses to hire qualified candidates based on their religion.",
-        "question": "Is this practice legal under Canadian law?",
-        "answer": "no",
-        "explanation": "No, this is discrimination based on religion and is prohibited under the Human Rights Act."
-    },
-    {
-        "scenario": "Workers at a factory want to form a union to negotiate better working conditions.",
-        "question": "Do they have the right to form a union?",
-        "answer": "yes",
-        "explanation": "Yes, the right to form unions is protected under freedom of association."
-    }
-]
-
-
@@ -0,0 +1,119 @@
+"""Bake every image in images/ into the pre-scaled, memory-mapped asset pack.
+
+    python scenarios/bake_assets.py [--force] [--workers N]
+
+Images are decoded and scaled in a process pool and written as raw pixel blocks
+in display byte order, so the game never decodes a PNG/JPEG at runtime. Entries
+whose source file is unchanged (same hash) are copied from the previous pack.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from engine.asset_pack import DEFAULT_PACK_PATH, PIXEL_FORMAT, PackEntry, file_sha1, open_pack, write_pack
+from engine.assets import ROOT_DIR, asset_path
+
+IMAGE_DIR = "images"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+SCREEN_SIZE = (800, 600)
+PLAYER_SIZES = [(75, 75), (50, 50), (20, 20)]  # Tutorial/office player, main menu player, police traffic pedestrian
+
+# (size, alpha) variants the scenes request, size None meaning native size.
+# Images not listed here are baked once at native size.
+VARIANTS: Dict[str, List[Tuple[Optional[Tuple[int, int]], bool]]] = {
+    "images/tut.png": [(SCREEN_SIZE, False)],
+    "images/office.png": [(SCREEN_SIZE, False)],
+    "images/office-boss.png": [(SCREEN_SIZE, False)],
+    "images/main_menu_background.jpg": [(SCREEN_SIZE, False)],
+    "images/main_menu_background2.jpg": [(SCREEN_SIZE, False)],
+    "images/sample.png": [(SCREEN_SIZE, False)],
+    "images/car.png": [((100, 50), True), ((40, 20), True)],  # Player/police cars, traffic cars
+    "images/exclamation.png": [((30, 30), False)],
+    "images/document.png": [((25, 25), True)],
+}
+# Packed player atlas (4x3 frames of 16px) at each player size
+VARIANTS["images/player_atlas.png"] = [((4 * w, 3 * h), True) for w, h in PLAYER_SIZES]
+
+BakeJob = Tuple[str, Optional[Tuple[int, int]], bool]
+
+
+def init_worker():
+    """Give each worker a hidden display so images convert exactly as they do in game"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+def bake_one(path: str, size: Optional[Tuple[int, int]], alpha: bool) -> Tuple[Tuple[int, int], bytes]:
+    """Decode, convert and scale one image in a worker; returns its size and raw pixels"""
+    surface = pygame.image.load(asset_path(path))
+    surface = surface.convert_alpha() if alpha else surface.convert()
+    if size and surface.get_size() != size:
+        surface = pygame.transform.scale(surface, size)  # Same filter the runtime path uses
+    return surface.get_size(), pygame.image.tobytes(surface, PIXEL_FORMAT)
+
+
+def collect_jobs() -> List[BakeJob]:
+    jobs = []
+    for name in sorted(os.listdir(os.path.join(ROOT_DIR, IMAGE_DIR))):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        path = os.path.normpath(f"{IMAGE_DIR}/{name}")
+        variants = VARIANTS.get(f"{IMAGE_DIR}/{name}", [(None, name.lower().endswith(".png"))])
+        jobs.extend((path, tuple(size) if size else None, alpha) for size, alpha in variants)
+    return jobs
+
+
+def bake(pack_path: str = DEFAULT_PACK_PATH, force: bool = False, workers: Optional[int] = None) -> int:
+    """Rebuild the pack; returns the number of images decoded"""
+    previous = None if force else open_pack(pack_path)
+    hashes = {}
+    blocks: List[Tuple[PackEntry, bytes]] = []
+    pending = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        for path, size, alpha in collect_jobs():
+            if path not in hashes:
+                hashes[path] = file_sha1(asset_path(path))
+            stat = os.stat(asset_path(path))
+            entry = PackEntry(path, size or (0, 0), alpha, size is None, 0, 0,
+                              stat.st_mtime_ns, stat.st_size, hashes[path])
+
+            # Reuse the previous bake when the source content has not changed
+            old = previous.entries.get((path, size, alpha)) if previous else None
+            if old is not None and old.sha1 == entry.sha1:
+                entry.size = old.size
+                blocks.append((entry, previous.pixels(old).tobytes()))
+            else:
+                pending.append((entry, pool.submit(bake_one, path, size, alpha)))
+
+        for entry, future in pending:
+            entry.size, pixels = future.result()
+            blocks.append((entry, pixels))
+
+    if previous is not None:
+        previous.close()
+    write_pack(pack_path, blocks)
+    return len(pending)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="decode every image even if unchanged")
+    parser.add_argument("--workers", type=int, default=None, help="decoder processes (default: CPU count)")
+    parser.add_argument("--output", default=DEFAULT_PACK_PATH, help="archive path")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    decoded = bake(args.output, force=args.force, workers=args.workers)
+    size_mb = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"Baked {args.output} ({size_mb:.1f} MB, {decoded} images decoded) in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
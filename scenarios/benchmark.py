@@ -0,0 +1,243 @@
+"""Headless frame-time benchmark: run every scene on scripted input and time its frames.
+
+    python scenarios/benchmark.py [--frames N] [--scene NAME ...] [--output results.json]
+                                  [--baseline FILE] [--save-baseline] [--tolerance 0.25]
+
+Scenes run under SDL's dummy video driver with a fixed-step clock, so a run
+needs no display and simulates the same steps on every machine. Each scene
+reports FPS, p50/p95/p99 frame times and the split between event handling,
+update, draw and present. With a stored baseline (see --save-baseline) the
+run exits non-zero when a scene got slower than the baseline allows.
+"""
+import argparse
+import importlib
+import json
+import math
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from engine.assets import ROOT_DIR
+from engine.display import SCREEN_SIZE, init_display
+from engine.input import Script, ScriptedInput, click, hold, tap
+from engine.loop import FixedClock
+from engine.progress import ProgressStore
+from engine.scenes import SceneManager
+
+DEFAULT_FRAMES = 600  # Ten seconds of play at 60 FPS
+WARMUP_FRAMES = 30  # Run but not measured: first-use loads and cache fills
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, "benchmark_baseline.json")
+TOLERANCE = 0.25  # Allowed slowdown against the baseline, as a fraction
+NOISE_FLOOR_MS = 0.25  # Differences smaller than this are never a regression
+COMPARED_METRICS = ("mean_ms", "p95_ms")
+PHASES = ("events", "update", "draw", "present")
+
+
+# Scripted play for each scene, in frames at 60 FPS
+
+def main_menu_script() -> Script:
+    # Walk right past all three doors, back, and right again; never press SPACE
+    return hold(0, 150, pygame.K_RIGHT) + hold(180, 300, pygame.K_LEFT) + hold(330, 600, pygame.K_RIGHT)
+
+
+def tutorial_script() -> Script:
+    # Walk up to the first law NPC, read its panel, then scroll along the level
+    return (hold(0, 30, pygame.K_UP) + hold(0, 30, pygame.K_RIGHT) + tap(35, pygame.K_SPACE)
+            + tap(90, pygame.K_SPACE) + hold(100, 500, pygame.K_RIGHT) + hold(250, 280, pygame.K_DOWN))
+
+
+def quiz_script() -> Script:
+    # Click YES then NO on every question (only the right answer counts), then continue
+    script = []
+    for i in range(5):
+        frame = 20 + 40 * i
+        script += click(frame, (200, 525)) + click(frame + 10, (600, 525)) + tap(frame + 20, pygame.K_SPACE)
+    return script
+
+
+def office_script() -> Script:
+    # Walk to the nearest document, open and close it, then wander the office
+    return (hold(0, 70, pygame.K_LEFT) + tap(75, pygame.K_SPACE) + tap(130, pygame.K_SPACE)
+            + hold(140, 200, pygame.K_UP) + hold(200, 400, pygame.K_RIGHT) + hold(400, 450, pygame.K_DOWN))
+
+
+def boss_office_script() -> Script:
+    return hold(0, 120, pygame.K_RIGHT) + hold(120, 200, pygame.K_DOWN) + hold(200, 320, pygame.K_LEFT)
+
+
+def police_script() -> Script:
+    # Drive into the police car and answer its dialogue, then off the left edge into the pedestrian
+    return (hold(0, 60, pygame.K_LEFT) + tap(90, pygame.K_SPACE) + tap(100, pygame.K_1)
+            + hold(410, 560, pygame.K_LEFT) + tap(600, pygame.K_SPACE) + tap(610, pygame.K_2)
+            + hold(920, 980, pygame.K_UP) + hold(980, 1100, pygame.K_RIGHT))
+
+
+# Scene name -> (module, scene class, script)
+SCENES: Dict[str, Tuple[str, str, Callable[[], Script]]] = {
+    "main_menu": ("main_menu", "MainMenuScene", main_menu_script),
+    "tutorial": ("tutorial", "TutorialScene", tutorial_script),
+    "tutorial_quiz": ("tutorial", "TutorialQuizScene", quiz_script),
+    "office": ("office", "OfficeScene", office_script),
+    "boss_office": ("office", "BossOfficeScene", boss_office_script),
+    "office_quiz": ("office", "OfficeQuizScene", quiz_script),
+    "police": ("police", "PoliceScene", police_script),
+}
+
+
+class TimedSceneManager(SceneManager):
+    """SceneManager that records how long each phase of every frame took"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.samples: List[Tuple[float, float, float, float]] = []  # Seconds per phase, one row per frame
+
+    def frame(self):
+        updates = self.clock.tick()
+        start = time.perf_counter()
+        if not self.dispatch_events():
+            return
+        events_done = time.perf_counter()
+        self.update(updates)
+        update_done = time.perf_counter()
+        self.draw()
+        draw_done = time.perf_counter()
+        self.present()
+        present_done = time.perf_counter()
+        self.samples.append((events_done - start, update_done - events_done,
+                             draw_done - update_done, present_done - draw_done))
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(samples: List[Tuple[float, float, float, float]]) -> Dict:
+    frame_ms = sorted(sum(row) * 1000 for row in samples)
+    total_ms = sum(frame_ms)
+    phase_ms = [sum(row[i] for row in samples) * 1000 for i in range(len(PHASES))]
+    return {
+        "frames": len(frame_ms),
+        "fps": round(len(frame_ms) / (total_ms / 1000), 1) if total_ms else 0.0,
+        "mean_ms": round(total_ms / len(frame_ms), 4),
+        "p50_ms": round(percentile(frame_ms, 50), 4),
+        "p95_ms": round(percentile(frame_ms, 95), 4),
+        "p99_ms": round(percentile(frame_ms, 99), 4),
+        "max_ms": round(frame_ms[-1], 4),
+        "phases_ms": {phase: round(ms / len(frame_ms), 4) for phase, ms in zip(PHASES, phase_ms)},
+        "phase_share": {phase: round(ms / total_ms, 3) if total_ms else 0.0 for phase, ms in zip(PHASES, phase_ms)},
+    }
+
+
+def run_scene(name: str, frames: int, warmup: int = WARMUP_FRAMES) -> Dict:
+    """Drive one scene through its script and summarize the measured frames"""
+    module_name, class_name, script = SCENES[name]
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+    # Scripted answers are not a learner's: keep them out of the progress database
+    progress = ProgressStore(":memory:")
+    manager = TimedSceneManager(clock=FixedClock(), input=ScriptedInput(script()), async_loading=False,
+                                progress=progress)
+    manager.start(scene_class())
+    for _ in range(warmup + frames):
+        if not (manager.running and manager.stack):
+            break  # The scene finished (e.g. the quiz returns to the menu)
+        manager.frame()
+    progress.close()
+    measured = manager.samples[warmup:]
+    if not measured:
+        raise RuntimeError(f"{name}: scene ended before any frame was measured")
+    return summarize(measured)
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float = TOLERANCE,
+            metrics: Tuple[str, ...] = COMPARED_METRICS) -> List[str]:
+    """Regressions of `results` against `baseline`, one message per slower metric"""
+    regressions = []
+    for name, current in results["scenes"].items():
+        previous = baseline.get("scenes", {}).get(name)
+        if previous is None:
+            continue
+        for metric in metrics:
+            allowed = previous[metric] * (1 + tolerance) + NOISE_FLOOR_MS
+            if current[metric] > allowed:
+                regressions.append(f"{name} {metric}: {current[metric]:.3f} ms, baseline {previous[metric]:.3f} ms "
+                                   f"(+{(current[metric] / previous[metric] - 1) * 100:.0f}%)")
+    return regressions
+
+
+def format_row(name: str, stats: Dict) -> str:
+    shares = "  ".join(f"{phase} {stats['phase_share'][phase] * 100:4.1f}%" for phase in PHASES)
+    return (f"{name:<14} {stats['fps']:8.0f} fps  p50 {stats['p50_ms']:6.2f}  p95 {stats['p95_ms']:6.2f}  "
+            f"p99 {stats['p99_ms']:6.2f} ms  |  {shares}")
+
+
+def load_json(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path: str, data: Dict):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def init_headless(size: Tuple[int, int] = SCREEN_SIZE):
+    """Open the window on SDL's dummy drivers unless the caller picked real ones"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    init_display(size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="measured frames per scene")
+    parser.add_argument("--scene", action="append", choices=sorted(SCENES), help="scene to run (default: all)")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    init_headless()
+
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frames": args.frames,
+        "scenes": {},
+    }
+    for name in args.scene or SCENES:
+        results["scenes"][name] = stats = run_scene(name, args.frames)
+        print(format_row(name, stats))
+    pygame.quit()
+
+    if args.output:
+        write_json(args.output, results)
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f"Saved baseline {args.baseline}")
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if regressions:
+        return 1
+    print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
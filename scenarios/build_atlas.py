@@ -0,0 +1,38 @@
+"""Pack the twelve player frames into images/player_atlas.png and its index.
+
+    python scenarios/build_atlas.py
+
+Run again (and re-bake the asset pack) after editing any look_*/walk_* image.
+"""
+import json
+import os
+import sys
+
+import pygame
+
+from engine.assets import asset_path
+from engine.sprites import FRAME_SIZE, PLAYER_ATLAS_INDEX, PLAYER_ATLAS_PATH, PLAYER_FRAMES, build_atlas
+
+
+def main():
+    frames = {}
+    for name, path in PLAYER_FRAMES.items():
+        surface = pygame.image.load(asset_path(path))
+        if surface.get_size() != (FRAME_SIZE, FRAME_SIZE):
+            sys.exit(f"{path} is {surface.get_size()}, expected {FRAME_SIZE}x{FRAME_SIZE}")
+        # Per-pixel alpha copy so palette colorkeys become real transparency
+        frame = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        frame.blit(surface, (0, 0))
+        frames[name] = frame
+
+    atlas, rects = build_atlas(frames)
+    pygame.image.save(atlas, asset_path(PLAYER_ATLAS_PATH))
+    # One frame per line keeps the index readable in diffs
+    frame_lines = ",\n".join(f"    {json.dumps(name)}: {json.dumps(list(rect))}" for name, rect in sorted(rects.items()))
+    with open(asset_path(PLAYER_ATLAS_INDEX), "w") as f:
+        f.write(f'{{\n  "size": {json.dumps(list(atlas.get_size()))},\n  "frames": {{\n{frame_lines}\n  }}\n}}\n')
+    print(f"Packed {len(rects)} frames into {PLAYER_ATLAS_PATH} ({atlas.get_width()}x{atlas.get_height()})")
+
+
+if __name__ == "__main__":
+    main()
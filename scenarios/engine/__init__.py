@@ -0,0 +1 @@
+"""Shared engine pieces used by every scenario (loop timing, rendering, assets)."""
@@ -0,0 +1,175 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+from engine.assets import ROOT_DIR, AssetKey, asset_path
+
+# Archive layout:
+#   header  MAGIC | version | entry count | data start
+#   index   per entry: path length | path (utf-8) | ENTRY fields
+#   data    raw BGRA pixel blocks, each aligned to BLOCK_ALIGN bytes
+MAGIC = b"YYCPACK\0"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQ")
+PATH_LEN = struct.Struct("<H")
+# width, height, flags, offset, length, source mtime_ns, source size, source sha1
+ENTRY = struct.Struct("<HHB3xQQqQ20s")
+FLAG_ALPHA = 1
+FLAG_NATIVE = 2  # Baked at the file's own size; also answers requests with size=None
+BLOCK_ALIGN = 64
+PIXEL_FORMAT = "BGRA"  # Byte order of 32-bit ARGB display surfaces on little-endian machines
+
+DEFAULT_PACK_PATH = os.path.join(ROOT_DIR, "images", "assets.pack")
+
+
+class PackEntry:
+    __slots__ = ("path", "size", "alpha", "native", "offset", "length", "mtime_ns", "file_size", "sha1")
+
+    def __init__(self, path: str, size: Tuple[int, int], alpha: bool, native: bool, offset: int, length: int,
+                 mtime_ns: int, file_size: int, sha1: bytes):
+        self.path = path
+        self.size = size
+        self.alpha = alpha
+        self.native = native
+        self.offset = offset
+        self.length = length
+        self.mtime_ns = mtime_ns
+        self.file_size = file_size
+        self.sha1 = sha1
+
+    @property
+    def key(self) -> AssetKey:
+        return (self.path, self.size, self.alpha)
+
+    @property
+    def flags(self) -> int:
+        return (FLAG_ALPHA if self.alpha else 0) | (FLAG_NATIVE if self.native else 0)
+
+
+def file_sha1(path: str) -> bytes:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def read_index(f) -> Tuple[Dict[AssetKey, PackEntry], int]:
+    """Parse the header and index table from an open archive file"""
+    magic, version, count, data_start = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a version %d asset pack" % VERSION)
+    entries = {}
+    for _ in range(count):
+        (path_len,) = PATH_LEN.unpack(f.read(PATH_LEN.size))
+        path = f.read(path_len).decode("utf-8")
+        width, height, flags, offset, length, mtime_ns, file_size, sha1 = ENTRY.unpack(f.read(ENTRY.size))
+        entry = PackEntry(path, (width, height), bool(flags & FLAG_ALPHA), bool(flags & FLAG_NATIVE),
+                          offset, length, mtime_ns, file_size, sha1)
+        entries[entry.key] = entry
+        if entry.native:
+            entries[(path, None, entry.alpha)] = entry
+    return entries, data_start
+
+
+def write_pack(path: str, blocks: Iterable[Tuple[PackEntry, bytes]]):
+    """Write an archive atomically; entry offsets are assigned here"""
+    blocks = list(blocks)
+    index_size = sum(PATH_LEN.size + len(e.path.encode("utf-8")) + ENTRY.size for e, _ in blocks)
+    data_start = _align(HEADER.size + index_size)
+
+    offset = data_start
+    for entry, pixels in blocks:
+        entry.offset = offset
+        entry.length = len(pixels)
+        offset = _align(offset + len(pixels))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(blocks), data_start))
+        for entry, _ in blocks:
+            encoded = entry.path.encode("utf-8")
+            f.write(PATH_LEN.pack(len(encoded)))
+            f.write(encoded)
+            f.write(ENTRY.pack(entry.size[0], entry.size[1], entry.flags, entry.offset, entry.length,
+                               entry.mtime_ns, entry.file_size, entry.sha1))
+        for entry, pixels in blocks:
+            f.seek(entry.offset)
+            f.write(pixels)
+    os.replace(tmp_path, path)
+
+
+def _align(offset: int) -> int:
+    return (offset + BLOCK_ALIGN - 1) // BLOCK_ALIGN * BLOCK_ALIGN
+
+
+class AssetPack:
+    """Memory-mapped archive of pre-scaled images in display byte order.
+
+    Surfaces are built straight from the mapped pixels with
+    pygame.image.frombuffer, so nothing is decoded at runtime. Entries whose
+    source image changed since the bake (mtime, then hash) are reported stale.
+    """
+
+    def __init__(self, path: str = DEFAULT_PACK_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        self.entries, self.data_start = read_index(self._file)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._fresh: Dict[str, bool] = {}  # Source path -> still matches the baked copy
+        self.hits = 0
+        self.stale = 0
+        self._stats_lock = threading.Lock()  # surface() also runs on engine.loader workers
+
+    def is_fresh(self, entry: PackEntry) -> bool:
+        fresh = self._fresh.get(entry.path)
+        if fresh is None:
+            try:
+                stat = os.stat(asset_path(entry.path))
+            except OSError:
+                fresh = False
+            else:
+                if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.file_size:
+                    fresh = True
+                else:
+                    # Touched but maybe unchanged: fall back to comparing content hashes
+                    fresh = stat.st_size == entry.file_size and file_sha1(asset_path(entry.path)) == entry.sha1
+            self._fresh[entry.path] = fresh
+        return fresh
+
+    def surface(self, key: AssetKey) -> Optional[pygame.Surface]:
+        """Surface for a (path, size, alpha) key, or None when missing or stale"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if not self.is_fresh(entry):
+            with self._stats_lock:
+                self.stale += 1
+            return None
+        with self._stats_lock:
+            self.hits += 1
+        return pygame.image.frombuffer(self.pixels(entry), entry.size, PIXEL_FORMAT)
+
+    def pixels(self, entry: PackEntry) -> memoryview:
+        """Zero-copy view of an entry's pixel block"""
+        return memoryview(self._map)[entry.offset:entry.offset + entry.length]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def open_pack(path: str = DEFAULT_PACK_PATH) -> Optional[AssetPack]:
+    """Open an archive if one has been baked and is readable"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Ignoring asset pack {path}: {e}")
+        return None
@@ -0,0 +1,111 @@
+import os
+import threading
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+from engine.cache import surface_bytes
+
+# Asset paths are relative to the repository root, whatever the working directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+AssetKey = Tuple[str, Optional[Tuple[int, int]], bool]
+
+
+def asset_path(path: str) -> str:
+    """Absolute path of an asset given relative to the repository root"""
+    return path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+
+
+class AssetManager:
+    """Process-wide image cache keyed by (path, size, alpha).
+
+    Each distinct key is decoded, scaled and converted to the display format
+    exactly once; every later request returns the same surface. Loading is
+    split in two so engine.loader can decode on worker threads: decode() is
+    thread-safe once the pack has been opened, finish() runs on the main thread.
+    """
+
+    def __init__(self, use_pack: bool = True):
+        self._images: Dict[AssetKey, pygame.Surface] = {}
+        self._pack = None  # Baked archive, opened on first load (see bake_assets.py)
+        self._pack_checked = not use_pack
+        self.loads = 0  # Decodes performed (counted under _loads_lock: loader workers decode too)
+        self._loads_lock = threading.Lock()
+        self.requests = 0  # Lookups served, including cache hits
+
+    @staticmethod
+    def key(path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = False) -> AssetKey:
+        return os.path.normpath(path), tuple(size) if size else None, alpha
+
+    def image(self, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = False) -> pygame.Surface:
+        """Load (once) and return an image, optionally scaled to size"""
+        key = self.key(path, size, alpha)
+        self.requests += 1
+        surface = self._images.get(key)
+        if surface is None:
+            surface = self._load(*key)
+            self._images[key] = surface
+        return surface
+
+    def cached(self, key: AssetKey) -> bool:
+        return key in self._images
+
+    def put(self, key: AssetKey, surface: pygame.Surface):
+        """Cache a surface loaded elsewhere (already through finish())"""
+        self._images[key] = surface
+
+    @property
+    def pack(self):
+        if not self._pack_checked:
+            from engine.asset_pack import open_pack
+            self._pack = open_pack()
+            self._pack_checked = True
+        return self._pack
+
+    def _load(self, path: str, size: Optional[Tuple[int, int]], alpha: bool) -> pygame.Surface:
+        return self.finish(self.decode(path, size, alpha), alpha)
+
+    def decode(self, path: str, size: Optional[Tuple[int, int]], alpha: bool) -> pygame.Surface:
+        """Pixels of an asset at its final size, still in the file's format"""
+        # Pre-scaled pixels from the baked archive skip decoding and scaling entirely
+        surface = self.pack.surface((path, size, alpha)) if self.pack is not None else None
+        if surface is not None:
+            # A window means finish() converts (copies) it; otherwise detach from the mapped file
+            return surface if pygame.display.get_surface() is not None else surface.copy()
+
+        surface = pygame.image.load(asset_path(path))
+        with self._loads_lock:
+            self.loads += 1
+        if size and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    @staticmethod
+    def finish(surface: pygame.Surface, alpha: bool) -> pygame.Surface:
+        """Convert decoded pixels to the display format (main thread only)"""
+        # Conversion needs a display; tools running without a window keep the file format
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        return surface
+
+    def memory_report(self) -> List[Tuple[AssetKey, int]]:
+        """Bytes of pixel memory held by each cached asset, largest first"""
+        report = [(key, surface_bytes(surface)) for key, surface in self._images.items()]
+        report.sort(key=lambda item: item[1], reverse=True)
+        return report
+
+    def memory_used(self) -> int:
+        return sum(size for _, size in self.memory_report())
+
+    def unload(self, path: str):
+        """Drop every cached variant of an asset"""
+        path = os.path.normpath(path)
+        for key in [key for key in self._images if key[0] == path]:
+            del self._images[key]
+
+    def clear(self):
+        self._images.clear()
+
+
+# Shared by every scene in the process
+assets = AssetManager()
@@ -0,0 +1,72 @@
+import pygame
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory held by a surface"""
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """Least-recently-used cache bounded by entry count and by total bytes.
+
+    Values can be anything (a surface, a list of line surfaces, ...); the caller
+    passes the byte size when storing so the cache never has to inspect them.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int = 4096):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, size: int):
+        if key in self._entries:
+            self.discard(key)
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.bytes_used += size
+        # Evict from the cold end until we are back under both limits
+        while self._entries and (self.bytes_used > self.max_bytes or len(self._entries) > self.max_entries):
+            old_key, _ = self._entries.popitem(last=False)
+            self.bytes_used -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def discard(self, key: Hashable):
+        if key in self._entries:
+            del self._entries[key]
+            self.bytes_used -= self._sizes.pop(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes_used = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,183 @@
+import json
+import marshal
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from engine.assets import ROOT_DIR
+
+# Law and scenario packs live in data/content/<name>.json; each level loads its
+# own pack the first time it is entered. A validated pack is compiled to
+# <name>.cache next to its source, which later runs read instead of parsing
+# and validating the JSON again. The cache is rebuilt when the source's mtime
+# or size changes, or when CACHE_VERSION is bumped.
+CONTENT_DIR = os.path.join(ROOT_DIR, "data", "content")
+SOURCE_EXT = ".json"
+CACHE_EXT = ".cache"
+CACHE_MAGIC = "YYCCONTENT"
+CACHE_VERSION = 1
+
+# Field name -> expected type, or a tuple of the allowed string values
+LAW_SCHEMA = {
+    "title": str,
+    "description": str,
+    "details": [str],
+}
+SCENARIO_SCHEMA = {
+    "scenario": str,
+    "question": str,
+    "answer": ("yes", "no"),
+    "explanation": str,
+}
+
+
+class ContentError(ValueError):
+    """A content pack is missing or does not match the schema"""
+
+
+class Law:
+    __slots__ = ("title", "description", "details")
+
+    def __init__(self, title: str, description: str, details: Tuple[str, ...]):
+        self.title = title
+        self.description = description
+        self.details = details
+
+
+class Scenario:
+    __slots__ = ("scenario", "question", "answer", "explanation")
+
+    def __init__(self, scenario: str, question: str, answer: str, explanation: str):
+        self.scenario = scenario
+        self.question = question
+        self.answer = answer
+        self.explanation = explanation
+
+
+class ContentPack:
+    __slots__ = ("name", "laws", "scenarios")
+
+    def __init__(self, name: str, laws: Tuple[Law, ...], scenarios: Tuple[Scenario, ...]):
+        self.name = name
+        self.laws = laws
+        self.scenarios = scenarios
+
+
+def _check_record(record, schema: Dict, where: str) -> Tuple:
+    """Validate one JSON object against a schema; returns its fields in schema order"""
+    if not isinstance(record, dict):
+        raise ContentError(f"{where}: expected an object")
+    unknown = set(record) - set(schema)
+    if unknown:
+        raise ContentError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+    fields = []
+    for field, expected in schema.items():
+        if field not in record:
+            raise ContentError(f"{where}: missing field '{field}'")
+        value = record[field]
+        if isinstance(expected, list):
+            if not isinstance(value, list) or not all(isinstance(item, expected[0]) for item in value):
+                raise ContentError(f"{where}.{field}: expected a list of {expected[0].__name__}")
+            value = tuple(value)
+        elif isinstance(expected, tuple):
+            if value not in expected:
+                raise ContentError(f"{where}.{field}: expected one of {', '.join(expected)}")
+        elif not isinstance(value, expected):
+            raise ContentError(f"{where}.{field}: expected {expected.__name__}")
+        fields.append(value)
+    return tuple(fields)
+
+
+def validate(data, name: str) -> Tuple[List[Tuple], List[Tuple]]:
+    """Check a parsed pack; returns (law rows, scenario rows) as plain tuples"""
+    if not isinstance(data, dict) or set(data) != {"laws", "scenarios"}:
+        raise ContentError(f"{name}: expected an object with 'laws' and 'scenarios'")
+    rows = []
+    for section, schema in (("laws", LAW_SCHEMA), ("scenarios", SCENARIO_SCHEMA)):
+        if not isinstance(data[section], list):
+            raise ContentError(f"{name}.{section}: expected a list")
+        rows.append([_check_record(record, schema, f"{name}.{section}[{i}]")
+                     for i, record in enumerate(data[section])])
+    return rows[0], rows[1]
+
+
+def _intern(row: Tuple) -> Tuple:
+    return tuple(tuple(sys.intern(s) for s in field) if isinstance(field, tuple) else sys.intern(field)
+                 for field in row)
+
+
+def source_path(name: str, directory: str = CONTENT_DIR) -> str:
+    return os.path.join(directory, name + SOURCE_EXT)
+
+
+def pack_names(directory: str = CONTENT_DIR) -> List[str]:
+    """Names of all packs shipped in the content directory"""
+    return sorted(f[:-len(SOURCE_EXT)] for f in os.listdir(directory) if f.endswith(SOURCE_EXT))
+
+
+def _read_cache(path: str, mtime_ns: int, size: int) -> Optional[Tuple[List[Tuple], List[Tuple]]]:
+    """Rows from a compiled cache, or None if it is missing, stale or unreadable"""
+    try:
+        with open(path, "rb") as f:
+            magic, version, cached_mtime, cached_size, laws, scenarios = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or cached_mtime != mtime_ns or cached_size != size:
+        return None
+    return laws, scenarios
+
+
+def _write_cache(path: str, mtime_ns: int, size: int, laws: List[Tuple], scenarios: List[Tuple]):
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump((CACHE_MAGIC, CACHE_VERSION, mtime_ns, size, laws, scenarios), f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # A read-only install still works, it just parses the JSON every run
+        print(f"Could not write content cache {path}: {e}")
+
+
+def compile_pack(name: str, directory: str = CONTENT_DIR, force: bool = False) -> ContentPack:
+    """Load a pack from its compiled cache, (re)building the cache from JSON when stale"""
+    path = source_path(name, directory)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        raise ContentError(f"no content pack named '{name}' in {directory}") from None
+    cache_path = os.path.join(directory, name + CACHE_EXT)
+    rows = None if force else _read_cache(cache_path, stat.st_mtime_ns, stat.st_size)
+    if rows is None:
+        with open(path, encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise ContentError(f"{name}: {e}") from None
+        rows = validate(data, name)
+        _write_cache(cache_path, stat.st_mtime_ns, stat.st_size, *rows)
+    laws, scenarios = rows
+    return ContentPack(name,
+                       tuple(Law(*_intern(row)) for row in laws),
+                       tuple(Scenario(*_intern(row)) for row in scenarios))
+
+
+_packs: Dict[str, ContentPack] = {}
+
+
+def load_pack(name: str) -> ContentPack:
+    """Content for one level, read on first use and shared afterwards"""
+    pack = _packs.get(name)
+    if pack is None:
+        pack = _packs[name] = compile_pack(name)
+    return pack
+
+
+def clear_packs():
+    _packs.clear()
+
+
+if __name__ == "__main__":
+    # Validate every pack and refresh its compiled cache (cd scenarios && python -m engine.content)
+    for pack_name in pack_names():
+        pack = compile_pack(pack_name, force=True)
+        print(f"{pack_name}: {len(pack.laws)} laws, {len(pack.scenarios)} scenarios")
@@ -0,0 +1,78 @@
+"""Coroutine-style cutscenes that run inside the frame loop.
+
+A cutscene is a generator. Each `yield` hands the runner a wait condition and
+suspends the script until it is met, while the scene keeps handling events
+and drawing every frame:
+
+    def stop(self):
+        self.overlay = (exclamation, pos)
+        yield Wait(0.5)
+        self.overlay = (dialogue_panel(text), (0, 450))
+        key = yield WaitKey(pygame.K_1, pygame.K_2)  # The key pressed is sent back
+        ...
+
+The scene owns a Cutscene, passes it events and fixed update steps, and
+drops it once it is finished.
+"""
+from typing import Generator, Optional, Union
+
+import pygame
+
+
+class Wait:
+    """Resume after `seconds` of simulated time"""
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+
+class WaitKey:
+    """Resume on a KEYDOWN of one of `keys`; the yield evaluates to that key"""
+    __slots__ = ("keys",)
+
+    def __init__(self, *keys: int):
+        self.keys = keys
+
+
+Condition = Union[Wait, WaitKey]
+Script = Generator[Condition, Optional[int], None]
+
+
+class Cutscene:
+    """Steps a cutscene script as its wait conditions are met"""
+
+    def __init__(self, script: Script):
+        self.script = script
+        self.waiting: Optional[Condition] = None
+        self.elapsed = 0.0  # Seconds spent on the current Wait
+        self.finished = False
+        self._advance(None)  # Run up to the first wait
+
+    def _advance(self, value: Optional[int]):
+        self.elapsed = 0.0
+        try:
+            self.waiting = self.script.send(value)
+        except StopIteration:
+            self.waiting = None
+            self.finished = True
+
+    @property
+    def idle(self) -> bool:
+        """True while only a key press can advance the script"""
+        return isinstance(self.waiting, WaitKey)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Offer one event to the cutscene; True if it was consumed"""
+        waiting = self.waiting
+        if isinstance(waiting, WaitKey) and event.type == pygame.KEYDOWN and event.key in waiting.keys:
+            self._advance(event.key)
+            return True
+        return False
+
+    def update(self, dt: float):
+        waiting = self.waiting
+        if isinstance(waiting, Wait):
+            self.elapsed += dt
+            if self.elapsed >= waiting.seconds:
+                self._advance(None)
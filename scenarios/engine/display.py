@@ -0,0 +1,175 @@
+"""The game window and the fixed-size logical surface every scene draws to.
+
+Scenes, assets and layouts only know SCREEN_SIZE. Each frame is drawn into a
+logical surface of that size and presented in one scale pass: by the largest
+whole factor that fits the window, centered between black bars, so pixels
+stay square and sharp on a 1080p projector. A window smaller than the logical
+size (a netbook) gets the largest fractional fit instead. Resizing the window
+only changes the present step; mouse positions are mapped back to logical
+coordinates by InputSource.
+
+Measure the present step at a few window sizes with:
+
+    cd scenarios && python -m engine.display
+"""
+import time
+from typing import Optional, Sequence, Tuple
+
+import pygame
+
+SCREEN_SIZE = (800, 600)  # Logical size: every scene is laid out for it, whatever the window size
+LETTERBOX_COLOR = (0, 0, 0)
+DESKTOP_MARGIN = 0.9  # Share of the desktop the initial window may cover
+
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+def fit_window(size: Tuple[int, int], desktop: Tuple[int, int]) -> Tuple[int, int]:
+    """Initial window size: the logical size times the largest whole factor that fits the desktop"""
+    room = (desktop[0] * DESKTOP_MARGIN, desktop[1] * DESKTOP_MARGIN)
+    scale = min(room[0] / size[0], room[1] / size[1])
+    scale = max(1, int(scale)) if scale >= 1 else scale
+    return round(size[0] * scale), round(size[1] * scale)
+
+
+class Display:
+    """Window plus logical surface; present() scales the latter into the former"""
+
+    def __init__(self, size: Tuple[int, int] = SCREEN_SIZE, window_size: Optional[Tuple[int, int]] = None):
+        self.size = size
+        if window_size is None:
+            desktops = pygame.display.get_desktop_sizes()
+            window_size = fit_window(size, desktops[0]) if desktops else size
+        self.window = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        self.surface = pygame.Surface(size).convert()  # Same pixel format as the window
+        self.scale = 1.0
+        self.rect = pygame.Rect((0, 0), size)  # Where the logical surface lands in the window
+        self._window_size = (0, 0)
+        self.layout()
+
+        # Statistics
+        self.layouts = 0
+
+    def layout(self):
+        """Fit the logical surface to the current window size and repaint the bars"""
+        window_width, window_height = self._window_size = self.window.get_size()
+        width, height = self.size
+        scale = min(window_width / width, window_height / height)
+        self.scale = float(int(scale)) if scale >= 1 else scale  # Whole factors whenever the window allows
+        self.rect = pygame.Rect(0, 0, round(width * self.scale), round(height * self.scale))
+        self.rect.center = (window_width // 2, window_height // 2)
+        self.window.fill(LETTERBOX_COLOR)
+
+    @property
+    def integer_scale(self) -> bool:
+        return self.scale >= 1
+
+    def present(self, rects: Optional[Sequence[pygame.Rect]] = None):
+        """Show the logical frame; `rects` limits the scale pass and the update to those regions"""
+        if self.window.get_size() != self._window_size:
+            self.layout()
+            self.layouts += 1
+            rects = None
+
+        if rects is None or not self.integer_scale:
+            target = self.window.subsurface(self.rect)
+            if self.scale == 1:
+                target.blit(self.surface, (0, 0))
+            elif self.integer_scale:
+                pygame.transform.scale(self.surface, self.rect.size, target)
+            else:
+                pygame.transform.smoothscale(self.surface, self.rect.size, target)
+            pygame.display.flip()
+            return
+
+        # Whole factors map every logical rect onto an exact window rect
+        scale = int(self.scale)
+        left, top = self.rect.topleft
+        updated = []
+        for rect in rects:
+            dest = pygame.Rect(left + rect.x * scale, top + rect.y * scale, rect.width * scale, rect.height * scale)
+            if scale == 1:
+                self.window.blit(self.surface, dest, rect)
+            else:
+                pygame.transform.scale(self.surface.subsurface(rect), dest.size, self.window.subsurface(dest))
+            updated.append(dest)
+        pygame.display.update(updated)
+
+    def to_logical(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """Window coordinates to logical ones (outside the logical area inside the bars)"""
+        return int((pos[0] - self.rect.x) // self.scale), int((pos[1] - self.rect.y) // self.scale)
+
+    def map_event(self, event: pygame.event.Event) -> pygame.event.Event:
+        """A mouse event with its position in logical coordinates; other events as they are"""
+        if event.type not in MOUSE_EVENTS or (self.scale == 1 and self.rect.topleft == (0, 0)):
+            return event
+        values = dict(event.dict, pos=self.to_logical(event.pos))
+        if "rel" in values:
+            values["rel"] = (int(event.rel[0] / self.scale), int(event.rel[1] / self.scale))
+        return pygame.event.Event(event.type, values)
+
+
+_display: Optional[Display] = None
+
+
+def init_display(size=SCREEN_SIZE, window_size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+    """Initialize pygame and open the game window, once; returns the logical surface to draw on.
+
+    Nothing opens a window at import time: SceneManager calls this when it is
+    created, and tools can call it first to pick their own SDL drivers.
+    """
+    global _display
+    if _display is None or pygame.display.get_surface() is None:
+        pygame.init()
+        _display = Display(size, window_size)
+    return _display.surface
+
+
+def get_display() -> Optional[Display]:
+    return _display if pygame.display.get_surface() is not None else None
+
+
+def present(rects: Optional[Sequence[pygame.Rect]] = None):
+    """Put the logical frame (or the given regions of it) on screen"""
+    display = get_display()
+    if display is not None:
+        display.present(rects)
+    elif rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+
+
+def map_event(event: pygame.event.Event) -> pygame.event.Event:
+    display = get_display()
+    return display.map_event(event) if display is not None else event
+
+
+def _benchmark(window_sizes: Sequence[Tuple[int, int]] = ((800, 600), (1920, 1080), (1600, 1200), (1024, 576)),
+               frames: int = 120):
+    init_display()
+    display = get_display()
+    surface = display.surface
+    for i in range(0, SCREEN_SIZE[1], 20):
+        surface.fill((i % 255, 80, 160), (0, i, SCREEN_SIZE[0], 10))
+    dirty = [pygame.Rect(100, 100, 75, 75), pygame.Rect(300, 40, 200, 40)]  # A walking player and a HUD line
+
+    print(f"Logical {SCREEN_SIZE[0]}x{SCREEN_SIZE[1]}, present time per frame")
+    for window_size in window_sizes:
+        display.window = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        display.present()  # Lays out for the new size
+        start = time.perf_counter()
+        for _ in range(frames):
+            display.present()
+        full = (time.perf_counter() - start) / frames
+        start = time.perf_counter()
+        for _ in range(frames):
+            display.present(dirty)
+        partial = (time.perf_counter() - start) / frames
+        kind = f"x{int(display.scale)}" if display.integer_scale else f"x{display.scale:.2f} (smooth)"
+        print(f"  {window_size[0]:4d}x{window_size[1]:<4d} {kind:14s} full {full * 1000:6.2f} ms  "
+              f"dirty rects {partial * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    _benchmark()
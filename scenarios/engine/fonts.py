@@ -0,0 +1,61 @@
+import threading
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+# SDL_ttf and FreeType share one library handle that is not thread-safe: every
+# font call in the game, from the main thread or a worker, holds this lock
+FONT_LOCK = threading.RLock()
+
+
+class LockedFont:
+    """pygame Font whose calls into SDL_ttf hold FONT_LOCK"""
+    __slots__ = ("_font",)
+
+    def __init__(self, name: Optional[str], size: int):
+        with FONT_LOCK:
+            self._font = pygame.font.Font(name, size)
+
+    def render(self, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+        with FONT_LOCK:
+            return self._font.render(text, antialias, color, background)
+
+    def size(self, text: str) -> Tuple[int, int]:
+        with FONT_LOCK:
+            return self._font.size(text)
+
+    def metrics(self, text: str) -> List[Optional[Tuple[int, int, int, int, int]]]:
+        with FONT_LOCK:
+            return self._font.metrics(text)
+
+    def get_height(self) -> int:
+        with FONT_LOCK:
+            return self._font.get_height()
+
+    def get_linesize(self) -> int:
+        with FONT_LOCK:
+            return self._font.get_linesize()
+
+    def get_ascent(self) -> int:
+        with FONT_LOCK:
+            return self._font.get_ascent()
+
+    def get_descent(self) -> int:
+        with FONT_LOCK:
+            return self._font.get_descent()
+
+
+_fonts: Dict[Tuple[Optional[str], int], LockedFont] = {}
+
+
+def font(size: int, name: Optional[str] = None) -> LockedFont:
+    """Font of the given size (pygame's default face unless `name` is given), created on first use.
+
+    Call it on the main thread; workers get their fonts handed to them.
+    """
+    key = (name, size)
+    loaded = _fonts.get(key)
+    if loaded is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        loaded = _fonts[key] = LockedFont(name, size)
+    return loaded
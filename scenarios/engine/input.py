@@ -0,0 +1,117 @@
+import pygame
+from typing import Dict, Iterable, List, Set, Tuple
+
+from engine.display import map_event
+
+# A script is a list of (frame, event) pairs; events are delivered at the start
+# of their frame, in order. Held keys follow the KEYDOWN/KEYUP events.
+Script = List[Tuple[int, pygame.event.Event]]
+
+# Keys that move the player; while one is held the scene is animating
+MOVEMENT_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+
+class InputSource:
+    """Where scenes get their input from: the live pygame event queue and keyboard.
+
+    The SceneManager polls events once per frame through `poll()`, and scenes
+    read held keys with `manager.input.get_pressed()` instead of calling
+    pygame directly, so a scripted source can stand in for the player. Mouse
+    positions come out in logical coordinates, whatever the window size.
+    """
+
+    def __init__(self):
+        self._woken: List[pygame.event.Event] = []  # Event that ended a wait(), not yet polled
+
+    def poll(self) -> List[pygame.event.Event]:
+        events = [map_event(event) for event in self._woken + pygame.event.get()]
+        self._woken = []
+        return events
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep until an event arrives (True) or `timeout` seconds pass (False)"""
+        event = pygame.event.wait(int(timeout * 1000))
+        if event.type == pygame.NOEVENT:
+            return False
+        self._woken.append(event)  # Handed out, in order, by the next poll()
+        return True
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+
+class KeyState:
+    """Read-only stand-in for pygame.key.get_pressed(), indexed by key constant"""
+
+    def __init__(self, held: Iterable[int] = ()):
+        self._held = frozenset(held)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._held
+
+
+def any_held(keys, wanted=MOVEMENT_KEYS) -> bool:
+    """True if any of `wanted` is down in a get_pressed() result"""
+    return any(keys[key] for key in wanted)
+
+
+def track_keys(held: Set[int], events: Iterable[pygame.event.Event]) -> KeyState:
+    """Apply this frame's KEYDOWN/KEYUP events to `held` and return the resulting key state"""
+    for event in events:
+        if event.type == pygame.KEYDOWN:
+            held.add(event.key)
+        elif event.type == pygame.KEYUP:
+            held.discard(event.key)
+    return KeyState(held)
+
+
+class ScriptedInput(InputSource):
+    """Replays a fixed script of events frame by frame, with no window or keyboard.
+
+    The window's own events are still drained each frame so the dummy video
+    driver's queue never fills, but only QUIT is passed through.
+    """
+
+    def __init__(self, script: Script):
+        self.frames: Dict[int, List[pygame.event.Event]] = {}
+        for frame, event in script:
+            self.frames.setdefault(frame, []).append(event)
+        self.frame = 0
+        self.held: Set[int] = set()
+        self.keys = KeyState()
+
+    def poll(self) -> List[pygame.event.Event]:
+        events = [event for event in pygame.event.get() if event.type == pygame.QUIT]
+        events += self.frames.get(self.frame, ())
+        self.keys = track_keys(self.held, events)
+        self.frame += 1
+        return events
+
+    def wait(self, timeout: float) -> bool:
+        return True  # Every scripted frame runs, idle or not
+
+    def get_pressed(self) -> KeyState:
+        return self.keys
+
+
+def key_event(kind: int, key: int) -> pygame.event.Event:
+    return pygame.event.Event(kind, key=key, mod=0, unicode="", scancode=0)
+
+
+def tap(frame: int, key: int) -> Script:
+    """Press and release a key, one frame apart"""
+    return [(frame, key_event(pygame.KEYDOWN, key)), (frame + 1, key_event(pygame.KEYUP, key))]
+
+
+def hold(start: int, end: int, key: int) -> Script:
+    """Hold a key from frame `start` until frame `end`"""
+    return [(start, key_event(pygame.KEYDOWN, key)), (end, key_event(pygame.KEYUP, key))]
+
+
+def click(frame: int, pos: Tuple[int, int]) -> Script:
+    """Move the mouse to `pos` and click the left button there"""
+    return [
+        (frame, pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))),
+        (frame, pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)),
+        (frame + 1, pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)),
+    ]
@@ -0,0 +1,226 @@
+"""Asynchronous image loading behind an animated progress screen.
+
+Scenes list the images they need in preload(). Before such a scene is
+entered, LoadingScene asks an AssetLoader to decode them on a thread pool,
+most urgent first (the background before the props drawn over it), while it
+animates a progress bar. Worker threads only decode and scale; each finished
+image is handed back to the main thread, converted to the display format and
+put in the shared asset cache, so the scene's own assets.image() calls find
+everything ready.
+
+Compare loading the large backgrounds on the main thread and on the pool:
+
+    cd scenarios && python -m engine.loader
+"""
+import heapq
+import math
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import pygame
+
+from engine.assets import AssetKey, AssetManager, assets
+from engine.fonts import font
+from engine.scenes import Scene
+from engine.text import render_line
+
+LOADER_WORKERS = 4
+
+# Progress screen
+BACKGROUND_COLOR = (20, 24, 32)
+BAR_COLOR = (70, 130, 180)
+BAR_TRACK_COLOR = (50, 56, 68)
+TEXT_COLOR = (255, 255, 255)
+BAR_SIZE = (400, 16)
+LOADING_FONT = 36
+DOTS = 8  # Dots circling the spinner
+SPINNER_RADIUS = 18
+SPINNER_SPEED = 1.5  # Turns per second
+DOT_RADIUS = 4
+
+
+class Load:
+    """One image a scene needs: the arguments of assets.image() plus how urgent it is"""
+    __slots__ = ("path", "size", "alpha", "priority")
+
+    def __init__(self, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = False, priority: int = 0):
+        self.path = path
+        self.size = size
+        self.alpha = alpha
+        self.priority = priority  # Lower loads sooner: backgrounds 0, sprites and props after
+
+    @property
+    def key(self) -> AssetKey:
+        return AssetManager.key(self.path, self.size, self.alpha)
+
+
+class AssetLoader:
+    """Decodes images on a thread pool, highest priority first, into an AssetManager.
+
+    request() queues an image; every worker takes the most urgent request
+    still waiting when it becomes free. poll() on the main thread converts the
+    images decoded so far and caches them; a decoding error is raised there.
+    """
+
+    def __init__(self, manager: AssetManager = assets, workers: int = LOADER_WORKERS):
+        self.manager = manager
+        manager.pack  # Opened here, on the main thread, before any worker reads it
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+        self._waiting: List[Tuple[int, int, AssetKey]] = []  # Heap of (priority, order, key)
+        self._lock = threading.Lock()
+        self._decoded: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._requested = set()
+        self.total = 0
+        self.done = 0
+
+    def request(self, load: Load):
+        key = load.key
+        if key in self._requested or self.manager.cached(key):
+            return
+        self._requested.add(key)
+        self.total += 1
+        with self._lock:
+            heapq.heappush(self._waiting, (load.priority, self.total, key))
+        self._executor.submit(self._decode_next)
+
+    def _decode_next(self):
+        # Runs on a worker: whichever request is most urgent now, not the one submitted
+        with self._lock:
+            _, _, key = heapq.heappop(self._waiting)
+        try:
+            self._decoded.put((key, self.manager.decode(*key), None))
+        except Exception as error:
+            self._decoded.put((key, None, error))
+
+    def poll(self, wait: bool = False) -> int:
+        """Convert and cache the images decoded since the last poll; returns how many.
+
+        With wait=True, block until every requested image is in.
+        """
+        finished = 0
+        while not self.finished:
+            try:
+                key, surface, error = self._decoded.get(block=wait)
+            except queue.Empty:
+                break
+            if error is not None:
+                raise error
+            self.manager.put(key, self.manager.finish(surface, key[2]))
+            self.done += 1
+            finished += 1
+        return finished
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def finished(self) -> bool:
+        return self.done == self.total
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LoadingScene(Scene):
+    """Progress screen that loads a scene's preload() images, then replaces itself with the scene"""
+
+    def __init__(self, scene: Scene, loads: Sequence[Load]):
+        super().__init__()
+        self.scene = scene
+        self.loads = loads
+        self.caption = scene.caption
+        self.time = 0.0
+
+    def enter(self):
+        self.loader = AssetLoader()
+        for load in self.loads:
+            self.loader.request(load)
+        # Spinner dots, the leading one brightest
+        self.dots = []
+        for i in range(DOTS):
+            shade = 255 - i * (200 // DOTS)
+            dot = pygame.Surface((2 * DOT_RADIUS, 2 * DOT_RADIUS), pygame.SRCALPHA)
+            pygame.draw.circle(dot, (shade, shade, shade), (DOT_RADIUS, DOT_RADIUS), DOT_RADIUS)
+            self.dots.append(dot)
+
+    def exit(self):
+        self.loader.close()
+
+    def is_idle(self) -> bool:
+        return False  # The spinner turns until loading is done
+
+    def update(self, dt: float):
+        self.time += dt
+        # Recordings and benchmarks need the same frames every run: load everything in the first step
+        self.loader.poll(wait=not self.manager.async_loading)
+        if self.loader.finished:
+            self.manager.replace(self.scene)
+
+    def draw(self, screen: pygame.Surface):
+        screen.clear(BACKGROUND_COLOR)
+        width, height = screen.get_size()
+        center_x, center_y = width // 2, height // 2
+
+        text = render_line("Loading...", font(LOADING_FONT), TEXT_COLOR)
+        screen.blit(text, (center_x - text.get_width() // 2, center_y - 80))
+
+        # Dots circling above the bar
+        turn = self.time * SPINNER_SPEED
+        for i, dot in enumerate(self.dots):
+            angle = 2 * math.pi * (turn - i / DOTS)
+            screen.blit(dot, (center_x + SPINNER_RADIUS * math.cos(angle) - DOT_RADIUS,
+                              center_y - 20 + SPINNER_RADIUS * math.sin(angle) - DOT_RADIUS))
+
+        bar = pygame.Rect(0, 0, *BAR_SIZE)
+        bar.center = (center_x, center_y + 30)
+        screen.fill(BAR_TRACK_COLOR, bar)
+        screen.fill(BAR_COLOR, (bar.x, bar.y, round(bar.width * self.loader.progress), bar.height))
+
+
+def loading_screen(scene: Scene, manager: AssetManager = assets) -> Scene:
+    """`scene` itself if its preload() images are all cached, else a LoadingScene leading to it"""
+    loads = [load for load in scene.preload() if not manager.cached(load.key)]
+    return LoadingScene(scene, loads) if loads else scene
+
+
+def _benchmark(paths: Sequence[str] = ("images/office.png", "images/office-boss.png", "images/tut.png",
+                                       "images/main_menu_background2.jpg"), size: Tuple[int, int] = (800, 600)):
+    from engine.display import init_display
+
+    init_display()
+    loads = [Load(path, size, priority=i) for i, path in enumerate(paths)]
+
+    # From the files, as without a baked pack (which makes both paths cheap)
+    manager = AssetManager(use_pack=False)
+    start = time.perf_counter()
+    for load in loads:
+        manager.image(load.path, load.size, load.alpha)
+    blocking = time.perf_counter() - start
+
+    manager = AssetManager(use_pack=False)
+    loader = AssetLoader(manager)
+    start = time.perf_counter()
+    for load in loads:
+        loader.request(load)
+    frames, worst_poll = 0, 0.0
+    while not loader.finished:
+        poll_start = time.perf_counter()
+        loader.poll()
+        worst_poll = max(worst_poll, time.perf_counter() - poll_start)
+        frames += 1
+        time.sleep(1 / 60)  # The rest of a progress-screen frame
+    pooled = time.perf_counter() - start
+    loader.close()
+
+    print(f"{len(loads)} backgrounds at {size[0]}x{size[1]}, decoded from the image files")
+    print(f"  main thread   {blocking * 1000:8.1f} ms with no frame drawn")
+    print(f"  thread pool   {pooled * 1000:8.1f} ms over {frames} frames, "
+          f"longest main-thread poll {worst_poll * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,82 @@
+import pygame
+from typing import Iterator
+
+# Frame timing settings shared by every scene
+TARGET_FPS = 60  # Frames drawn per second (caps CPU use)
+UPDATE_RATE = 120  # Fixed simulation steps per second
+MAX_UPDATES_PER_FRAME = 5  # Catch-up limit before frames are skipped
+MAX_FRAME_TIME = 0.25  # Ignore stalls longer than this (window drags, breakpoints)
+
+
+class FrameClock:
+    """Frame limiter with a fixed-timestep accumulator.
+
+    Every scene loop calls `steps()` once per frame and runs its simulation
+    once for every yielded step, so movement is identical on every machine:
+
+        clock = FrameClock()
+        while running:
+            for dt in clock.steps():
+                player_pos[0] += PLAYER_SPEED * dt
+            draw()
+            pygame.display.flip()
+    """
+
+    def __init__(self, fps: int = TARGET_FPS, update_rate: int = UPDATE_RATE,
+                 max_updates: int = MAX_UPDATES_PER_FRAME):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.step = 1.0 / update_rate  # Seconds of simulation per update
+        self.max_updates = max_updates
+        self.accumulator = 0.0
+        self.frame_time = 0.0  # Real seconds since the previous frame
+        self.skipped_updates = 0  # Updates dropped because the machine fell behind
+
+    def tick(self) -> int:
+        """Sleep until the next frame is due and return how many fixed updates to run"""
+        self.frame_time = min(self.clock.tick(self.fps) / 1000.0, MAX_FRAME_TIME)
+        self.accumulator += self.frame_time
+
+        updates = int(self.accumulator / self.step)
+        if updates > self.max_updates:
+            # Under load: simulate the capped number of steps, skip the rest of the backlog
+            self.skipped_updates += updates - self.max_updates
+            updates = self.max_updates
+            self.accumulator %= self.step
+        else:
+            self.accumulator -= updates * self.step
+        return updates
+
+    def resume(self):
+        """Restart timing after the loop slept, so the pause is neither simulated nor caught up"""
+        self.clock.tick()
+        self.accumulator = 0.0
+
+    def steps(self) -> Iterator[float]:
+        """Wait for the next frame, then yield the fixed delta time once per due update"""
+        for _ in range(self.tick()):
+            yield self.step
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step left in the accumulator, for interpolating draws"""
+        return self.accumulator / self.step
+
+    def get_fps(self) -> float:
+        return self.clock.get_fps()
+
+
+class FixedClock(FrameClock):
+    """Clock for headless runs: never sleeps, and every frame advances exactly 1/fps seconds.
+
+    Benchmarks and replays use it so a scripted run simulates the same steps on
+    every machine, however fast the frames actually are.
+    """
+
+    def tick(self) -> int:
+        self.clock.tick()  # Still measured, so get_fps() reports the real rate
+        self.frame_time = 1.0 / self.fps
+        self.accumulator += self.frame_time
+        updates = int(self.accumulator / self.step + 1e-9)
+        self.accumulator -= updates * self.step
+        return updates
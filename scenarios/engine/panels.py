@@ -0,0 +1,36 @@
+import pygame
+from typing import Callable, Dict, Hashable
+
+from engine.cache import SurfaceCache, surface_bytes
+from engine.profiler import profiler
+
+MAX_PANEL_CACHE_BYTES = 32 * 1024 * 1024  # About a dozen full-screen alpha panels
+MAX_PANEL_CACHE_ENTRIES = 64
+
+# Composited info panels and dialogue boxes, keyed by their content (quiz pages: engine.quiz)
+_panel_cache = SurfaceCache(max_bytes=MAX_PANEL_CACHE_BYTES, max_entries=MAX_PANEL_CACHE_ENTRIES)
+
+
+def get_panel(key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+    """Return the cached panel for key, rendering it with build() on a miss.
+
+    The key must capture everything the panel shows (title, text, state), so a
+    content change produces a new key and the old panel simply ages out.
+    """
+    panel = _panel_cache.get(key)
+    if panel is None:
+        with profiler.phase("draw.panel_build"):
+            panel = build()
+            if pygame.display.get_surface() is not None:
+                # Blit-ready in the display format
+                panel = panel.convert_alpha() if panel.get_flags() & pygame.SRCALPHA else panel.convert()
+        _panel_cache.put(key, panel, surface_bytes(panel))
+    return panel
+
+
+def panel_cache_stats() -> Dict[str, int]:
+    return _panel_cache.stats()
+
+
+def clear_panels():
+    _panel_cache.clear()
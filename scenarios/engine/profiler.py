@@ -0,0 +1,205 @@
+import csv
+import functools
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+import pygame
+
+from engine.fonts import LockedFont, font
+
+# Frame profiler settings
+RING_SIZE = 600  # Frames kept for the overlay and CSV export (10 s at 60 FPS)
+GRAPH_FRAMES = 120  # Frames shown in the overlay graph
+FRAME_BUDGET = 1.0 / 60  # Seconds; the graph's full height
+TOGGLE_KEY = pygame.K_F3  # Show/hide the overlay (and switch profiling on/off)
+DUMP_KEY = pygame.K_F4  # Write the ring buffer to a CSV file
+
+# Top-level phases of SceneManager.frame(), stacked in the graph; nested
+# phases are named "<phase>.<part>" and only listed as text
+PHASES = ("events", "update", "draw", "present")
+PHASE_COLORS = {
+    "events": (100, 180, 255),
+    "update": (120, 220, 120),
+    "draw": (255, 200, 80),
+    "present": (230, 90, 90),
+}
+OVERLAY_SIZE = (260, 250)
+OVERLAY_BG = (0, 0, 0, 170)
+GRAPH_HEIGHT = 70
+TEXT_REFRESH_FRAMES = 15  # The averages are re-rendered four times a second, not every frame
+
+
+class _NullPhase:
+    """What phase() hands out while profiling is off: a shared do-nothing context"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("times", "name", "start")
+
+    def __init__(self, times: Dict[str, float], name: str):
+        self.times = times
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        self.times[self.name] = self.times.get(self.name, 0.0) + elapsed
+        return False
+
+
+class Profiler:
+    """Per-phase frame timings, kept in a ring buffer of the last RING_SIZE frames.
+
+    Wrap the parts of a frame worth watching:
+
+        with profiler.phase("draw.npcs"):
+            ...
+
+        @profiled("draw.text")
+        def draw_text_wrapped(...): ...
+
+    A phase entered several times in one frame is summed. While disabled,
+    phase() returns a shared no-op context and profiled functions are called
+    straight through, so the instrumentation can stay in place.
+    """
+
+    def __init__(self, size: int = RING_SIZE):
+        self.enabled = False
+        self.overlay_visible = False
+        self.frames: Deque[Dict[str, float]] = deque(maxlen=size)
+        self.frame_count = 0
+        self._current: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self._overlay: Optional[pygame.Surface] = None
+        self._font: Optional[LockedFont] = None
+        self._text: Optional[pygame.Surface] = None
+        self._text_frame = 0  # frame_count when _text was rendered
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self._current, name)
+
+    def begin_frame(self):
+        if self.enabled:
+            self._current = {}
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self.enabled:
+            self._current["frame"] = time.perf_counter() - self._frame_start
+            self.frames.append(self._current)
+            self.frame_count += 1
+            self._current = {}
+
+    def toggle(self):
+        """Switch profiling and its overlay on or off together"""
+        self.enabled = self.overlay_visible = not self.enabled
+        if self.enabled:
+            # Usually toggled mid-frame: time the rest of this frame from here
+            self._current = {}
+            self._frame_start = time.perf_counter()
+        else:
+            self.frames.clear()
+            self._text = None
+
+    def averages(self, count: int = GRAPH_FRAMES) -> Dict[str, float]:
+        """Mean seconds per frame of every phase over the last `count` frames"""
+        recent = list(self.frames)[-count:]
+        totals: Dict[str, float] = {}
+        for frame in recent:
+            for name, seconds in frame.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        return {name: seconds / len(recent) for name, seconds in totals.items()}
+
+    def phase_names(self) -> List[str]:
+        """Every phase seen in the buffer: top-level phases first, then nested ones sorted"""
+        seen = {name for frame in self.frames for name in frame}
+        ordered = [name for name in ("frame",) + PHASES if name in seen]
+        return ordered + sorted(seen - set(ordered))
+
+    def dump_csv(self, path: str) -> int:
+        """Write the buffered frames as CSV (milliseconds); returns the number of rows"""
+        names = self.phase_names()
+        first = self.frame_count - len(self.frames)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [name + "_ms" for name in names])
+            for i, frame in enumerate(self.frames):
+                writer.writerow([first + i] + [f"{frame.get(name, 0.0) * 1000:.4f}" for name in names])
+        return len(self.frames)
+
+    def draw_overlay(self, screen, pos=(10, 10)):
+        """Draw the rolling graph and per-phase averages onto `screen` (a DirtyRenderer or Surface)"""
+        if self._overlay is None:
+            self._overlay = pygame.Surface(OVERLAY_SIZE, pygame.SRCALPHA)
+            self._font = font(18)
+        overlay = self._overlay
+        overlay.fill(OVERLAY_BG)
+        width, height = OVERLAY_SIZE
+
+        # Stacked bars, newest frame on the right; the top edge is one 60 FPS frame
+        bar_width = max(1, width // GRAPH_FRAMES)
+        for i, frame in enumerate(list(self.frames)[-GRAPH_FRAMES:]):
+            x = width - (min(len(self.frames), GRAPH_FRAMES) - i) * bar_width
+            y = GRAPH_HEIGHT
+            for name in PHASES:
+                bar = int(frame.get(name, 0.0) / FRAME_BUDGET * GRAPH_HEIGHT)
+                if bar:
+                    y -= bar
+                    overlay.fill(PHASE_COLORS[name], (x, max(y, 0), bar_width, bar))
+        overlay.fill((255, 255, 255), (0, 0, width, 1))  # Budget line
+
+        # Rolling averages, one line per phase
+        if self._text is None or self.frame_count - self._text_frame >= TEXT_REFRESH_FRAMES:
+            self._text = self._render_averages(width, height - GRAPH_HEIGHT - 4)
+            self._text_frame = self.frame_count
+        overlay.blit(self._text, (0, GRAPH_HEIGHT + 4))
+
+        rect = screen.blit(overlay, pos)
+        if hasattr(screen, "mark"):
+            screen.mark(rect)  # Same surface object every frame, but new pixels
+
+    def _render_averages(self, width: int, height: int) -> pygame.Surface:
+        text = pygame.Surface((width, height), pygame.SRCALPHA)
+        averages = self.averages()
+        y = 0
+        for name in self.phase_names():
+            color = PHASE_COLORS.get(name, (220, 220, 220))
+            label = self._font.render(name, True, color)
+            if y + label.get_height() > height:
+                break
+            value = self._font.render(f"{averages.get(name, 0.0) * 1000:.2f} ms", True, color)
+            text.blit(label, (6, y))
+            text.blit(value, (width - 6 - value.get_width(), y))
+            y += label.get_height()
+        return text
+
+
+profiler = Profiler()
+
+
+def profiled(name: str) -> Callable:
+    """Decorator: time every call of the function as phase `name`"""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,273 @@
+"""Learner progress kept for teachers: NPC visits, quiz answers and police choices.
+
+Scenes call record() from the frame loop; it only updates the in-memory
+summary and puts the row on a queue. A writer thread owns the SQLite
+connection (WAL journal, so teacher tools can read while the game writes)
+and inserts queued rows in batches, one transaction per batch. Summaries per
+learner are kept up to date in memory: the writer folds in what is already on
+disk when the store opens, record() adds each new row, and summary() hands
+out a snapshot that is rebuilt only after a change.
+
+Compare recording through the queue with committing each row from the loop:
+
+    cd scenarios && python -m engine.progress
+"""
+import atexit
+import getpass
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from engine.assets import ROOT_DIR
+
+PROGRESS_PATH = os.path.join(ROOT_DIR, "data", "progress.sqlite")
+LEARNER_ENV = "YYC_LEARNER"  # Who is playing; defaults to the OS user name
+BATCH_SIZE = 256  # Rows per transaction at most
+BATCH_DELAY = 0.25  # Seconds the writer waits for more rows before committing a batch
+LOAD_CHUNK = 500  # Rows folded into the summaries per lock hold when the store opens
+
+# Row kinds
+VISIT = "visit"  # item: NPC index
+ANSWER = "answer"  # item: scenario index, value: "yes"/"no", correct: 0/1
+CHOICE = "choice"  # item: encounter name, value: option number
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    learner TEXT NOT NULL,
+    level TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    item TEXT NOT NULL,
+    value TEXT,
+    correct INTEGER,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_learner ON events (learner);
+"""
+
+Row = Tuple[str, str, str, str, Optional[str], Optional[int], float]  # Columns after id, in order
+
+
+class Summary:
+    """What one learner has done, per level"""
+    __slots__ = ("learner", "visited", "answered", "correct", "wrong_answers", "choices")
+
+    def __init__(self, learner: str):
+        self.learner = learner
+        self.visited: Dict[str, Set[str]] = {}  # Level -> NPCs visited
+        self.answered: Dict[str, Set[str]] = {}  # Level -> questions answered at all
+        self.correct: Dict[str, Set[str]] = {}  # Level -> questions answered right
+        self.wrong_answers: Dict[str, int] = {}  # Level -> wrong attempts
+        self.choices: Dict[str, Dict[str, str]] = {}  # Level -> encounter -> latest option chosen
+
+    def add(self, level: str, kind: str, item: str, value: Optional[str], correct: Optional[int]):
+        if kind == VISIT:
+            self.visited.setdefault(level, set()).add(item)
+        elif kind == ANSWER:
+            self.answered.setdefault(level, set()).add(item)
+            if correct:
+                self.correct.setdefault(level, set()).add(item)
+            else:
+                self.wrong_answers[level] = self.wrong_answers.get(level, 0) + 1
+        elif kind == CHOICE:
+            self.choices.setdefault(level, {})[item] = value
+
+    def as_dict(self) -> Dict:
+        levels = sorted(set(self.visited) | set(self.answered) | set(self.choices))
+        return {
+            "learner": self.learner,
+            "levels": {level: {
+                "visited": sorted(self.visited.get(level, ())),
+                "answered": len(self.answered.get(level, ())),
+                "correct": len(self.correct.get(level, ())),
+                "wrong_answers": self.wrong_answers.get(level, 0),
+                "choices": dict(self.choices.get(level, {})),
+            } for level in levels},
+        }
+
+
+def default_learner() -> str:
+    return os.environ.get(LEARNER_ENV) or getpass.getuser()
+
+
+class ProgressStore:
+    """Write-behind SQLite store with per-learner summaries served from memory.
+
+    Only the writer thread touches the database; record(), summary() and
+    learners() never wait on disk; until `loaded` is set they may not yet
+    include earlier sessions. Use ":memory:" as the path for a store
+    that forgets everything when closed (benchmarks and replays).
+    """
+
+    def __init__(self, path: str = PROGRESS_PATH, learner: Optional[str] = None):
+        self.path = path
+        self.learner = learner or default_learner()
+        self._queue: "queue.Queue[Optional[Row]]" = queue.Queue()
+        self._lock = threading.Lock()  # Guards the summaries, shared with the writer's initial load
+        self._summaries: Dict[str, Summary] = {}
+        self._snapshots: Dict[str, Dict] = {}
+        self.error: Optional[Exception] = None  # Set if the writer fails; rows are then kept in memory only
+        self.loaded = threading.Event()  # Set once the rows already on disk are in the summaries
+
+        # Statistics
+        self.batches = 0
+        self.rows_written = 0
+
+        self._writer = threading.Thread(target=self._write_behind, name="progress-writer", daemon=True)
+        self._writer.start()
+
+    def record(self, level: str, kind: str, item, value=None, correct: Optional[bool] = None):
+        """Note one thing the current learner did; returns at once"""
+        row = (self.learner, level, kind, str(item), None if value is None else str(value),
+               None if correct is None else int(correct), time.time())
+        with self._lock:
+            self._add(row)
+        self._queue.put(row)
+
+    def _add(self, row: Row):
+        learner = row[0]
+        summary = self._summaries.get(learner)
+        if summary is None:
+            summary = self._summaries[learner] = Summary(learner)
+        summary.add(*row[1:6])
+        self._snapshots.pop(learner, None)
+
+    def summary(self, learner: Optional[str] = None) -> Dict:
+        """Progress of a learner (the current one by default), as plain data"""
+        learner = learner or self.learner
+        with self._lock:
+            snapshot = self._snapshots.get(learner)
+            if snapshot is None:
+                summary = self._summaries.get(learner) or Summary(learner)
+                snapshot = self._snapshots[learner] = summary.as_dict()
+            return snapshot
+
+    def learners(self) -> List[str]:
+        with self._lock:
+            return sorted(self._summaries)
+
+    # Writer thread ---------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; a power cut may lose the last batch
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _load(self, connection: sqlite3.Connection):
+        """Fold the rows already on disk into the summaries"""
+        cursor = connection.execute("SELECT learner, level, kind, item, value, correct, at FROM events ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(LOAD_CHUNK)
+            if not rows:
+                break
+            with self._lock:  # Held per chunk, so record() is never kept waiting long
+                for row in rows:
+                    self._add(row)
+
+    def _write_behind(self):
+        try:
+            connection = self._connect()
+            self._load(connection)
+        except Exception as error:  # Also OSError from a bad or read-only path
+            self.error = error
+            connection = None  # Keep draining the queue so flush() and close() return
+        self.loaded.set()
+
+        stopping = False
+        while not stopping:
+            row = self._queue.get()
+            batch = []
+            deadline = time.monotonic() + BATCH_DELAY
+            while True:
+                if row is None:
+                    stopping = True
+                else:
+                    batch.append(row)
+                if stopping or len(batch) >= BATCH_SIZE:
+                    break
+                try:
+                    row = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch and connection is not None:
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO events (learner, level, kind, item, value, correct, at) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+                    self.batches += 1
+                    self.rows_written += len(batch)
+                except Exception as error:
+                    self.error = error
+            for _ in range(len(batch) + stopping):
+                self._queue.task_done()
+        if connection is not None:
+            connection.close()
+
+    def flush(self):
+        """Block until every recorded row has been written (not for the frame loop)"""
+        self._queue.join()
+
+    def close(self):
+        """Write what is queued and stop the writer"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+
+_store: Optional[ProgressStore] = None
+
+
+def progress_store() -> ProgressStore:
+    """The process-wide store in PROGRESS_PATH, opened on first use and closed at exit"""
+    global _store
+    if _store is None:
+        _store = ProgressStore()
+        atexit.register(_store.close)
+    return _store
+
+
+def _benchmark(rows: int = 2000):
+    directory = tempfile.mkdtemp()
+
+    # What the frame loop would pay writing each row itself
+    connection = sqlite3.connect(os.path.join(directory, "sync.sqlite"))
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    worst, start = 0.0, time.perf_counter()
+    for i in range(rows):
+        row_start = time.perf_counter()
+        with connection:
+            connection.execute("INSERT INTO events (learner, level, kind, item, value, correct, at) "
+                               "VALUES (?, ?, ?, ?, ?, ?, ?)", ("bench", "office", ANSWER, str(i % 5), "yes", 1, time.time()))
+        worst = max(worst, time.perf_counter() - row_start)
+    synchronous = time.perf_counter() - start
+    connection.close()
+
+    store = ProgressStore(os.path.join(directory, "queued.sqlite"), learner="bench")
+    queued_worst, start = 0.0, time.perf_counter()
+    for i in range(rows):
+        row_start = time.perf_counter()
+        store.record("office", ANSWER, i % 5, "yes", True)
+        store.summary()
+        queued_worst = max(queued_worst, time.perf_counter() - row_start)
+    queued = time.perf_counter() - start
+    store.flush()
+    store.close()
+
+    print(f"{rows} rows")
+    print(f"  commit per row      {synchronous / rows * 1e6:8.1f} us/row  worst {worst * 1000:6.2f} ms")
+    print(f"  record + summary    {queued / rows * 1e6:8.1f} us/row  worst {queued_worst * 1000:6.2f} ms"
+          f"  ({store.batches} batches written behind)")
+
+
+if __name__ == "__main__":
+    _benchmark()
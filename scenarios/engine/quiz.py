@@ -0,0 +1,194 @@
+"""Quiz engine: question and explanation pages rendered once, the next one ahead of time.
+
+A quiz walks the scenarios of a content pack as a sequence of pages: each
+scenario's question page, then, once it is answered right, its explanation.
+A page is laid out and rendered into one surface, and while it is on screen
+the page after it is rendered on a worker thread, so a page turn is a blit
+even for long scenario text.
+
+The worker's fonts are created on the main thread and handed to it; every
+font call holds engine.fonts.FONT_LOCK, since SDL_ttf is not thread-safe.
+The worker stays out of the shared text caches and the profiler; the main
+thread only converts finished pages to the display format.
+
+Compare page turns with and without preparing ahead:
+
+    cd scenarios && python -m engine.quiz
+"""
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import pygame
+
+from engine.content import Scenario
+from engine.fonts import LockedFont, font
+from engine.text import wrap_lines
+
+PageKey = Tuple[int, bool]  # (scenario index, showing the explanation)
+FontSource = Callable[[int], LockedFont]
+
+PAGE_COLOR = (255, 255, 255)
+TEXT_COLOR = (0, 0, 0)
+TITLE_FONT = 48
+MAIN_FONT = 36
+MARGIN = 50
+
+def _draw_wrapped(page: pygame.Surface, text: str, text_font: LockedFont, y: int) -> int:
+    """Draw word-wrapped text at the page margin; returns the y below the last line"""
+    for line in wrap_lines(text, text_font, page.get_width() - 2 * MARGIN):
+        page.blit(text_font.render(line, True, TEXT_COLOR), (MARGIN, y))
+        y += text_font.get_height()
+    return y
+
+
+def render_page(scenario: Scenario, showing_explanation: bool, size: Tuple[int, int],
+                fonts: FontSource = font) -> pygame.Surface:
+    """Quiz page with the scenario and question, or the explanation and how to continue"""
+    width, height = size
+    page = pygame.Surface(size)
+    page.fill(PAGE_COLOR)
+    title, main = fonts(TITLE_FONT), fonts(MAIN_FONT)
+    if not showing_explanation:
+        y_offset = _draw_wrapped(page, "Scenario:", title, MARGIN)
+        y_offset = _draw_wrapped(page, scenario.scenario, main, y_offset + 20)
+        y_offset = _draw_wrapped(page, "Question:", title, y_offset + 40)
+        _draw_wrapped(page, scenario.question, main, y_offset + 20)
+    else:
+        y_offset = _draw_wrapped(page, "Explanation:", title, MARGIN)
+        _draw_wrapped(page, scenario.explanation, main, y_offset + 20)
+        continue_text = main.render("Press SPACE to continue", True, TEXT_COLOR)
+        page.blit(continue_text, (width // 2 - continue_text.get_width() // 2, height - 100))
+    return page
+
+
+class Quiz:
+    """Progress through a list of scenarios, with each page rendered before it is needed.
+
+    answer() and advance() turn the page; page() returns the current page,
+    waiting for the worker only if it has not finished it yet. Call close()
+    when the quiz is left. With prepare_ahead=False pages are rendered on the
+    calling thread when first shown.
+    """
+
+    def __init__(self, scenarios: Sequence[Scenario], size: Tuple[int, int], prepare_ahead: bool = True):
+        self.scenarios = scenarios
+        self.size = size
+        self.current = 0
+        self.showing_explanation = False
+        self._pages: Dict[PageKey, pygame.Surface] = {}
+        self._pending: Dict[PageKey, Future] = {}
+        self._worker: Optional[ThreadPoolExecutor] = None
+        self._fonts: Dict[int, LockedFont] = {}
+
+        # Statistics
+        self.waits = 0  # Pages the main thread had to wait for (or render itself)
+
+        if prepare_ahead:
+            # Created here on the main thread; the worker only uses them
+            self._fonts = {size: font(size) for size in (TITLE_FONT, MAIN_FONT)}
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quiz-pages")
+            self._prepare(self.page_key())
+            self._prepare(self._next_key())
+
+    @property
+    def finished(self) -> bool:
+        return self.current >= len(self.scenarios)
+
+    @property
+    def scenario(self) -> Scenario:
+        return self.scenarios[self.current]
+
+    def page_key(self) -> PageKey:
+        return self.current, self.showing_explanation
+
+    def _next_key(self) -> Optional[PageKey]:
+        if self.finished:
+            return None
+        if not self.showing_explanation:
+            return self.current, True
+        if self.current + 1 < len(self.scenarios):
+            return self.current + 1, False
+        return None
+
+    def _prepare(self, key: Optional[PageKey]):
+        if key is None or key in self._pages or key in self._pending or self._worker is None:
+            return
+        index, showing_explanation = key
+        self._pending[key] = self._worker.submit(
+            render_page, self.scenarios[index], showing_explanation, self.size, self._fonts.__getitem__)
+
+    def _turn(self):
+        # Pages behind the current one are never shown again
+        for key in [key for key in self._pages if key < self.page_key()]:
+            del self._pages[key]
+        self._prepare(self._next_key())
+
+    def answer(self, choice: str) -> bool:
+        """Answer the current question ("yes"/"no"); a right answer turns to the explanation"""
+        if self.showing_explanation or choice != self.scenario.answer:
+            return False
+        self.showing_explanation = True
+        self._turn()
+        return True
+
+    def advance(self):
+        """Leave an explanation for the next scenario's question"""
+        if self.showing_explanation:
+            self.current += 1
+            self.showing_explanation = False
+            self._turn()
+
+    def page(self) -> pygame.Surface:
+        key = self.page_key()
+        page = self._pages.get(key)
+        if page is None:
+            pending = self._pending.pop(key, None)
+            if pending is None or not pending.done():
+                self.waits += 1
+            if pending is not None:
+                page = pending.result()
+            else:
+                page = render_page(self.scenarios[key[0]], key[1], self.size)
+            if pygame.display.get_surface() is not None:
+                page = page.convert()  # Blit-ready in the display format
+            self._pages[key] = page
+        return page
+
+    def close(self):
+        if self._worker is not None:
+            self._worker.shutdown(wait=False, cancel_futures=True)
+            self._worker = None
+
+
+def _benchmark(scenarios: int = 20, paragraphs: int = 4, size: Tuple[int, int] = (800, 600)):
+    from engine.content import load_pack
+
+    pygame.font.init()
+    base = load_pack("office").scenarios
+    # Long scenario text: several of the pack's scenarios run together
+    long_scenarios = [Scenario(" ".join(base[(i + j) % len(base)].scenario for j in range(paragraphs)),
+                               base[i % len(base)].question, base[i % len(base)].answer,
+                               " ".join(base[(i + j) % len(base)].explanation for j in range(paragraphs)))
+                      for i in range(scenarios)]
+
+    for prepare_ahead in (False, True):
+        quiz = Quiz(long_scenarios, size, prepare_ahead=prepare_ahead)
+        turns = []
+        while not quiz.finished:
+            time.sleep(0.25)  # Reading time, during which the worker renders the next page
+            start = time.perf_counter()
+            quiz.page()
+            turns.append(time.perf_counter() - start)
+            if quiz.showing_explanation:
+                quiz.advance()
+            else:
+                quiz.answer(quiz.scenario.answer)
+        quiz.close()
+        label = "prepared ahead" if prepare_ahead else "on demand"
+        print(f"{label:15s} {len(turns)} pages: mean {sum(turns) / len(turns) * 1000:6.2f} ms, "
+              f"worst {max(turns) * 1000:6.2f} ms, {quiz.waits} waited")
+
+
+if __name__ == "__main__":
+    _benchmark()
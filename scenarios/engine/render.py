@@ -0,0 +1,141 @@
+import pygame
+from typing import List, Optional, Sequence, Tuple, Union
+
+from engine.display import present
+
+# Above this fraction of the screen a single flip is cheaper than many rect updates
+FULL_FLIP_THRESHOLD = 0.4
+
+Background = Union[pygame.Surface, Tuple[int, ...]]
+
+
+class DirtyRenderer:
+    """Screen wrapper that only pushes the regions that changed since last frame.
+
+    Scenes draw through it like a Surface. Every frame starts with
+    `clear(background)`, which restores last frame's drawn regions from the
+    cached background (a full-screen surface or a fill color) instead of
+    repainting the whole screen. `present()` then compares this frame's draw
+    list with the previous one and hands only the regions that differ to
+    engine.display.present, falling back to a full flip past the threshold.
+
+    Surfaces drawn through the renderer are treated as unchanged while they are
+    the same object at the same place; call invalidate() after drawing to the
+    display behind the renderer's back.
+    """
+
+    def __init__(self, screen: pygame.Surface, enabled: bool = True, threshold: float = FULL_FLIP_THRESHOLD):
+        self.screen = screen
+        self.enabled = enabled
+        self.threshold = threshold
+        self.background: Optional[Background] = None
+        self._previous: List[tuple] = []  # (source, rect, area, flags) drawn last frame
+        self._current: List[tuple] = []
+        self._full = True  # Next present must repaint everything
+        self._screen_area = screen.get_width() * screen.get_height()
+
+        # Statistics
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.idle_frames = 0  # Frames where nothing on screen changed
+        self.pixels_pushed = 0
+
+    def invalidate(self):
+        """Force a full repaint and flip on the next frame"""
+        self._full = True
+
+    def clear(self, background: Background):
+        """Start a frame: restore the previously drawn regions from the background"""
+        if background != self.background:
+            self.background = background
+            self._full = True
+
+        if self._full or not self.enabled:
+            self._paint_background(self.screen.get_rect())
+        else:
+            for _, rect, _, _ in self._previous:
+                self._paint_background(rect)
+        self._current = []
+
+    def _paint_background(self, rect: pygame.Rect):
+        if isinstance(self.background, pygame.Surface):
+            self.screen.blit(self.background, rect, rect)
+        else:
+            self.screen.fill(self.background, rect)
+
+    # Surface-like drawing API --------------------------------------------
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0) -> pygame.Rect:
+        rect = self.screen.blit(source, dest, area, special_flags)
+        self._current.append((source, tuple(rect), tuple(area) if area else None, special_flags))
+        return rect
+
+    def blits(self, blit_sequence: Sequence[tuple]) -> List[pygame.Rect]:
+        return [self.blit(*item) for item in blit_sequence]
+
+    def fill(self, color, rect=None, special_flags: int = 0) -> pygame.Rect:
+        rect = self.screen.fill(color, rect, special_flags)
+        self._current.append((tuple(color), tuple(rect), None, special_flags))
+        return rect
+
+    def mark(self, rect) -> pygame.Rect:
+        """Record a region drawn with something other than the methods above"""
+        rect = pygame.Rect(rect).clip(self.screen.get_rect())
+        self._current.append((None, tuple(rect), None, 0))
+        return rect
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.screen.get_size()
+
+    def get_width(self) -> int:
+        return self.screen.get_width()
+
+    def get_height(self) -> int:
+        return self.screen.get_height()
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        return self.screen.get_rect(**kwargs)
+
+    # Presenting ------------------------------------------------------------
+
+    def dirty_rects(self) -> List[pygame.Rect]:
+        """Regions whose pixels differ from what the display showed last frame"""
+        previous = set(self._previous)
+        current = set(self._current)
+        # Marked regions (source None) are always considered changed
+        changed = [item for item in self._current if item not in previous or item[0] is None]
+        changed += [item for item in self._previous if item not in current]
+        bounds = self.screen.get_rect()
+        return [pygame.Rect(item[1]).clip(bounds) for item in changed]
+
+    def present(self):
+        if self._full or not self.enabled:
+            self._flip()
+        else:
+            rects = [rect for rect in self.dirty_rects() if rect.width and rect.height]
+            area = sum(rect.width * rect.height for rect in rects)
+            if area > self.threshold * self._screen_area:
+                self._flip()
+            elif rects:
+                present(rects)
+                self.partial_frames += 1
+                self.pixels_pushed += area
+            else:
+                self.idle_frames += 1
+
+        self._previous = self._current
+        self._current = []
+        self._full = False
+
+    def _flip(self):
+        present()
+        self.full_frames += 1
+        self.pixels_pushed += self._screen_area
+
+    def stats(self) -> dict:
+        return {
+            "full_frames": self.full_frames,
+            "partial_frames": self.partial_frames,
+            "idle_frames": self.idle_frames,
+            "pixels_pushed": self.pixels_pushed,
+        }
@@ -0,0 +1,184 @@
+import struct
+import zlib
+from typing import List, Set, Tuple
+
+import pygame
+
+from engine.input import InputSource, KeyState, ScriptedInput, track_keys
+from engine.loop import FrameClock, TARGET_FPS, UPDATE_RATE
+
+# Recording layout:
+#   header  MAGIC | version | fps | update rate | scene name length | scene name (utf-8)
+#   body    zlib-compressed; per frame FRAME fields, then `count` events, each
+#           an event code followed by that code's payload struct
+MAGIC = b"YYCREPL\0"
+VERSION = 1
+HEADER = struct.Struct("<8sIHHH")
+FRAME = struct.Struct("<BH")  # fixed updates run this frame, event count
+CODE = struct.Struct("<B")
+KEY = struct.Struct("<IH")  # key, modifiers
+POS = struct.Struct("<hh")  # x, y
+BUTTON = struct.Struct("<hhB")  # x, y, button
+
+# Event code -> (pygame event type, payload struct); only what scenes react to is recorded
+EVENT_CODES = {
+    1: (pygame.KEYDOWN, KEY),
+    2: (pygame.KEYUP, KEY),
+    3: (pygame.MOUSEMOTION, POS),
+    4: (pygame.MOUSEBUTTONDOWN, BUTTON),
+    5: (pygame.MOUSEBUTTONUP, BUTTON),
+    6: (pygame.QUIT, None),
+}
+CODES_BY_TYPE = {event_type: code for code, (event_type, _) in EVENT_CODES.items()}
+
+# One recorded frame: (fixed updates, events delivered that frame)
+Frame = Tuple[int, List[pygame.event.Event]]
+
+
+def _payload(event: pygame.event.Event) -> tuple:
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        return event.key, event.mod
+    if event.type == pygame.MOUSEMOTION:
+        return event.pos
+    if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return event.pos[0], event.pos[1], event.button
+    return ()
+
+
+def _event(event_type: int, payload: tuple) -> pygame.event.Event:
+    if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        key, mod = payload
+        return pygame.event.Event(event_type, key=key, mod=mod, unicode="", scancode=0)
+    if event_type == pygame.MOUSEMOTION:
+        return pygame.event.Event(event_type, pos=payload, rel=(0, 0), buttons=(0, 0, 0))
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        x, y, button = payload
+        return pygame.event.Event(event_type, pos=(x, y), button=button)
+    return pygame.event.Event(event_type)
+
+
+def write_recording(path: str, scene: str, frames: List[Frame], fps: int = TARGET_FPS,
+                    update_rate: int = UPDATE_RATE):
+    body = bytearray()
+    for updates, events in frames:
+        body += FRAME.pack(updates, len(events))
+        for event in events:
+            code = CODES_BY_TYPE[event.type]
+            body += CODE.pack(code)
+            payload_struct = EVENT_CODES[code][1]
+            if payload_struct is not None:
+                body += payload_struct.pack(*_payload(event))
+    name = scene.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, fps, update_rate, len(name)))
+        f.write(name)
+        f.write(zlib.compress(bytes(body), 9))
+
+
+def read_recording(path: str) -> Tuple[str, int, int, List[Frame]]:
+    """Returns (scene name, fps, update rate, frames)"""
+    with open(path, "rb") as f:
+        magic, version, fps, update_rate, name_len = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input recording")
+        scene = f.read(name_len).decode("utf-8")
+        body = zlib.decompress(f.read())
+
+    frames = []
+    offset = 0
+    while offset < len(body):
+        updates, count = FRAME.unpack_from(body, offset)
+        offset += FRAME.size
+        events = []
+        for _ in range(count):
+            (code,) = CODE.unpack_from(body, offset)
+            offset += CODE.size
+            event_type, payload_struct = EVENT_CODES[code]
+            payload = ()
+            if payload_struct is not None:
+                payload = payload_struct.unpack_from(body, offset)
+                offset += payload_struct.size
+            events.append(_event(event_type, payload))
+        frames.append((updates, events))
+    return scene, fps, update_rate, frames
+
+
+class InputRecorder(InputSource):
+    """Live input that also logs every frame's events and fixed-update count.
+
+    Scenes see exactly what a replay will give them: only the recorded event
+    types, and held keys derived from those events rather than the keyboard.
+    Pair it with a RecordingClock so each frame's update count is captured.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.frames: List[Frame] = []
+        self.pending_updates = 0  # Set by RecordingClock for the frame being polled
+        self.held: Set[int] = set()
+        self.keys = KeyState()
+
+    def poll(self) -> List[pygame.event.Event]:
+        events = []
+        for event in super().poll():
+            if event.type not in CODES_BY_TYPE:
+                continue
+            if event.type == pygame.MOUSEMOTION and events and events[-1].type == pygame.MOUSEMOTION:
+                events[-1] = event  # Only the latest position of a run of motions matters
+            else:
+                events.append(event)
+        self.keys = track_keys(self.held, events)
+        # One poll per frame; the clock has set this frame's update count just before
+        self.frames.append((self.pending_updates, events))
+        self.pending_updates = 0
+        return events
+
+    def get_pressed(self) -> KeyState:
+        return self.keys
+
+
+class RecordingClock(FrameClock):
+    """Real-time clock that hands each frame's update count to an InputRecorder"""
+
+    def __init__(self, recorder: InputRecorder, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+
+    def tick(self) -> int:
+        updates = super().tick()
+        self.recorder.pending_updates = updates
+        return updates
+
+
+class ReplayInput(ScriptedInput):
+    """Feeds a recording back frame by frame; ends with QUIT when it runs out"""
+
+    def __init__(self, frames: List[Frame]):
+        super().__init__([(i, event) for i, (_, events) in enumerate(frames) for event in events])
+        self.updates = [updates for updates, _ in frames]
+
+    @property
+    def finished(self) -> bool:
+        return self.frame >= len(self.updates)
+
+    def next_updates(self) -> int:
+        return 0 if self.finished else self.updates[self.frame]
+
+    def poll(self) -> List[pygame.event.Event]:
+        if self.finished:
+            return [pygame.event.Event(pygame.QUIT)]
+        return super().poll()
+
+
+class ReplayClock(FrameClock):
+    """Never sleeps; each frame runs exactly the fixed updates the recording ran"""
+
+    def __init__(self, replay: ReplayInput, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replay = replay
+
+    def tick(self) -> int:
+        self.clock.tick()  # Still measured, so get_fps() reports the real rate
+        updates = self.replay.next_updates()
+        self.frame_time = updates * self.step
+        return updates
@@ -0,0 +1,213 @@
+import pygame
+import time
+from typing import List, Optional
+
+from engine.display import init_display
+from engine.input import InputSource
+from engine.loop import FrameClock
+from engine.profiler import DUMP_KEY, TOGGLE_KEY, profiler
+from engine.progress import ProgressStore, progress_store
+from engine.render import DirtyRenderer
+
+IDLE_TIMEOUT = 1.0  # Seconds an idle loop sleeps before asking the scene again
+
+
+class Scene:
+    """Base class for a screen the SceneManager can run.
+
+    Hooks, all optional:
+      enter()         scene became the top of the stack (first time)
+      exit()          scene was popped or replaced
+      pause()/resume() another scene was pushed on top / popped off again
+      handle_event()  one pygame event
+                      (read held keys with self.manager.input.get_pressed())
+      update(dt)      one fixed simulation step of dt seconds
+      draw(screen)    render the current state through the DirtyRenderer:
+                      start with screen.clear(background), then blit/fill
+      is_idle()       True while the picture cannot change without input (no
+                      movement, animation or timer running); the manager then
+                      sleeps until an event arrives instead of redrawing
+      preload()       images to load before enter(), as engine.loader.Load
+                      requests; see engine.loader.loading_screen()
+    """
+
+    caption = "Canadian Law Adventure"
+
+    def __init__(self):
+        self.manager: Optional["SceneManager"] = None
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def pause(self):
+        pass
+
+    def resume(self):
+        pass
+
+    def handle_event(self, event: pygame.event.Event):
+        pass
+
+    def update(self, dt: float):
+        pass
+
+    def draw(self, screen: pygame.Surface):
+        pass
+
+    def is_idle(self) -> bool:
+        return False
+
+    def preload(self) -> List:
+        return []
+
+
+class SceneManager:
+    """Scene stack sharing one window, one frame clock and the warm asset cache.
+
+    Transitions requested during a frame (push/pop/replace) are applied once
+    the frame has been presented, so a scene never disappears mid-update.
+    While the current scene is idle and its last frame is on screen, frame()
+    blocks on the input instead of updating and redrawing a static picture.
+    """
+
+    def __init__(self, screen: Optional[pygame.Surface] = None, clock: Optional[FrameClock] = None,
+                 dirty_rects: bool = True, input: Optional[InputSource] = None, idle: bool = True,
+                 async_loading: bool = True, progress: Optional[ProgressStore] = None):
+        self.screen = screen or init_display()  # Opens the window if nothing has yet
+        self.clock = clock or FrameClock()
+        self.input = input or InputSource()
+        self.renderer = DirtyRenderer(self.screen, enabled=dirty_rects)
+        self.stack: List[Scene] = []
+        self._pending: List[tuple] = []
+        self.running = False
+        self.idle = idle  # Sleep through static screens
+        self.async_loading = async_loading  # Loading screens animate while images decode (engine.loader)
+        self.progress = progress or progress_store()  # Where scenes record what the learner did
+        self._shown = False  # The current scene's latest frame has been presented
+        self.idle_time = 0.0  # Seconds spent asleep waiting for input
+
+    @property
+    def current(self) -> Optional[Scene]:
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene: Scene):
+        self._pending.append(("push", scene))
+
+    def pop(self):
+        self._pending.append(("pop", None))
+
+    def replace(self, scene: Scene):
+        self._pending.append(("replace", scene))
+
+    def quit(self):
+        self.running = False
+
+    def _apply_pending(self):
+        if self._pending:
+            self.renderer.invalidate()  # A different scene is about to be drawn
+            self._shown = False
+        while self._pending:
+            action, scene = self._pending.pop(0)
+            if action in ("pop", "replace") and self.stack:
+                self.stack.pop().exit()
+            if action == "push" and self.stack:
+                self.stack[-1].pause()
+            if scene is not None:
+                scene.manager = self
+                self.stack.append(scene)
+                pygame.display.set_caption(scene.caption)
+                scene.enter()
+            elif self.stack:
+                pygame.display.set_caption(self.stack[-1].caption)
+                self.stack[-1].resume()
+
+    def start(self, scene: Scene):
+        """Make `scene` current without running the loop (for callers that drive frame() themselves)"""
+        self.push(scene)
+        self._apply_pending()
+        self.running = True
+
+    def run(self, scene: Scene):
+        """Run until the window is closed or the last scene pops itself"""
+        self.start(scene)
+        while self.running and self.stack:
+            self.frame()
+
+        # Give every scene left on the stack its exit hook
+        while self.stack:
+            self.stack.pop().exit()
+
+    def frame(self):
+        if self.idle and self.is_idle() and not self.sleep():
+            return  # Nothing happened: no update, no redraw
+        updates = self.clock.tick()
+        profiler.begin_frame()
+        with profiler.phase("events"):
+            running = self.dispatch_events()
+        if not running:
+            profiler.end_frame()  # Keep the closing frame's event timing and leave no frame open
+            return
+        with profiler.phase("update"):
+            self.update(updates)
+        with profiler.phase("draw"):
+            self.draw()
+        with profiler.phase("present"):
+            self.present()
+        profiler.end_frame()
+
+    def is_idle(self) -> bool:
+        """True when the presented frame is current and nothing on it would change without input"""
+        return self._shown and not self._pending and not profiler.overlay_visible and self.stack[-1].is_idle()
+
+    def sleep(self) -> bool:
+        """Block until input arrives (True) or IDLE_TIMEOUT passes (False)"""
+        start = time.perf_counter()
+        woken = self.input.wait(IDLE_TIMEOUT)
+        self.idle_time += time.perf_counter() - start
+        if woken:
+            self.clock.resume()  # Time spent asleep is not simulated
+        return woken
+
+    # The phases of one frame, in order
+
+    def dispatch_events(self) -> bool:
+        """Hand this frame's input to the current scene; False once the window is closed"""
+        scene = self.stack[-1]
+        for event in self.input.poll():
+            if event.type == pygame.QUIT:
+                self.quit()
+                return False
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.VIDEORESIZE):
+                self.renderer.invalidate()  # The window lost its pixels or changed size; present all of it
+            if event.type == pygame.KEYDOWN and event.key in (TOGGLE_KEY, DUMP_KEY):
+                self.profiler_key(event.key)
+                continue
+            scene.handle_event(event)
+        return True
+
+    def update(self, updates: int):
+        scene = self.stack[-1]
+        for _ in range(updates):
+            scene.update(self.clock.step)
+
+    def draw(self):
+        self.stack[-1].draw(self.renderer)
+        if profiler.overlay_visible:
+            with profiler.phase("draw.overlay"):
+                profiler.draw_overlay(self.renderer)
+
+    def present(self):
+        self.renderer.present()
+        self._shown = True
+        self._apply_pending()
+
+    def profiler_key(self, key: int):
+        """F3 toggles the profiler overlay, F4 writes its frames to a CSV file"""
+        if key == TOGGLE_KEY:
+            profiler.toggle()
+        elif profiler.frames:
+            path = time.strftime("profile-%Y%m%d-%H%M%S.csv")
+            print(f"Wrote {profiler.dump_csv(path)} frames to {path}")
@@ -0,0 +1,168 @@
+"""Uniform-grid spatial hash for point entities (NPCs, law stations, pickups).
+
+Benchmark against a linear scan with:
+
+    cd scenarios && python -m engine.spatial
+"""
+import math
+import random
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+Point = Tuple[float, float]
+
+
+class SpatialHash:
+    """Buckets entities into square cells so queries only visit nearby cells.
+
+    Positions are world coordinates. A scrolling scene converts its camera
+    offset into a world rect with camera_rect() and asks for visible(); the
+    player is converted to world space before calling nearest().
+    """
+
+    def __init__(self, cell_size: float = 128):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List[Hashable]] = {}
+        self._positions: Dict[Hashable, Point] = {}
+
+    @classmethod
+    def from_points(cls, points: Sequence[Point], cell_size: float = 128) -> "SpatialHash":
+        """Index a list of positions, using each point's list index as its id"""
+        index = cls(cell_size)
+        for i, (x, y) in enumerate(points):
+            index.insert(i, x, y)
+        return index
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, item: Hashable, x: float, y: float):
+        if item in self._positions:
+            self.remove(item)
+        self._positions[item] = (x, y)
+        self._cells.setdefault(self._cell(x, y), []).append(item)
+
+    def remove(self, item: Hashable):
+        x, y = self._positions.pop(item)
+        cell = self._cell(x, y)
+        bucket = self._cells[cell]
+        bucket.remove(item)
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, item: Hashable, x: float, y: float):
+        old_x, old_y = self._positions[item]
+        if self._cell(old_x, old_y) == self._cell(x, y):
+            self._positions[item] = (x, y)  # Same bucket, just update the point
+        else:
+            self.remove(item)
+            self.insert(item, x, y)
+
+    def position(self, item: Hashable) -> Point:
+        return self._positions[item]
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._positions
+
+    def _cells_in(self, left: float, top: float, right: float, bottom: float) -> Iterable[List[Hashable]]:
+        min_cx, min_cy = self._cell(left, top)
+        max_cx, max_cy = self._cell(right, bottom)
+        # Sparse worlds: walking the occupied cells beats walking a huge empty range
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._cells):
+            for (cx, cy), bucket in self._cells.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    yield bucket
+            return
+        cells = self._cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield bucket
+
+    def within(self, x: float, y: float, radius: float) -> List[Hashable]:
+        """Every entity strictly closer than radius to (x, y)"""
+        radius_sq = radius * radius
+        positions = self._positions
+        found = []
+        for bucket in self._cells_in(x - radius, y - radius, x + radius, y + radius):
+            for item in bucket:
+                px, py = positions[item]
+                if (px - x) ** 2 + (py - y) ** 2 < radius_sq:
+                    found.append(item)
+        return found
+
+    def nearest(self, x: float, y: float, radius: float) -> Optional[Hashable]:
+        """Closest entity strictly within radius of (x, y), or None"""
+        best, best_sq = None, radius * radius
+        positions = self._positions
+        for bucket in self._cells_in(x - radius, y - radius, x + radius, y + radius):
+            for item in bucket:
+                px, py = positions[item]
+                distance_sq = (px - x) ** 2 + (py - y) ** 2
+                if distance_sq < best_sq:
+                    best, best_sq = item, distance_sq
+        return best
+
+    def visible(self, left: float, top: float, width: float, height: float) -> List[Hashable]:
+        """Entities whose position lies inside the rect, e.g. the camera view"""
+        right, bottom = left + width, top + height
+        positions = self._positions
+        found = []
+        for bucket in self._cells_in(left, top, right, bottom):
+            for item in bucket:
+                px, py = positions[item]
+                if left <= px < right and top <= py < bottom:
+                    found.append(item)
+        return found
+
+
+def camera_rect(x_offset: float, width: int, height: int) -> Tuple[float, float, int, int]:
+    """World-space rect seen by a camera scrolled by x_offset (negative = scrolled right)"""
+    return (-x_offset, 0, width, height)
+
+
+def _benchmark(count: int = 10_000, queries: int = 2_000, radius: float = 60):
+    rng = random.Random(1)
+    world_width = count * 40  # Long corridor level, one NPC every 40px on average
+    points = [(rng.uniform(0, world_width), rng.uniform(0, 600)) for _ in range(count)]
+    probes = [(rng.uniform(0, world_width), rng.uniform(0, 600)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    index = SpatialHash.from_points(points)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = [index.nearest(x, y, radius) for x, y in probes]
+    hashed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slow = []
+    for x, y in probes:
+        best, best_d = None, radius
+        for i, (px, py) in enumerate(points):
+            d = math.sqrt((px - x) ** 2 + (py - y) ** 2)
+            if d < best_d:
+                best, best_d = i, d
+        slow.append(best)
+    linear = time.perf_counter() - start
+    assert fast == slow, "spatial hash disagrees with the linear scan"
+
+    start = time.perf_counter()
+    for x, _ in probes:
+        index.visible(*camera_rect(-x, 800, 600))
+    culling = time.perf_counter() - start
+
+    print(f"{count} NPCs, {queries} queries")
+    print(f"  build              {build * 1000:8.2f} ms")
+    print(f"  nearest (hash)     {hashed / queries * 1e6:8.2f} us/query")
+    print(f"  nearest (linear)   {linear / queries * 1e6:8.2f} us/query  ({linear / hashed:.0f}x slower)")
+    print(f"  visible (hash)     {culling / queries * 1e6:8.2f} us/query")
+
+
+if __name__ == "__main__":
+    _benchmark()
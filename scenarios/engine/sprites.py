@@ -0,0 +1,207 @@
+"""Sprite atlases, animation clips and the Animator that plays them.
+
+Time a crowd of animated characters with:
+
+    cd scenarios && python -m engine.sprites
+"""
+import json
+import os
+import time
+import pygame
+from typing import Dict, Sequence, Tuple
+
+from engine.assets import asset_path, assets
+
+Rect = Tuple[int, int, int, int]
+DIRECTIONS = ("down", "left", "right", "up")
+
+# Frame name -> source image for the player character
+PLAYER_FRAMES = {f"look_{d}": f"images/look_{d}.png" for d in DIRECTIONS}
+PLAYER_FRAMES.update({f"walk_{d}_{n}": f"images/walk_{d}_{n}.png" for d in DIRECTIONS for n in (1, 2)})
+
+# Packed atlas written by build_atlas.py; frames are FRAME_SIZE px squares on a grid
+PLAYER_ATLAS_PATH = "images/player_atlas.png"
+PLAYER_ATLAS_INDEX = "images/player_atlas.json"
+FRAME_SIZE = 16
+ATLAS_COLUMNS = 4
+
+WALK_FRAME_MS = 150
+# (state, direction) -> ((frame name, duration in ms), ...)
+PLAYER_ANIMATIONS: Dict[Tuple[str, str], Tuple[Tuple[str, int], ...]] = {}
+for _d in DIRECTIONS:
+    PLAYER_ANIMATIONS[("idle", _d)] = ((f"look_{_d}", 0),)
+    PLAYER_ANIMATIONS[("walk", _d)] = ((f"walk_{_d}_1", WALK_FRAME_MS), (f"walk_{_d}_2", WALK_FRAME_MS))
+
+# Arrow keys in priority order -> direction the player faces while walking
+KEY_DIRECTIONS = (
+    (pygame.K_RIGHT, "right"),
+    (pygame.K_LEFT, "left"),
+    (pygame.K_UP, "up"),
+    (pygame.K_DOWN, "down"),
+)
+
+
+def movement_state(keys, idle_direction: str = "down") -> Tuple[str, str]:
+    """(state, direction) for the arrow keys held this frame"""
+    for key, direction in KEY_DIRECTIONS:
+        if keys[key]:
+            return ("walk", direction)
+    return ("idle", idle_direction)
+
+
+def build_atlas(frames: Dict[str, pygame.Surface], columns: int = ATLAS_COLUMNS) -> Tuple[pygame.Surface, Dict[str, Rect]]:
+    """Pack equally sized frames into one surface on a grid (sorted by name)"""
+    names = sorted(frames)
+    width, height = frames[names[0]].get_size()
+    rows = (len(names) + columns - 1) // columns
+    atlas = pygame.Surface((columns * width, rows * height), pygame.SRCALPHA)
+    rects = {}
+    for i, name in enumerate(names):
+        rect = ((i % columns) * width, (i // columns) * height, width, height)
+        atlas.blit(frames[name], rect[:2])
+        rects[name] = rect
+    return atlas, rects
+
+
+class SpriteSheet:
+    """One atlas surface plus its animation table resolved to frame rects.
+
+    frame(state, direction, index) is a single dictionary lookup into clips
+    precomputed at load time, so scenes never branch over key states.
+    """
+
+    def __init__(self, surface: pygame.Surface, rects: Dict[str, Rect],
+                 animations: Dict[Tuple[str, str], Sequence[Tuple[str, int]]], scale: float = 1):
+        self.surface = surface
+        self.clips: Dict[Tuple[str, str], Tuple[pygame.Rect, ...]] = {}
+        self.durations: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+        for key, clip in animations.items():
+            self.clips[key] = tuple(
+                pygame.Rect(*(round(v * scale) for v in rects[name])) for name, _ in clip
+            )
+            self.durations[key] = tuple(duration for _, duration in clip)
+
+    def frame(self, state: str, direction: str, index: int = 0) -> pygame.Rect:
+        clip = self.clips[(state, direction)]
+        return clip[index % len(clip)]
+
+    def draw(self, target: pygame.Surface, pos, state: str, direction: str, index: int = 0) -> pygame.Rect:
+        return target.blit(self.surface, pos, self.frame(state, direction, index))
+
+
+class Animator:
+    """Plays one character's clips from a shared SpriteSheet on elapsed time.
+
+    Clip rects and per-frame durations (ms) belong to the sheet, so any number
+    of animators share them. An animator only keeps its place in the current
+    clip and that frame's rect: play() looks the clip up when it changes,
+    update(dt) advances by time, and draw() is a single blit.
+    """
+    __slots__ = ("sheet", "clip", "index", "elapsed", "rect", "_rects", "_durations")
+
+    def __init__(self, sheet: SpriteSheet, state: str = "idle", direction: str = "down"):
+        self.sheet = sheet
+        self.clip = None
+        self.play(state, direction)
+
+    def play(self, state: str, direction: str):
+        """Switch to a clip from its first frame; asking for the running clip keeps its place"""
+        clip = (state, direction)
+        if clip == self.clip:
+            return
+        self.clip = clip
+        self._rects = self.sheet.clips[clip]
+        self._durations = self.sheet.durations[clip]
+        self.index = 0
+        self.elapsed = 0.0  # Milliseconds shown of the current frame
+        self.rect = self._rects[0]
+
+    def update(self, dt: float):
+        """Advance by dt seconds; a frame with duration 0 is held until the clip changes"""
+        durations = self._durations
+        if len(durations) < 2:
+            return
+        self.elapsed += dt * 1000
+        while 0 < durations[self.index] <= self.elapsed:
+            self.elapsed -= durations[self.index]
+            self.index = (self.index + 1) % len(durations)
+        self.rect = self._rects[self.index]
+
+    def draw(self, target: pygame.Surface, pos) -> pygame.Rect:
+        return target.blit(self.sheet.surface, pos, self.rect)
+
+
+def load_player_atlas() -> Tuple[Dict[str, Rect], Tuple[int, int]]:
+    """Frame rects and native size of the packed player atlas"""
+    with open(asset_path(PLAYER_ATLAS_INDEX)) as f:
+        index = json.load(f)
+    return {name: tuple(rect) for name, rect in index["frames"].items()}, tuple(index["size"])
+
+
+_player_sheets: Dict[Tuple[int, int], SpriteSheet] = {}
+
+
+def player_sheet(size: Tuple[int, int]) -> SpriteSheet:
+    """Player sprite sheet with frames scaled to size, built once per size"""
+    sheet = _player_sheets.get(size)
+    if sheet is not None:
+        return sheet
+
+    scale = size[0] / FRAME_SIZE
+    if os.path.exists(asset_path(PLAYER_ATLAS_INDEX)):
+        # One image for all twelve frames; the asset manager scales it once
+        rects, atlas_size = load_player_atlas()
+        scaled_size = (round(atlas_size[0] * scale), round(atlas_size[1] * scale))
+        surface = assets.image(PLAYER_ATLAS_PATH, scaled_size, alpha=True)
+    else:
+        # No packed atlas yet: pack the individual frames at load time
+        frames = {name: assets.image(path, alpha=True) for name, path in PLAYER_FRAMES.items()}
+        atlas, rects = build_atlas(frames)
+        surface = pygame.transform.scale(atlas, (round(atlas.get_width() * scale), round(atlas.get_height() * scale)))
+
+    sheet = SpriteSheet(surface, rects, PLAYER_ANIMATIONS, scale)
+    _player_sheets[size] = sheet
+    return sheet
+
+
+def _benchmark(characters: int = 100, frames: int = 600, dt: float = 1 / 60):
+    size = (50, 50)
+    frames_by_name = {name: pygame.Surface((FRAME_SIZE, FRAME_SIZE), pygame.SRCALPHA) for name in PLAYER_FRAMES}
+    atlas, rects = build_atlas(frames_by_name)
+    scale = size[0] / FRAME_SIZE
+    sheet = SpriteSheet(pygame.transform.scale(atlas, (round(atlas.get_width() * scale),
+                                                       round(atlas.get_height() * scale))),
+                        rects, PLAYER_ANIMATIONS, scale)
+    target = pygame.Surface((800, 600), pygame.SRCALPHA)
+    positions = [((i * 37) % 750, (i * 53) % 550) for i in range(characters)]
+    directions = [DIRECTIONS[i % len(DIRECTIONS)] for i in range(characters)]
+    animators = [Animator(sheet, "walk", direction) for direction in directions]
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for animator, direction in zip(animators, directions):
+            animator.play("walk", direction)
+            animator.update(dt)
+    stepped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for animator, pos in zip(animators, positions):
+            animator.draw(target, pos)
+    drawn = time.perf_counter() - start
+
+    # The per-draw lookup every scene used before, frame index from a counter
+    start = time.perf_counter()
+    for frame in range(frames):
+        for direction in directions:
+            sheet.frame("walk", direction, int(frame * 1000 * dt // WALK_FRAME_MS))
+    looked_up = time.perf_counter() - start
+
+    print(f"{characters} walking characters, {frames} frames")
+    print(f"  Animator play+update  {stepped / frames * 1e6:8.1f} us/frame")
+    print(f"  SpriteSheet.frame     {looked_up / frames * 1e6:8.1f} us/frame")
+    print(f"  Animator draw         {drawn / frames * 1e6:8.1f} us/frame")
+
+
+if __name__ == "__main__":
+    _benchmark()
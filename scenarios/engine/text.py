@@ -0,0 +1,99 @@
+import pygame
+from typing import Dict, List, Tuple
+
+from engine.cache import SurfaceCache, surface_bytes
+from engine.fonts import LockedFont
+from engine.profiler import profiled
+
+MAX_LINE_CACHE_BYTES = 8 * 1024 * 1024  # Rendered line surfaces kept around
+MAX_WRAP_CACHE_CHARS = 256 * 1024  # Characters of wrapped text remembered
+
+# (text, font, max_width) -> wrapped lines, measured with Font.size only
+_wrap_cache = SurfaceCache(max_bytes=MAX_WRAP_CACHE_CHARS)
+# (text, font, color, max_width) -> rendered line surfaces; (text, font, color) -> one line
+_line_cache = SurfaceCache(max_bytes=MAX_LINE_CACHE_BYTES)
+
+
+def wrap_lines(text: str, font: LockedFont, max_width: int) -> Tuple[str, ...]:
+    """Split text into lines no wider than max_width (measured, never rendered; not cached)"""
+    words = text.split()
+    lines = []
+    current_line = []
+    current_width = 0
+
+    for word in words:
+        word_width = font.size(word + " ")[0]
+
+        if current_width + word_width <= max_width or not current_line:
+            current_line.append(word)
+            current_width += word_width
+        else:
+            lines.append(" ".join(current_line))
+            current_line = [word]
+            current_width = word_width
+
+    lines.append(" ".join(current_line))
+    return tuple(lines)
+
+
+def wrap_text(text: str, font: LockedFont, max_width: int) -> Tuple[str, ...]:
+    """wrap_lines(), remembered per (text, font, max_width)"""
+    key = (text, font, max_width)
+    lines = _wrap_cache.get(key)
+    if lines is None:
+        lines = wrap_lines(text, font, max_width)
+        _wrap_cache.put(key, lines, len(text))
+    return lines
+
+
+def render_text_wrapped(text: str, font: LockedFont, color: Tuple[int, int, int], max_width: int) -> List[pygame.Surface]:
+    """Rendered surfaces for each wrapped line, cached until evicted"""
+    key = (text, font, tuple(color), max_width)
+    surfaces = _line_cache.get(key)
+    if surfaces is not None:
+        return surfaces
+
+    can_convert = pygame.display.get_surface() is not None
+    surfaces = []
+    for line in wrap_text(text, font, max_width):
+        text_surface = font.render(line, True, color)
+        if can_convert:
+            text_surface = text_surface.convert_alpha()  # Match the display format once, not every blit
+        surfaces.append(text_surface)
+
+    _line_cache.put(key, surfaces, sum(surface_bytes(s) for s in surfaces))
+    return surfaces
+
+
+def render_line(text: str, font: LockedFont, color: Tuple[int, int, int]) -> pygame.Surface:
+    """One line of text (a HUD prompt, a button label) rendered once and cached until evicted"""
+    key = (text, font, tuple(color))
+    text_surface = _line_cache.get(key)
+    if text_surface is None:
+        text_surface = font.render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            text_surface = text_surface.convert_alpha()
+        _line_cache.put(key, text_surface, surface_bytes(text_surface))
+    return text_surface
+
+
+@profiled("draw.text")
+def draw_text_wrapped(surface: pygame.Surface, text: str, font: LockedFont, color: Tuple[int, int, int], x: int, y: int, max_width: int) -> int:
+    """Draw word-wrapped text and return the y coordinate below the last line"""
+    y_offset = y
+    line_height = font.get_height()
+    for text_surface in render_text_wrapped(text, font, color, max_width):
+        surface.blit(text_surface, (x, y_offset))
+        y_offset += line_height
+
+    return y_offset
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counters and memory use of the layout caches"""
+    return {"wrap": _wrap_cache.stats(), "lines": _line_cache.stats()}
+
+
+def clear_caches():
+    _wrap_cache.clear()
+    _line_cache.clear()
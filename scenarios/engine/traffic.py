@@ -0,0 +1,232 @@
+"""Array-backed traffic: hundreds of vehicles and pedestrians stepped with NumPy.
+
+Every agent is one row across parallel arrays (position, speed, heading,
+lane, target lane, ...), and a step is a fixed number of vectorized
+operations whatever the agent count. The road wraps around a world
+`world_width` pixels wide; a scene views it through a camera and only the
+agents inside the view are blitted.
+
+Benchmark the step and the culled draw with:
+
+    cd scenarios && python -m engine.traffic
+"""
+import time
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+VEHICLE, PEDESTRIAN = 0, 1
+
+# Vehicle driving model (pixels, seconds)
+VEHICLE_LENGTH = 40
+MIN_GAP = 8  # Bumper-to-bumper distance kept when stopped
+HEADWAY = 0.8  # Seconds of travel kept as a gap to the vehicle ahead
+ACCELERATION = 120
+BRAKING = 600
+OVERTAKE_RATE = 0.5  # Chance per second that a held-up vehicle heads for the other lane
+STROLL_RATE = 0.05  # Chance per second that a pedestrian drifts to the other row
+LATERAL_SPEED = 40  # Speed of lane changes
+MERGE_CLEARANCE = 2 * VEHICLE_LENGTH + MIN_GAP  # Free road needed beside a vehicle to change lanes
+CULL_MARGIN = 64  # Agents this far outside the view are still drawn (sprite widths)
+WALK_FRAME_MS = 150
+
+
+class Lane:
+    """One row of the road or a sidewalk: its y, travel direction and the lane a change leads to"""
+    __slots__ = ("y", "heading", "partner", "kind")
+
+    def __init__(self, y: float, heading: int, partner: int, kind: int = VEHICLE):
+        self.y = y
+        self.heading = heading  # +1 east, -1 west; pedestrian rows use 0 (either way)
+        self.partner = partner  # Index of the lane changes go to
+        self.kind = kind
+
+
+class Traffic:
+    """Vehicles and pedestrians on looping lanes, one array row per agent.
+
+    Vehicles occupy the first rows and follow the vehicle ahead in their lane:
+    each step they aim for the speed that keeps HEADWAY seconds of gap, and a
+    vehicle held below its desired speed may move to the partner lane if there is
+    room beside it, and is followed in the new lane from then on. Pedestrians
+    stroll at their own pace and now and then drift to the other row of their
+    sidewalk. Lane changes slide y towards the target lane's y; the agent
+    belongs to its new lane once it gets there.
+    """
+
+    def __init__(self, lanes: Sequence[Lane], world_width: float, vehicles: int, pedestrians: int,
+                 vehicle_speed: Tuple[float, float] = (80, 160), walking_speed: Tuple[float, float] = (20, 45),
+                 seed: int = 0):
+        self.world_width = float(world_width)
+        self.vehicle_count = vehicles
+        self.rng = np.random.default_rng(seed)
+        self.time = 0.0
+
+        self.lane_y = np.array([lane.y for lane in lanes], dtype=np.float32)
+        self.lane_partner = np.array([lane.partner for lane in lanes], dtype=np.int16)
+        road = [i for i, lane in enumerate(lanes) if lane.kind == VEHICLE]
+        walks = [i for i, lane in enumerate(lanes) if lane.kind == PEDESTRIAN]
+        lane_heading = np.array([lane.heading for lane in lanes], dtype=np.int8)
+
+        count = vehicles + pedestrians
+        rng = self.rng
+        self.kind = np.repeat(np.array([VEHICLE, PEDESTRIAN], dtype=np.int8), [vehicles, pedestrians])
+        self.lane = np.concatenate([np.resize(np.array(road, dtype=np.int16), vehicles),
+                                    rng.choice(np.array(walks, dtype=np.int16), pedestrians)])
+        self.target = self.lane.copy()
+        self.heading = lane_heading[self.lane].astype(np.float32)
+        walkers = self.kind == PEDESTRIAN
+        self.heading[walkers] = rng.choice(np.array([-1, 1], dtype=np.float32), pedestrians)
+
+        # Vehicles start evenly spread along their lane, with jitter; pedestrians anywhere
+        self.x = rng.uniform(0, self.world_width, count).astype(np.float32)
+        for lane in road:
+            rows = np.flatnonzero(self.lane == lane)
+            spacing = self.world_width / max(len(rows), 1)
+            self.x[rows] = (np.arange(len(rows)) * spacing
+                            + rng.uniform(0, max(spacing - VEHICLE_LENGTH - MIN_GAP, 0), len(rows)))
+        self.y = self.lane_y[self.lane].copy()
+
+        self.desired = np.where(walkers, rng.uniform(*walking_speed, count),
+                                rng.uniform(*vehicle_speed, count)).astype(np.float32)
+        self.speed = self.desired.copy()
+        self.variant = rng.integers(0, 1 << 16, count).astype(np.int32)  # Picks a sprite variant and gait phase
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def _follow(self, dt: float):
+        """Car following: each vehicle's speed tracks the safe speed for the gap ahead in its lane"""
+        n = self.vehicle_count
+        if not n:
+            return
+        width = self.world_width
+        lane = self.target[:n]  # A merging vehicle already counts in the lane it is moving to
+        along = self._along()
+        order = np.lexsort((along, lane))
+        sorted_lanes = lane[order]
+        first = np.searchsorted(sorted_lanes, sorted_lanes, side="left")
+        after = np.searchsorted(sorted_lanes, sorted_lanes, side="right")
+        ahead = np.arange(n) + 1
+        ahead = np.where(ahead < after, ahead, first)  # The lane loops: the front vehicle follows the last
+        leader = order[ahead]
+
+        gap = (along[leader] - along[order]) % width - VEHICLE_LENGTH
+        gap = np.where(leader == order, width, gap)  # Alone in the lane
+        safe = np.clip((gap - MIN_GAP) / HEADWAY, 0, None)
+        speed = self.speed[:n]
+        target = np.minimum(self.desired[:n][order], safe)
+        current = speed[order]
+        speed[order] = current + np.clip(target - current, -BRAKING * dt, ACCELERATION * dt)
+
+    def _along(self) -> np.ndarray:
+        """Vehicle positions measured in their lane's direction, so "ahead" is always further on"""
+        n = self.vehicle_count
+        return (self.x[:n] * self.heading[:n]) % self.world_width
+
+    def _room_to_merge(self, rows: np.ndarray) -> np.ndarray:
+        """Which of the vehicle `rows` have no vehicle beside them in their partner lane"""
+        along = self._along()
+        lanes = self.lane_partner[self.lane[rows]]
+        # Candidates x vehicles: only a handful of candidates per step
+        beside = self.target[:self.vehicle_count][None, :] == lanes[:, None]
+        half = self.world_width / 2
+        distance = np.abs((along[None, :] - along[rows][:, None] + half) % self.world_width - half)
+        return ~(beside & (distance < MERGE_CLEARANCE)).any(axis=1)
+
+    def step(self, dt: float):
+        self.time += dt
+        self._follow(dt)
+
+        # Lane changes: held-up vehicles try to overtake, pedestrians drift between rows
+        rng = self.rng
+        settled = self.lane == self.target
+        held_up = (self.kind == VEHICLE) & (self.speed < 0.6 * self.desired)
+        chance = np.where(held_up, OVERTAKE_RATE * dt, np.where(self.kind == PEDESTRIAN, STROLL_RATE * dt, 0.0))
+        change = np.flatnonzero(settled & (rng.random(len(self.x)) < chance))
+        vehicles = change[change < self.vehicle_count]
+        if len(vehicles):
+            change = np.concatenate([vehicles[self._room_to_merge(vehicles)], change[change >= self.vehicle_count]])
+        self.target[change] = self.lane_partner[self.lane[change]]
+
+        # Move along the lane, and sideways towards the target lane
+        self.x += self.heading * self.speed * dt
+        self.x %= self.world_width
+        dy = self.lane_y[self.target] - self.y
+        reach = LATERAL_SPEED * dt
+        self.y += np.clip(dy, -reach, reach)
+        arrived = np.abs(dy) <= reach
+        self.lane[arrived] = self.target[arrived]
+
+    def visible(self, left: float, width: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(rows, screen x) of agents within the view [left, left + width), back to front"""
+        screen_x = (self.x - left) % self.world_width
+        screen_x = np.where(screen_x > self.world_width - CULL_MARGIN, screen_x - self.world_width, screen_x)
+        rows = np.flatnonzero(screen_x < width + CULL_MARGIN)
+        rows = rows[np.argsort(self.y[rows], kind="stable")]  # Lower on screen is drawn on top
+        return rows, screen_x[rows]
+
+    def sprite_ids(self, rows: np.ndarray, vehicle_variants: int) -> np.ndarray:
+        """Index into the sprite list built by traffic_sprites() for each of `rows`"""
+        variant = self.variant[rows]
+        east = (self.heading[rows] > 0).astype(np.int32)
+        vehicles = (variant % vehicle_variants) * 2 + east
+        step = int(self.time * 1000 // WALK_FRAME_MS)
+        pedestrians = vehicle_variants * 2 + east * 2 + (variant + step) % 2
+        return np.where(self.kind[rows] == VEHICLE, vehicles, pedestrians)
+
+    def draw(self, screen, left: float, sprites: List[pygame.Surface], vehicle_variants: int) -> int:
+        """Blit the agents in view of a camera at world x `left`; returns how many were drawn"""
+        rows, screen_x = self.visible(left, screen.get_width())
+        ids = self.sprite_ids(rows, vehicle_variants).tolist()
+        ys = self.y[rows].tolist()
+        screen.blits([(sprites[i], (int(x), int(y))) for i, x, y in zip(ids, screen_x.tolist(), ys)])
+        return len(rows)
+
+
+def traffic_sprites(car: pygame.Surface, tints: Sequence[Tuple[int, int, int]],
+                    walk_left: Sequence[pygame.Surface], walk_right: Sequence[pygame.Surface]) -> List[pygame.Surface]:
+    """Sprite list in the order Traffic.sprite_ids() indexes it.
+
+    Per tint: the car facing west, then east (car is drawn facing west);
+    then two walking frames west and two east.
+    """
+    sprites = []
+    for tint in tints:
+        tinted = car.copy()
+        tinted.fill((*tint, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        sprites += [tinted, pygame.transform.flip(tinted, True, False)]
+    return sprites + list(walk_left[:2]) + list(walk_right[:2])
+
+
+def _benchmark(counts: Sequence[int] = (500, 5000), steps: int = 600, dt: float = 1 / 120):
+    lanes = [Lane(330, -1, 1), Lane(350, -1, 0), Lane(376, 1, 3), Lane(398, 1, 2),
+             Lane(298, 0, 5, PEDESTRIAN), Lane(306, 0, 4, PEDESTRIAN),
+             Lane(424, 0, 7, PEDESTRIAN), Lane(432, 0, 6, PEDESTRIAN)]
+    car = pygame.Surface((VEHICLE_LENGTH, 20), pygame.SRCALPHA)
+    car.fill((200, 200, 200))
+    walker = pygame.Surface((20, 20), pygame.SRCALPHA)
+    sprites = traffic_sprites(car, [(255, 80, 80), (80, 160, 255)], [walker] * 2, [walker] * 2)
+    screen = pygame.Surface((800, 600))
+    for count in counts:
+        traffic = Traffic(lanes, 32 * count, vehicles=count * 3 // 5, pedestrians=count - count * 3 // 5)
+        start = time.perf_counter()
+        for _ in range(steps):
+            traffic.step(dt)
+        stepped = time.perf_counter() - start
+
+        drawn = 0
+        start = time.perf_counter()
+        for i in range(steps // 2):
+            drawn += traffic.draw(screen, i * 5.0, sprites, 2)
+        culled = time.perf_counter() - start
+
+        print(f"{count} agents ({traffic.vehicle_count} vehicles) on a {traffic.world_width:.0f} px loop")
+        print(f"  step           {stepped / steps * 1e6:8.1f} us")
+        print(f"  draw (culled)  {culled / (steps // 2) * 1e6:8.1f} us  ({drawn / (steps // 2):.0f} agents in view)")
+        print(f"  frame budget   {(2 * stepped / steps + culled / (steps // 2)) * 1000:8.2f} ms at 120 updates/s, 60 FPS")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,182 @@
+"""Chunked world for long scrolling levels.
+
+The level is cut into vertical strips (chunks) of a fixed width. Only the
+chunks under the camera, plus a few either side, are kept active; each holds
+the ids of the entities inside it, so queries only look at those. Chunks that
+scroll out of range move to a byte-bounded LRU so walking back is cheap, and
+fall out of memory once its budget is spent; the budget covers only those
+recently left chunks, not the active ones. Per-frame work depends on the view
+size, not on the length of the level.
+
+Benchmark a long corridor with:
+
+    cd scenarios && python -m engine.world
+"""
+import bisect
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from engine.cache import SurfaceCache
+
+Point = Tuple[float, float]
+
+CHUNK_WIDTH = 400  # Pixels; half a screen, so a view spans three chunks at most
+PRELOAD_CHUNKS = 1  # Chunks kept active beyond each edge of the view
+MEMORY_BUDGET = 8 * 1024 * 1024  # Bytes of recently left chunks kept for walking back (active chunks not counted)
+
+
+class Chunk:
+    __slots__ = ("index", "left", "entities")
+
+    def __init__(self, index: int, left: int, entities: List[int]):
+        self.index = index
+        self.left = left  # World x of the chunk's left edge
+        self.entities = entities  # Ids (indexes into the world's points) inside the chunk
+
+    def size(self) -> int:
+        """Bytes held by the chunk, as charged against the memory budget once it leaves the view"""
+        return sys.getsizeof(self.entities)
+
+
+class ChunkedWorld:
+    """Entities of a level, streamed in chunks around the camera.
+
+    Entities are points in world coordinates, identified by their index in
+    `points`. Call stream() with the camera's world span once per update,
+    then query visible() / nearest(); queries only look at active chunks.
+    """
+
+    def __init__(self, points: Sequence[Point], chunk_width: int = CHUNK_WIDTH, length: Optional[float] = None,
+                 preload: int = PRELOAD_CHUNKS, memory_budget: int = MEMORY_BUDGET):
+        self.points = list(points)
+        self.chunk_width = chunk_width
+        self.preload = preload
+        if length is None:
+            length = max((x for x, _ in self.points), default=0) + 1
+        self.chunk_count = max(1, -(-int(length) // chunk_width))
+
+        # Entity ids sorted by x, so a chunk's entities are one bisect away
+        self._order = sorted(range(len(self.points)), key=lambda i: self.points[i][0])
+        self._xs = [self.points[i][0] for i in self._order]
+
+        self.active: Dict[int, Chunk] = {}
+        self._recent = SurfaceCache(memory_budget)  # Chunks that left the view, least recent first
+        self._range = (0, 0)
+
+        # Statistics
+        self.loads = 0  # Chunks built from scratch
+
+    def chunk_index(self, x: float) -> int:
+        return int(x // self.chunk_width)
+
+    def _build(self, index: int) -> Chunk:
+        left = index * self.chunk_width
+        first = bisect.bisect_left(self._xs, left)
+        last = bisect.bisect_left(self._xs, left + self.chunk_width)
+        self.loads += 1
+        return Chunk(index, left, self._order[first:last])
+
+    def stream(self, left: float, width: float):
+        """Make the chunks around [left, left + width) active and retire the rest"""
+        first = max(0, self.chunk_index(left) - self.preload)
+        last = min(self.chunk_count, self.chunk_index(left + width - 1) + self.preload + 1)
+        if (first, last) == self._range:
+            return
+        self._range = (first, last)
+
+        for index in [index for index in self.active if not first <= index < last]:
+            chunk = self.active.pop(index)
+            self._recent.put(index, chunk, chunk.size())
+        for index in range(first, last):
+            if index not in self.active:
+                chunk = self._recent.get(index)
+                if chunk is None:
+                    chunk = self._build(index)
+                else:
+                    self._recent.discard(index)
+                self.active[index] = chunk
+
+    def _chunks_in(self, left: float, right: float) -> List[Chunk]:
+        active = self.active
+        return [active[index] for index in range(self.chunk_index(left), self.chunk_index(right) + 1)
+                if index in active]
+
+    def visible(self, left: float, top: float, width: float, height: float) -> List[int]:
+        """Active entities whose position lies inside the rect, e.g. the camera view"""
+        right, bottom = left + width, top + height
+        points = self.points
+        found = []
+        for chunk in self._chunks_in(left, right):
+            for item in chunk.entities:
+                px, py = points[item]
+                if left <= px < right and top <= py < bottom:
+                    found.append(item)
+        return found
+
+    def nearest(self, x: float, y: float, radius: float) -> Optional[int]:
+        """Closest active entity strictly within radius of (x, y), or None"""
+        best, best_sq = None, radius * radius
+        points = self.points
+        for chunk in self._chunks_in(x - radius, x + radius):
+            for item in chunk.entities:
+                px, py = points[item]
+                distance_sq = (px - x) ** 2 + (py - y) ** 2
+                if distance_sq < best_sq:
+                    best, best_sq = item, distance_sq
+        return best
+
+    def memory_used(self) -> int:
+        """Bytes held by active chunks and the recently left ones (only the latter are budgeted)"""
+        return sum(chunk.size() for chunk in self.active.values()) + self._recent.bytes_used
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "active": len(self.active),
+            "recent": len(self._recent),
+            "loads": self.loads,
+            "evictions": self._recent.evictions,
+            "bytes": self.memory_used(),
+        }
+
+
+def _benchmark(stations: int = 4000, spacing: int = 400, frames: int = 4000, step: float = 200):
+    width, height = 800, 600
+    points = [(i * spacing + 200, 150 + (i * 97) % 300) for i in range(stations)]
+
+    world = ChunkedWorld(points, memory_budget=16 * 1024)
+    length = stations * spacing
+    x_offset, direction = 0.0, -1  # Walk to the end of the corridor and back
+    peak_bytes = 0
+    timings: List[float] = []
+    scanned = 0.0
+    for n in range(frames):
+        start = time.perf_counter()
+        world.stream(-x_offset, width)
+        world.visible(-x_offset, 0, width, height)
+        world.nearest(-x_offset + width / 2, height / 2, 60)
+        timings.append(time.perf_counter() - start)
+        peak_bytes = max(peak_bytes, world.memory_used())
+        if n % 40 == 0:
+            # The same queries over every station in the level
+            start = time.perf_counter()
+            left, x, y = -x_offset, -x_offset + width / 2, height / 2
+            [i for i, (px, py) in enumerate(points) if left <= px < left + width and 0 <= py < height]
+            min((((px - x) ** 2 + (py - y) ** 2, i) for i, (px, py) in enumerate(points)), default=None)
+            scanned += (time.perf_counter() - start) * 40
+        x_offset += direction * step  # Fast-forward: a second of walking per frame
+        if -x_offset > length - width or x_offset > 0:
+            direction = -direction
+
+    quarter = len(timings) // 4
+    stats = world.stats()
+    print(f"{stations} stations over {length} px, {world.chunk_count} chunks of {world.chunk_width} px, {frames} frames")
+    print(f"  chunks built       {stats['loads']:8d}  (evicted {stats['evictions']})")
+    print(f"  peak memory        {peak_bytes / 1024:8.1f} KiB")
+    print(f"  frame (first 1/4)  {sum(timings[:quarter]) / quarter * 1e6:8.1f} us")
+    print(f"  frame (last 1/4)   {sum(timings[-quarter:]) / quarter * 1e6:8.1f} us")
+    print(f"  scanning all       {scanned / frames * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    _benchmark()
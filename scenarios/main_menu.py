@@ -1,43 +1,33 @@
+import importlib
 import pygame
-import sys
-import os
-import subprocess
 
-# Initialize Pygame
-pygame.init()
+from engine.assets import assets
+from engine.fonts import font
+from engine.input import any_held
+from engine.loader import Load, loading_screen
+from engine.scenes import Scene, SceneManager
+from engine.spatial import SpatialHash
+from engine.sprites import Animator, player_sheet
+from engine.text import render_line
 
 # Screen settings
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Main Menu - Character Model")
 
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 NPC_COLOR = (180, 100, 50)
 HUD_COLOR = (0, 0, 0, 180)  # Semi-transparent black for HUD background
+PROMPT_FONT = 36
 
 # Player settings
 player_pos = [100, HEIGHT // 1.4]  # Fixed y-position at HEIGHT // 1.4
-player_speed = 0.1
+player_speed = 150  # Pixels per second
 player_size = (50, 50)
-HORIZONTAL_SPEED = 0.1  # Horizontal movement speed
+HORIZONTAL_SPEED = 150  # Horizontal movement speed in pixels per second
 
-# Load Sprites for each direction
-player_sprite_right_1 = pygame.image.load('./images/walk_right_1.png').convert_alpha()
-player_sprite_right_2 = pygame.image.load('./images/walk_right_2.png').convert_alpha()
-player_sprite_left_1 = pygame.image.load('./images/walk_left_1.png').convert_alpha()
-player_sprite_left_2 = pygame.image.load('./images/walk_left_2.png').convert_alpha()
-
-# Scale the images to the size of the player
-player_sprite_right_1 = pygame.transform.scale(player_sprite_right_1, player_size)
-player_sprite_right_2 = pygame.transform.scale(player_sprite_right_2, player_size)
-player_sprite_left_1 = pygame.transform.scale(player_sprite_left_1, player_size)
-player_sprite_left_2 = pygame.transform.scale(player_sprite_left_2, player_size)
-
-# Load the background image and scale it to fit the screen size
-background_image = pygame.image.load("./images/main_menu_background2.jpg").convert()
-background_image = pygame.transform.scale(background_image, (WIDTH, HEIGHT))  # Scale the background
+# Background image, scaled to fit the screen size when the menu is entered
+BACKGROUND_IMAGE = "images/main_menu_background2.jpg"
 
 # NPC settings (transparent NPC)
 npc_sprite = pygame.Surface((50, 50), pygame.SRCALPHA)  # Transparent surface
@@ -49,12 +39,14 @@ npc_positions = [
     (330, HEIGHT // 1.4),  # Second NPC at x = 220 (50 pixels to the right of the first)
     (580, HEIGHT // 1.4),  # Third NPC at x = 270 (50 pixels to the right of the second)
 ]
-
-# Map NPCs to their corresponding files
-npc_files = {
-    "office": "office.py",
-    "police": "police.py",
-    "tutorial": "tutorial.py",
+npc_index = SpatialHash.from_points(npc_positions)
+INTERACTION_RADIUS = 60  # How close the player must be to interact with an NPC
+
+# Map NPCs to the scene they open: (module, scene class)
+npc_scenes = {
+    "office": ("office", "OfficeScene"),
+    "police": ("police", "PoliceScene"),
+    "tutorial": ("tutorial", "TutorialScene"),
 }
 
 # Create the player class
@@ -64,111 +56,97 @@ class Player:
         self.y = y  # Fixed at HEIGHT // 1.4
         self.size = player_size
         self.speed = player_speed
-        self.sprite = player_sprite_right_1  # Default to facing right
-        self.frame_counter = 0  # To control animation frames
-        self.walking_speed = 300  # Set to a very high number to slow down sprite switching
-        self.animation_timer = 0  # Timer to control sprite switching speed
+        self.direction = "right"  # Default to facing right
+        # Walking frames for each direction, scaled to the player size; shown in time with the clip
+        self.animation = Animator(player_sheet(player_size), "walk", self.direction)
 
     def move(self, dx: float):
         self.x += dx
 
-    def update_sprite(self, keys):
-        self.animation_timer += 1  # Increment the animation timer
-
+    def update_sprite(self, keys, dt: float):
         # Right movement
         if keys[pygame.K_RIGHT]:
-            if self.animation_timer >= self.walking_speed:  # After every 'walking_speed' frames
-                self.sprite = player_sprite_right_1 if self.frame_counter % 2 == 0 else player_sprite_right_2
-                self.frame_counter += 1
-                self.animation_timer = 0  # Reset the timer after switching the sprite
-            self.move(HORIZONTAL_SPEED)  # Move right
+            self.direction = "right"
+            self.move(HORIZONTAL_SPEED * dt)  # Move right
 
         # Left movement
         elif keys[pygame.K_LEFT]:
-            if self.animation_timer >= self.walking_speed:  # After every 'walking_speed' frames
-                self.sprite = player_sprite_left_1 if self.frame_counter % 2 == 0 else player_sprite_left_2
-                self.frame_counter += 1
-                self.animation_timer = 0  # Reset the timer after switching the sprite
-            self.move(-HORIZONTAL_SPEED)  # Move left
+            self.direction = "left"
+            self.move(-HORIZONTAL_SPEED * dt)  # Move left
+
+        # Standing still holds the current walking frame
+        else:
+            return
+        self.animation.play("walk", self.direction)
+        self.animation.update(dt)
 
     def draw(self, surface: pygame.Surface):
-        surface.blit(self.sprite, (self.x, self.y))
-
-# Check if player is close enough to interact with NPC
-def check_npc_interaction(player_x: float, player_y: float, npc_x: float, npc_y: float) -> bool:
-    distance = ((player_x - npc_x) ** 2 + (player_y - npc_y) ** 2) ** 0.5
-    return distance < 60
-
-# Function to open the corresponding Python file for the NPC
-def open_npc_file(npc_name: str):
-    npc_file = npc_files.get(npc_name)
-    if npc_file:
-        current_directory = os.path.dirname(os.path.abspath(__file__))
-        npc_path = os.path.join(current_directory, npc_file)
-        
-        # Use the full path to the Python executable
-        python_executable = sys.executable
-        
-        try:
-            subprocess.run([python_executable, npc_path])  # Run the NPC file using the specified Python executable
-        except Exception as e:
-            print(f"Error running NPC file: {e}")
-
-# Create a function to handle menu interactions
-def main_menu():
-    player = Player(player_pos[0], player_pos[1])
-
-    # Main loop for the menu
-    running = True
-    while running:
-        screen.fill(WHITE)
-
-        # Draw the background image
-        screen.blit(background_image, (0, 0))
-
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        keys = pygame.key.get_pressed()
+        self.animation.draw(surface, (self.x, self.y))
+
+# Build the scene for an NPC, importing its module on first use
+def open_npc_scene(npc_name: str) -> Scene:
+    module_name, class_name = npc_scenes[npc_name]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)()
+
+class MainMenuScene(Scene):
+    caption = "Main Menu - Character Model"
+
+    def preload(self):
+        return [Load(BACKGROUND_IMAGE, (WIDTH, HEIGHT))]
+
+    def enter(self):
+        self.background_image = assets.image(BACKGROUND_IMAGE, (WIDTH, HEIGHT))
+        self.player = Player(player_pos[0], player_pos[1])
+        self.nearby_npc = None  # Index of the NPC the player is standing at
+
+    def handle_event(self, event: pygame.event.Event):
+        # Handle interaction when SPACE is pressed (once per key press, not while held)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE and self.nearby_npc is not None:
+            npc_name = list(npc_scenes.keys())[self.nearby_npc]
+            self.manager.push(loading_screen(open_npc_scene(npc_name)))  # Progress screen while its images decode
+
+    def is_idle(self) -> bool:
+        # The player only walks (and animates) while an arrow key is held
+        return not any_held(self.manager.input.get_pressed(), (pygame.K_LEFT, pygame.K_RIGHT))
+
+    def update(self, dt: float):
+        keys = self.manager.input.get_pressed()
 
         # Update player sprite and movement
-        player.update_sprite(keys)
+        self.player.update_sprite(keys, dt)
 
-        # Draw the player
-        player.draw(screen)
+        # Check if player is close enough to interact with an NPC
+        self.nearby_npc = npc_index.nearest(self.player.x, self.player.y, INTERACTION_RADIUS)
+
+    def draw(self, screen: pygame.Surface):
+        # Draw the background image (restores only last frame's dirty regions)
+        screen.clear(self.background_image)
 
-        # Draw and handle all NPCs (now transparent)
-        for i, (npc_x, npc_y) in enumerate(npc_positions):
-            if check_npc_interaction(player.x, player.y, npc_x, npc_y):
-                # Show interaction message with HUD
-                font = pygame.font.Font(None, 36)
-                prompt_text = font.render("Press SPACE to interact", True, WHITE)  # Text color changed to white
+        # Draw the player
+        self.player.draw(screen)
 
-                # Create a background HUD for the text
-                text_width = prompt_text.get_width()
-                text_height = prompt_text.get_height()
-                hud_width = text_width + 30  # Add more padding around the text
-                hud_height = text_height + 30  # Increase padding to cover the bottom part of the text
+        if self.nearby_npc is not None:
+            # Show interaction message with HUD
+            prompt_text = render_line("Press SPACE to interact", font(PROMPT_FONT), WHITE)  # Text color changed to white
 
-                # Draw HUD background (semi-transparent black)
-                pygame.draw.rect(screen, HUD_COLOR, (WIDTH // 2 - hud_width // 2, HEIGHT - 50 - hud_height // 2, hud_width, hud_height))
+            # Create a background HUD for the text
+            text_width = prompt_text.get_width()
+            text_height = prompt_text.get_height()
+            hud_width = text_width + 30  # Add more padding around the text
+            hud_height = text_height + 30  # Increase padding to cover the bottom part of the text
 
-                # Draw the text
-                screen.blit(prompt_text, (WIDTH // 2 - prompt_text.get_width() // 2, HEIGHT - 63))
+            # Draw HUD background (semi-transparent black)
+            screen.fill(HUD_COLOR, (WIDTH // 2 - hud_width // 2, HEIGHT - 50 - hud_height // 2, hud_width, hud_height))
 
-                # Handle interaction when SPACE is pressed
-                if keys[pygame.K_SPACE]:
-                    npc_name = list(npc_files.keys())[i]
-                    open_npc_file(npc_name)
+            # Draw the text
+            screen.blit(prompt_text, (WIDTH // 2 - prompt_text.get_width() // 2, HEIGHT - 63))
 
-            # Draw the transparent NPC (no visible color, still interacts)
+        # Draw the transparent NPCs (no visible color, still interact)
+        for npc_x, npc_y in npc_positions:
             screen.blit(npc_sprite, (npc_x, npc_y))
 
-        pygame.display.flip()
-
 # Run the main menu
 if __name__ == "__main__":
-    main_menu()
+    SceneManager().run(loading_screen(MainMenuScene()))
+    pygame.quit()
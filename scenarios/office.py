@@ -1,13 +1,23 @@
 import pygame
-import sys
-from typing import Dict, List, Tuple
-
-pygame.init()
+from typing import Tuple
+
+from engine.assets import assets
+from engine.collision import EXIT, CollisionWorld
+from engine.content import Law, load_pack
+from engine.fonts import font
+from engine.input import any_held
+from engine.loader import Load, loading_screen
+from engine.panels import get_panel
+from engine.profiler import profiler
+from engine.progress import ANSWER, VISIT
+from engine.quiz import Quiz
+from engine.scenes import Scene, SceneManager
+from engine.spatial import camera_rect
+from engine.sprites import Animator, movement_state, player_sheet
+from engine.text import draw_text_wrapped, render_line
 
 # Screen settings
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Canadian Law For Employees")
 
 # Colors
 WHITE = (255, 255, 255)
@@ -20,108 +30,20 @@ DIALOGUE_BOX_COLOR = (0, 0, 0, 128)
 HUD_COLOR = (0, 0, 0, 180)
 
 # Player settings
-player_pos = [350, HEIGHT // 2]
-player_speed = 0.1
+player_pos = (350, HEIGHT // 2)  # Starting position
+player_speed = 200  # Pixels per second
 player_size = (75,75)
-VERTICAL_SPEED = 0.1  # Added vertical speed
+VERTICAL_SPEED = 200  # Pixels per second
 npc_size = (25,25)
 
-# Load Sprites
-player_sprite_down = pygame.image.load('./images/look_down.png').convert_alpha()
-player_sprite_left = pygame.image.load('./images/look_left.png').convert_alpha()
-player_sprite_right = pygame.image.load('./images/look_right.png').convert_alpha()
-player_sprite_up = pygame.image.load('./images/look_up.png').convert_alpha()
-
-player_walk_down_1 = pygame.image.load('./images/walk_down_1.png').convert_alpha()
-player_walk_down_2 = pygame.image.load('./images/walk_down_2.png').convert_alpha()
-player_walk_left_1 = pygame.image.load('./images/walk_left_1.png').convert_alpha()
-player_walk_left_2 = pygame.image.load('./images/walk_left_2.png').convert_alpha()
-player_walk_right_1 = pygame.image.load('./images/walk_right_1.png').convert_alpha()
-player_walk_right_2 = pygame.image.load('./images/walk_right_2.png').convert_alpha()
-player_walk_up_1 = pygame.image.load('./images/walk_up_1.png').convert_alpha()
-player_walk_up_2 = pygame.image.load('./images/walk_up_2.png').convert_alpha()
-
-# Scale the images to the size of the player
-player_sprite_down = pygame.transform.scale(player_sprite_down, player_size)
-player_sprite_left = pygame.transform.scale(player_sprite_left, player_size)
-player_sprite_right = pygame.transform.scale(player_sprite_right, player_size)
-player_sprite_up = pygame.transform.scale(player_sprite_up, player_size)
-
-player_walk_down_1 = pygame.transform.scale(player_walk_down_1, player_size)
-player_walk_down_2 = pygame.transform.scale(player_walk_down_2, player_size)
-player_walk_left_1 = pygame.transform.scale(player_walk_left_1, player_size)
-player_walk_left_2 = pygame.transform.scale(player_walk_left_2, player_size)
-player_walk_right_1 = pygame.transform.scale(player_walk_right_1, player_size)
-player_walk_right_2 = pygame.transform.scale(player_walk_right_2, player_size)
-player_walk_up_1 = pygame.transform.scale(player_walk_up_1, player_size)
-player_walk_up_2 = pygame.transform.scale(player_walk_up_2, player_size)
-
-npc_image = pygame.image.load('./images/document.png').convert_alpha()
-npc_image = pygame.transform.scale(npc_image, npc_size)
+# Images, loaded and scaled when a level is entered
+NPC_IMAGE = "images/document.png"
+BACKGROUND_IMAGE = "images/office.png"
+BOSS_BACKGROUND_IMAGE = "images/office-boss.png"
 
 npc_sprite = pygame.Surface((50, 50))
 npc_sprite.fill(NPC_COLOR)
 
-# Load the background and image and scale it to fit the screen size
-background_image = pygame.image.load("./images/office.png").convert()
-
-background_image = pygame.transform.scale(background_image, (WIDTH, HEIGHT))  # Scale the background
-
-# Law NPCs with detailed information
-laws_info = [
-    {
-        "title": "Employment Standards",
-        "description": "The Employment Standards Act sets out the basic rights of workers in the workplace, including hours of work, wages, and termination.",
-        "details": [
-            "• Employees are entitled to minimum wage and overtime pay for hours worked beyond the standard workweek.",
-            "• Employers must provide notice or severance pay when terminating an employee without cause.",
-            "• Employees are entitled to paid vacation and rest periods.",
-            "• Termination and dismissal rules are outlined, and employees are entitled to written notice."
-        ]
-    },
-    {
-        "title": "Anti-Discrimination",
-        "description": "The Canadian Human Rights Act prohibits discrimination in the workplace on the basis of various protected grounds, including race, age, gender, and disability.",
-        "details": [
-            "• Discrimination based on age, race, gender, or disability is prohibited in employment practices.",
-            "• Employees are entitled to reasonable accommodation for disabilities or family responsibilities.",
-            "• Employers cannot treat employees unfairly based on personal characteristics like gender, race, or sexual orientation.",
-            "• Includes protection against harassment and bullying in the workplace."
-        ]
-    },
-    {
-        "title": "Occupational Health and Safety",
-        "description": "The Occupational Health and Safety Act requires employers to provide a safe working environment and protect employees from workplace hazards.",
-        "details": [
-            "• Employees have the right to refuse unsafe work without fear of retaliation.",
-            "• Employers must provide necessary safety equipment and conduct safety training.",
-            "• Workplace incidents or injuries must be reported and investigated.",
-            "• Employees are entitled to workers' compensation benefits in case of workplace injury or illness."
-        ]
-    },
-    {
-        "title": "Employment Insurance (EI)",
-        "description": "Employment Insurance (EI) benefits provide temporary financial assistance to workers who lose their job or are unable to work due to illness or family responsibilities.",
-        "details": [
-            "• Employees who lose their job through no fault of their own are entitled to EI benefits.",
-            "• Employees can receive EI benefits during maternity or parental leave.",
-            "• Employees are eligible for sickness benefits under EI if they are unable to work due to illness.",
-            "• EI benefits are based on a worker’s insurable earnings and the duration of employment."
-        ]
-    },
-    {
-        "title": "Union Rights",
-        "description": "Employees in Canada have the right to join unions and engage in collective bargaining without fear of retaliation from employers.",
-        "details": [
-            "• Employees are legally protected if they form or join a union.",
-            "• Employers cannot fire, demote, or discriminate against employees for union activities.",
-            "• Unionized employees have the right to negotiate wages, benefits, and working conditions collectively.",
-            "• Collective agreements ensure better protection for union members in areas like dispute resolution."
-        ]
-    }
-]
-
-
 # NPC positions with varied y positions
 npc_positions = [
     (190, HEIGHT // 2 - 140),
@@ -130,45 +52,15 @@ npc_positions = [
     (80, HEIGHT // 2 + 10),
     (710, HEIGHT // 2 + 115)
 ]
+INTERACTION_RADIUS = 60  # How close the player must be to interact with an NPC
 
-# Scenario-based quiz questions
-scenarios = [
-    {
-        "scenario": "David has been working at a company for 5 years. One day, his manager informs him that his position is being eliminated due to 'restructuring,' even though David’s performance has been excellent. David is not given any severance pay or notice",
-        "question": "Is David entitled to severance phoay or notice under Canadian law?",
-        "answer": "yes",
-        "explanation": "Under the Canadian Employment Standards, employees are generally entitled to notice or severance pay if terminated without cause, especially if they have been employed for a certain period (usually more than 3 months)."
-    },
-    {
-        "scenario": "Emily is a qualified worker who has been with her company for over 10 years. Her employer begins promoting younger employees, and she is passed over for a promotion despite having more experience and qualifications. She suspects this is because of her age.",
-        "question": "Is Emily’s situation considered workplace discrimination under Canadian law?",
-        "answer": "yes",
-        "explanation": "Discrimination based on age is prohibited under the Canadian Human Rights Act. Employees cannot be denied opportunities based on factors such as age, race, gender, or disability."
-    },
-    {
-        "scenario": "John works overtime hours regularly at his job, but his employer never compensates him for the extra hours worked, despite him mentioning it multiple times.",
-        "question": "Is this practice legal under Canadian labor law?",
-        "answer": "no",
-        "explanation": "Under Canadian law, employees must be paid for all hours worked, including overtime. If the employer does not pay for overtime hours, this constitutes wage theft and is against the law."
-    },
-    {
-        "scenario": "Marie has been subjected to verbal harassment from a coworker. She feels uncomfortable and has reported the issue to HR, but no action has been taken. The harassment continues.",
-        "question": "Is Marie’s employer legally required to address her harassment complaint?",
-        "answer": "yes",
-        "explanation": "Under Canadian law, employers have a legal duty to provide a safe workplace, free from harassment. They are required to take action to investigate and address harassment claims promptly."
-    },
-    {
-        "scenario": "Employees at a manufacturing plant want to form a union to negotiate better wages and working conditions. The employer threatens to fire anyone who supports the union.",
-        "question": "Is it legal for the employer to threaten employees for supporting unionization?",
-        "answer": "no",
-        "explanation": "Under Canadian law, employees have the right to join and form unions without fear of retaliation or discrimination. Employers cannot threaten or punish employees for union activities."
-    }
-]
+# Law NPC text and quiz questions, one law per NPC position (data/content/office.json)
+CONTENT_PACK = "office"
 
-# Font settings
-title_font = pygame.font.Font(None, 48)
-main_font = pygame.font.Font(None, 36)
-detail_font = pygame.font.Font(None, 24)
+# Font sizes (the fonts are created on first use)
+TITLE_FONT = 48
+MAIN_FONT = 36
+DETAIL_FONT = 24
 
 class Button:
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: Tuple[int, int, int]):
@@ -179,8 +71,8 @@ class Button:
 
     def draw(self, surface: pygame.Surface):
         color = (min(self.color[0] + 20, 255), min(self.color[1] + 20, 255), min(self.color[2] + 20, 255)) if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect)
-        text_surface = main_font.render(self.text, True, WHITE)
+        surface.fill(color, self.rect)
+        text_surface = render_line(self.text, font(MAIN_FONT), WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -193,325 +85,312 @@ class Button:
         return False
 
 
-def draw_text_wrapped(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int], x: int, y: int, max_width: int) -> int:
-    words = text.split()
-    lines = []
-    current_line = []
-    current_width = 0
-    
-    for word in words:
-        word_surface = font.render(word + " ", True, color)
-        word_width = word_surface.get_width()
-        
-        if current_width + word_width <= max_width:
-            current_line.append(word)
-            current_width += word_width
-        else:
-            lines.append(" ".join(current_line))
-            current_line = [word]
-            current_width = word_width
-    
-    lines.append(" ".join(current_line))
-    
-    y_offset = y
-    for line in lines:
-        text_surface = font.render(line, True, color)
-        surface.blit(text_surface, (x, y_offset))
-        y_offset += font.get_height()
-    
-    return y_offset
-
-def check_npc_interaction(player_x: float, player_y: float, npc_x: float, npc_y: float) -> bool:
-    """Check if player is close enough to interact with NPC"""
-    distance = ((player_x - npc_x) ** 2 + (player_y - npc_y) ** 2) ** 0.5
-    return distance < 60
-
-def office_level():
-    in_office = True
-    showing_details = False
-    current_details = None
-    player_x_offset = 0
-    visited_npcs = set()  # Track which NPCs have been visited
-    walking_animation_frame = 0
-    last_update_time = pygame.time.get_ticks()
-    space_pressed = False  # New flag to track space bar interaction
-
-    # Initialize the exit button outside the loop
-    exit_x = WIDTH - 150  # Button width is 150
-    exit_y = HEIGHT - 50  # Button height is 50
-
-    # Create the exit button (initially set to "Exit")
-    exit_button = Button(exit_x, exit_y, 150, 50, "Exit", RED)
-
-    while in_office:
-        screen.fill(WHITE)
-        screen.blit(background_image, (0, 0))
-
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and current_details is not None:
-                    # Space pressed to show details
-                    showing_details = not showing_details
-                    if current_details is not None and not showing_details:
-                        # The index of the NPC in the `laws_info` list
-                        npc_index = laws_info.index(current_details)
-                        if npc_index not in visited_npcs:
-                            visited_npcs.add(npc_index)
-                            space_pressed = True
-                elif event.key == pygame.K_ESCAPE:
-                    showing_details = False
-            elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
-                # Handle the button event
-                if exit_button.handle_event(event):
-                    if exit_button.text == "Exit":
-                        pygame.quit()
-                        sys.exit()
-                    elif exit_button.text == "Next Level":
-                        # Handle the next level logic
-                        quiz()  # Or proceed to the next level
-
-        # Movement controls with boundary checking
-        if not showing_details:
-            keys = pygame.key.get_pressed()
+# Legal info box placement
+INFO_X = 50
+INFO_Y = HEIGHT // 4  # Center the box vertically
+INFO_WIDTH = WIDTH - 100  # Width of the info box
+INFO_HEIGHT = 320  # Height of the info box
+
+def law_panel(details: Law) -> pygame.Surface:
+    """Semi-transparent info box with a law's text, rendered once"""
+    def build() -> pygame.Surface:
+        # Tall enough for text that runs past the bottom of the box
+        panel = pygame.Surface((INFO_WIDTH, HEIGHT - INFO_Y), pygame.SRCALPHA)
+
+        # Fill the box with a semi-transparent black (you can adjust the alpha value for transparency)
+        panel.fill((0, 0, 0, 128), (0, 0, INFO_WIDTH, INFO_HEIGHT))  # (R, G, B, A), where A is the alpha (transparency)
+
+        # Draw the title and description with more space in between
+        y_offset = draw_text_wrapped(panel, details.title, font(TITLE_FONT), WHITE, 10, 10, INFO_WIDTH - 20)
+
+        # Add additional vertical space (increase this value for more spacing)
+        y_offset += 20  # Space between title and description
+        y_offset = draw_text_wrapped(panel, details.description, font(MAIN_FONT), WHITE, 10, y_offset, INFO_WIDTH - 20)
+
+        # Add more space between the description and the details
+        y_offset += 20  # Space between description and details
+
+        # Draw detailed information with additional space between each point
+        for detail in details.details:
+            y_offset = draw_text_wrapped(panel, detail, font(DETAIL_FONT), WHITE, 10, y_offset, INFO_WIDTH - 20)
+            y_offset += 10  # Space between each detail
+        return panel
+
+    key = ("office-law", details.title, details.description, details.details)
+    return get_panel(key, build)
+
+class OfficeScene(Scene):
+    caption = "Canadian Law For Employees"
+
+    def preload(self):
+        # The background first: it is most of the first frame
+        return [Load(BACKGROUND_IMAGE, (WIDTH, HEIGHT)), Load(NPC_IMAGE, npc_size, alpha=True, priority=1)]
+
+    def enter(self):
+        # Loaded on first entry and cached, so re-entering the level costs nothing
+        self.background_image = assets.image(BACKGROUND_IMAGE, (WIDTH, HEIGHT))
+        self.npc_image = assets.image(NPC_IMAGE, npc_size, alpha=True)
+        self.player_animation = Animator(player_sheet(player_size))  # Frames packed in one atlas
+        self.laws = load_pack(CONTENT_PACK).laws
+        self.showing_details = False
+        self.current_details = None
+        self.current_npc = None  # Index of the NPC whose law is in current_details
+        self.player_pos = list(player_pos)
+        self.player_x_offset = 0
+        self.visited_npcs = set()  # Track which NPCs have been visited
+
+        # The NPCs (keyed by index) and the player's feet in one grid, in world coordinates. An NPC's
+        # box bounds its interaction circle: contacts find the candidates, the distance decides
+        self.collisions = CollisionWorld()
+        for i, (npc_x, npc_y) in enumerate(npc_positions):
+            self.collisions.add(i, (npc_x - INTERACTION_RADIUS, npc_y - INTERACTION_RADIUS,
+                                    2 * INTERACTION_RADIUS, 2 * INTERACTION_RADIUS))
+        self.collisions.add("player", (*self.player_pos, 1, 1))
+
+        # Initialize the exit button
+        exit_x = WIDTH - 150  # Button width is 150
+        exit_y = HEIGHT - 50  # Button height is 50
+
+        # Create the exit button (initially set to "Exit")
+        self.exit_button = Button(exit_x, exit_y, 150, 50, "Exit", RED)
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE and self.current_details is not None:
+                # Space pressed to show details
+                self.showing_details = not self.showing_details
+                if not self.showing_details and self.current_npc not in self.visited_npcs:
+                    self.visited_npcs.add(self.current_npc)
+                    self.manager.progress.record(CONTENT_PACK, VISIT, self.current_npc)
+            elif event.key == pygame.K_ESCAPE:
+                self.showing_details = False
+        elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            # Handle the button event
+            if self.exit_button.handle_event(event):
+                if self.exit_button.text == "Exit":
+                    self.manager.pop()  # Back to the menu
+                elif self.exit_button.text == "Next Level":
+                    # Proceed to the boss's office
+                    self.manager.replace(loading_screen(BossOfficeScene()))
+
+    def is_idle(self) -> bool:
+        # The info box freezes the office; otherwise only held arrow keys change anything
+        return self.showing_details or not any_held(self.manager.input.get_pressed())
+
+    def update(self, dt: float):
+        # Movement controls with boundary checking, scaled by the step's delta time
+        if not self.showing_details:
+            keys = self.manager.input.get_pressed()
+            player_pos = self.player_pos
             # Horizontal movement
             if keys[pygame.K_RIGHT]:
                 # Restrict movement based on background limits or screen boundary
-                if player_pos[0] < WIDTH - player_size[0] // 2 or player_x_offset <= -npc_positions[-1][0] + WIDTH - 200:
-                    player_pos[0] = min(player_pos[0] + player_speed, WIDTH - player_size[0])  # Limit to right screen boundary
+                if player_pos[0] < WIDTH - player_size[0] // 2 or self.player_x_offset <= -npc_positions[-1][0] + WIDTH - 200:
+                    player_pos[0] = min(player_pos[0] + player_speed * dt, WIDTH - player_size[0])  # Limit to right screen boundary
                 else:
-                    player_x_offset = max(player_x_offset - player_speed, -npc_positions[-1][0] + WIDTH - 200)  # Limit background offset
-                # Update animation for right walking
-                walking_animation_frame = (walking_animation_frame + 1) % 2
-                last_update_time = pygame.time.get_ticks()
+                    self.player_x_offset = max(self.player_x_offset - player_speed * dt, -npc_positions[-1][0] + WIDTH - 200)  # Limit background offset
             elif keys[pygame.K_LEFT]:
                 # Restrict movement to the left boundary of the screen
                 if player_pos[0] > player_size[0] // 2:
-                    player_pos[0] = max(player_pos[0] - player_speed, 0)  # Limit to left screen boundary
+                    player_pos[0] = max(player_pos[0] - player_speed * dt, 0)  # Limit to left screen boundary
                 else:
-                    player_x_offset = min(player_x_offset + player_speed, 0)  # Prevent background from going past starting point
-                # Update animation for left walking
-                walking_animation_frame = (walking_animation_frame + 1) % 2
-                last_update_time = pygame.time.get_ticks()
+                    self.player_x_offset = min(self.player_x_offset + player_speed * dt, 0)  # Prevent background from going past starting point
 
             # Vertical movement
             if keys[pygame.K_UP] and player_pos[1] > 0:
-                player_pos[1] -= VERTICAL_SPEED
-                # Update animation for up walking
-                walking_animation_frame = (walking_animation_frame + 1) % 2
-                last_update_time = pygame.time.get_ticks()
+                player_pos[1] -= VERTICAL_SPEED * dt
             elif keys[pygame.K_DOWN] and player_pos[1] < HEIGHT - player_size[1]:
-                player_pos[1] += VERTICAL_SPEED
-                # Update animation for down walking
-                walking_animation_frame = (walking_animation_frame + 1) % 2
-                last_update_time = pygame.time.get_ticks()
-
-        # Draw player animation
-        if keys[pygame.K_RIGHT]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_right_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_right_2, (player_pos[0], player_pos[1]))
-        elif keys[pygame.K_LEFT]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_left_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_left_2, (player_pos[0], player_pos[1]))
-        elif keys[pygame.K_UP]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_up_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_up_2, (player_pos[0], player_pos[1]))
-        elif keys[pygame.K_DOWN]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_down_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_down_2, (player_pos[0], player_pos[1]))
+                player_pos[1] += VERTICAL_SPEED * dt
+
+            # Walk or stand facing the way the keys point, advanced by the step's delta time
+            self.player_animation.play(*movement_state(keys, idle_direction="down"))
+            self.player_animation.update(dt)
+
+            # Nearest NPC within reach of the player (world coordinates); None resets current_details
+            x, y = player_pos[0] - self.player_x_offset, player_pos[1]
+            self.collisions.move("player", x, y)
+            nearest, best_sq = None, INTERACTION_RADIUS * INTERACTION_RADIUS
+            for contact in self.collisions.step():
+                npc = contact.other("player")
+                if npc is None or contact.kind == EXIT:
+                    continue  # Two NPC boxes overlapping, or a box the player just left
+                npc_x, npc_y = npc_positions[npc]
+                distance_sq = (npc_x - x) ** 2 + (npc_y - y) ** 2
+                if distance_sq < best_sq:
+                    nearest, best_sq = npc, distance_sq
+            self.current_npc = nearest
+            self.current_details = self.laws[nearest] if nearest is not None else None
+
+        # Update the exit button text and color based on whether all NPCs have been visited
+        if len(self.visited_npcs) == len(npc_positions):
+            self.exit_button.text = "Next Level"
+            self.exit_button.color = GREEN
         else:
-            # When idle, use the "look" images
-            screen.blit(player_sprite_down, (player_pos[0], player_pos[1]))  # Default to right-facing idle state
-
-        # Reset current_details if no NPC is nearby
-        current_details = None
-
-        # Draw and handle all NPCs
-        for i, (npc_x, npc_y) in enumerate(npc_positions):
-            adjusted_x = npc_x + player_x_offset
-            if 0 < adjusted_x < WIDTH:  # Only draw NPCs on screen
-                # screen.blit(npc_sprite, (adjusted_x, npc_y))
-                screen.blit(npc_image,(adjusted_x,npc_y))
-                
-                # Check for interaction with this NPC
-                if check_npc_interaction(player_pos[0], player_pos[1], adjusted_x, npc_y):
-                    current_details = laws_info[i]
-                    if not showing_details:
-                         # Show interaction message with HUD
-                        font = pygame.font.Font(None, 36)
-                        prompt_text = font.render("Press SPACE to interact", True, WHITE)  # Text color changed to white
-
-                        # Create a background HUD for the text
-                        text_width = prompt_text.get_width()
-                        text_height = prompt_text.get_height()
-                        hud_width = text_width + 30  # Add more padding around the text
-                        hud_height = text_height + 30  # Increase padding to cover the bottom part of the text
-
-                        # Draw HUD background (semi-transparent black)
-                        pygame.draw.rect(screen, HUD_COLOR, (WIDTH // 2 - hud_width // 2, HEIGHT - 50 - hud_height // 2, hud_width, hud_height))
-
-                        # Draw the text
-                        screen.blit(prompt_text, (WIDTH // 2 - prompt_text.get_width() // 2, HEIGHT - 63))
-
-        # Draw the legal info with white background if we are showing details
-        if showing_details and current_details:
-            info_width = WIDTH - 100  # Width of the info box
-            info_height = 320  # Height of the info box
-            info_x = 50
-            info_y = HEIGHT // 4  # Center the box vertically
-
-         
-    
-            info_box_surface = pygame.Surface((info_width, info_height), pygame.SRCALPHA)
-
-            # Fill the surface with a semi-transparent black (you can adjust the alpha value for transparency)
-            info_box_surface.fill((0, 0, 0, 128))  # (R, G, B, A), where A is the alpha (transparency)
-
-            # Blit the surface onto the main screen
-            screen.blit(info_box_surface, (info_x, info_y))
-
-            # Draw the title and description with more space in between
-            y_offset = draw_text_wrapped(screen, f"{current_details['title']}", title_font, WHITE, info_x + 10, info_y + 10, info_width - 20)
-            
-            # Add additional vertical space (increase this value for more spacing)
-            y_offset += 20  # Space between title and description
-            y_offset = draw_text_wrapped(screen, f"{current_details['description']}", main_font, WHITE, info_x + 10, y_offset, info_width - 20)
-
-            # Add more space between the description and the details
-            y_offset += 20  # Space between description and details
-
-            # Draw detailed information with additional space between each point
-            for detail in current_details["details"]:
-                y_offset = draw_text_wrapped(screen, detail, detail_font, WHITE, info_x + 10, y_offset, info_width - 20)
-                y_offset += 10  # Space between each detail
-
-         # Update the exit button text and color based on whether all NPCs have been visited
-        if len(visited_npcs) == len(npc_positions):
-            exit_button.text = "Next Level"
-            exit_button.color = GREEN
-        else:
-            exit_button.text = "Exit"
-            exit_button.color = RED
-            remaining_text = main_font.render(
-                f"Find all {len(npc_positions) - len(visited_npcs)} remaining legal documents", True, WHITE)
-            screen.blit(remaining_text, (WIDTH // 2 - remaining_text.get_width() // 2, 20))
-        exit_button.draw(screen)
-        pygame.display.flip()
-
-def quiz():
-    # Initialize a new Pygame window for the quiz
-    quiz_screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Quiz Level")
-
-    # Load the background image
-    background_image = pygame.image.load("./images/office-boss.png")
-    background_image = pygame.transform.scale(background_image, (WIDTH, HEIGHT))  # Scale the image to fit the screen
-
-    # Player settings
-    player_pos = [350, HEIGHT // 2]
-    player_speed = 0.1
-    player_size = (75, 75)
-    VERTICAL_SPEED = 0.1  # Added vertical speed
-    walking_animation_frame = 0  # Track walking animation frame
-
-    # Load Sprites
-    player_sprite_down = pygame.image.load('./images/look_down.png').convert_alpha()
-    player_sprite_left = pygame.image.load('./images/look_left.png').convert_alpha()
-    player_sprite_right = pygame.image.load('./images/look_right.png').convert_alpha()
-    player_sprite_up = pygame.image.load('./images/look_up.png').convert_alpha()
-
-    player_walk_down_1 = pygame.image.load('./images/walk_down_1.png').convert_alpha()
-    player_walk_down_2 = pygame.image.load('./images/walk_down_2.png').convert_alpha()
-    player_walk_left_1 = pygame.image.load('./images/walk_left_1.png').convert_alpha()
-    player_walk_left_2 = pygame.image.load('./images/walk_left_2.png').convert_alpha()
-    player_walk_right_1 = pygame.image.load('./images/walk_right_1.png').convert_alpha()
-    player_walk_right_2 = pygame.image.load('./images/walk_right_2.png').convert_alpha()
-    player_walk_up_1 = pygame.image.load('./images/walk_up_1.png').convert_alpha()
-    player_walk_up_2 = pygame.image.load('./images/walk_up_2.png').convert_alpha()
-
-    # Scale the images to the size of the player
-    player_sprite_down = pygame.transform.scale(player_sprite_down, player_size)
-    player_sprite_left = pygame.transform.scale(player_sprite_left, player_size)
-    player_sprite_right = pygame.transform.scale(player_sprite_right, player_size)
-    player_sprite_up = pygame.transform.scale(player_sprite_up, player_size)
-
-    player_walk_down_1 = pygame.transform.scale(player_walk_down_1, player_size)
-    player_walk_down_2 = pygame.transform.scale(player_walk_down_2, player_size)
-    player_walk_left_1 = pygame.transform.scale(player_walk_left_1, player_size)
-    player_walk_left_2 = pygame.transform.scale(player_walk_left_2, player_size)
-    player_walk_right_1 = pygame.transform.scale(player_walk_right_1, player_size)
-    player_walk_right_2 = pygame.transform.scale(player_walk_right_2, player_size)
-    player_walk_up_1 = pygame.transform.scale(player_walk_up_1, player_size)
-    player_walk_up_2 = pygame.transform.scale(player_walk_up_2, player_size)
-
-    # Main loop for the quiz
-    quiz_running = True
-    while quiz_running:
-        # Fill the screen with the background image
-        quiz_screen.blit(background_image, (0, 0))
-
-        # Handle events (close the quiz when the window is closed)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
+            self.exit_button.text = "Exit"
+            self.exit_button.color = RED
+
+    def draw(self, screen: pygame.Surface):
+        with profiler.phase("draw.background"):
+            screen.clear(self.background_image)
+
+        # Draw the player's current animation frame
+        with profiler.phase("draw.player"):
+            self.player_animation.draw(screen, self.player_pos)
+
+        # Draw the NPCs inside the camera view only
+        with profiler.phase("draw.npcs"):
+            left, top, width, height = view = camera_rect(self.player_x_offset, WIDTH, HEIGHT)
+            for i in self.collisions.query(view):
+                if i == "player":
+                    continue
+                npc_x, npc_y = npc_positions[i]
+                if left <= npc_x < left + width and top <= npc_y < top + height:
+                    screen.blit(self.npc_image, (npc_x + self.player_x_offset, npc_y))
+
+        with profiler.phase("draw.hud"):
+            if self.current_details is not None and not self.showing_details:
+                # Show interaction message with HUD
+                prompt_text = render_line("Press SPACE to interact", font(MAIN_FONT), WHITE)  # Text color changed to white
+
+                # Create a background HUD for the text
+                text_width = prompt_text.get_width()
+                text_height = prompt_text.get_height()
+                hud_width = text_width + 30  # Add more padding around the text
+                hud_height = text_height + 30  # Increase padding to cover the bottom part of the text
+
+                # Draw HUD background (semi-transparent black)
+                screen.fill(HUD_COLOR, (WIDTH // 2 - hud_width // 2, HEIGHT - 50 - hud_height // 2, hud_width, hud_height))
+
+                # Draw the text
+                screen.blit(prompt_text, (WIDTH // 2 - prompt_text.get_width() // 2, HEIGHT - 63))
+
+        # Draw the legal info box if we are showing details (one pre-composited blit)
+        with profiler.phase("draw.info_box"):
+            if self.showing_details and self.current_details:
+                screen.blit(law_panel(self.current_details), (INFO_X, INFO_Y))
+
+        with profiler.phase("draw.hud"):
+            if len(self.visited_npcs) != len(npc_positions):
+                remaining_text = render_line(
+                    f"Find all {len(npc_positions) - len(self.visited_npcs)} remaining legal documents", font(MAIN_FONT), WHITE)
+                screen.blit(remaining_text, (WIDTH // 2 - remaining_text.get_width() // 2, 20))
+            self.exit_button.draw(screen)
+
+
+class BossOfficeScene(Scene):
+    caption = "Quiz Level"
+
+    def preload(self):
+        return [Load(BOSS_BACKGROUND_IMAGE, (WIDTH, HEIGHT))]
+
+    def enter(self):
+        # Load the background image (cached, so re-entering the quiz costs nothing)
+        self.background_image = assets.image(BOSS_BACKGROUND_IMAGE, (WIDTH, HEIGHT))
+        self.player_animation = Animator(player_sheet(player_size))
+
+        # Player settings
+        self.player_pos = list(player_pos)
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()  # Back to the menu
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self.manager.push(OfficeQuizScene())  # The boss quizzes you on the office's laws
+
+    def is_idle(self) -> bool:
+        return not any_held(self.manager.input.get_pressed())
+
+    def update(self, dt: float):
         # Get the state of all keys
-        keys = pygame.key.get_pressed()
+        keys = self.manager.input.get_pressed()
 
         # Horizontal and Vertical movement
         if keys[pygame.K_RIGHT]:
-            player_pos[0] += player_speed
-            walking_animation_frame = (walking_animation_frame + 1) % 2  # Toggle animation frame
+            self.player_pos[0] += player_speed * dt
         elif keys[pygame.K_LEFT]:
-            player_pos[0] -= player_speed
-            walking_animation_frame = (walking_animation_frame + 1) % 2  # Toggle animation frame
+            self.player_pos[0] -= player_speed * dt
         elif keys[pygame.K_UP]:
-            player_pos[1] -= VERTICAL_SPEED
-            walking_animation_frame = (walking_animation_frame + 1) % 2  # Toggle animation frame
+            self.player_pos[1] -= VERTICAL_SPEED * dt
         elif keys[pygame.K_DOWN]:
-            player_pos[1] += VERTICAL_SPEED
-            walking_animation_frame = (walking_animation_frame + 1) % 2  # Toggle animation frame
+            self.player_pos[1] += VERTICAL_SPEED * dt
 
-        # Draw the appropriate walking sprite
-        if keys[pygame.K_RIGHT]:
-            if walking_animation_frame == 0:
-                quiz_screen.blit(player_walk_right_1, player_pos)
-            else:
-                quiz_screen.blit(player_walk_right_2, player_pos)
-        elif keys[pygame.K_LEFT]:
-            if walking_animation_frame == 0:
-                quiz_screen.blit(player_walk_left_1, player_pos)
-            else:
-                quiz_screen.blit(player_walk_left_2, player_pos)
-        elif keys[pygame.K_UP]:
-            if walking_animation_frame == 0:
-                quiz_screen.blit(player_walk_up_1, player_pos)
-            else:
-                quiz_screen.blit(player_walk_up_2, player_pos)
-        elif keys[pygame.K_DOWN]:
-            if walking_animation_frame == 0:
-                quiz_screen.blit(player_walk_down_1, player_pos)
-            else:
-                quiz_screen.blit(player_walk_down_2, player_pos)
-        else:
-            # Idle (not moving)
-            quiz_screen.blit(player_sprite_down, player_pos)  # Default to down-facing idle sprite
+        # Walk or stand facing the way the keys point
+        self.player_animation.play(*movement_state(keys, idle_direction="down"))
+        self.player_animation.update(dt)
 
-        pygame.display.flip()  # Update the display
+    def draw(self, screen: pygame.Surface):
+        # Fill the screen with the background image
+        screen.clear(self.background_image)
+
+        # Draw the player's current animation frame
+        self.player_animation.draw(screen, self.player_pos)
+
+        prompt_text = render_line("Press SPACE to answer your boss's questions", font(MAIN_FONT), WHITE)
+        screen.fill(HUD_COLOR, (WIDTH // 2 - prompt_text.get_width() // 2 - 15, HEIGHT - 65, prompt_text.get_width() + 30, 50))
+        screen.blit(prompt_text, (WIDTH // 2 - prompt_text.get_width() // 2, HEIGHT - 52))
+
+
+class OfficeQuizScene(Scene):
+    caption = "Quiz Level"
+    COMPLETION_TIME = 3.0  # Seconds the completion screen stays up
+
+    def enter(self):
+        # Question and explanation pages, each rendered on a worker before it is shown
+        self.quiz = Quiz(load_pack(CONTENT_PACK).scenarios, (WIDTH, HEIGHT))
+        self.completion_timer = 0.0
+
+        self.yes_button = Button(WIDTH // 4 - 100, HEIGHT - 100, 200, 50, "YES", GREEN)
+        self.no_button = Button(3 * WIDTH // 4 - 100, HEIGHT - 100, 200, 50, "NO", RED)
+
+    def exit(self):
+        self.quiz.close()
+
+    def is_idle(self) -> bool:
+        # Pages wait for a click or key; the completion screen runs a timer
+        return not self.quiz.finished
+
+    def handle_event(self, event: pygame.event.Event):
+        quiz = self.quiz
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()  # Back to the boss's office
+        elif quiz.finished:
+            return
+        elif event.type == pygame.KEYDOWN and quiz.showing_explanation:
+            if event.key == pygame.K_SPACE:
+                quiz.advance()
+        elif not quiz.showing_explanation:
+            # Only the right answer turns to the explanation; every attempt is kept for the teacher
+            if self.yes_button.handle_event(event):
+                self.answer("yes")
+            elif self.no_button.handle_event(event):
+                self.answer("no")
+
+    def answer(self, choice: str):
+        question = self.quiz.current
+        self.manager.progress.record(CONTENT_PACK, ANSWER, question, choice, self.quiz.answer(choice))
+
+    def update(self, dt: float):
+        # Keep the completion screen up for a moment, then return to the boss's office
+        if self.quiz.finished:
+            self.completion_timer += dt
+            if self.completion_timer >= self.COMPLETION_TIME:
+                self.manager.pop()
+
+    def draw(self, screen: pygame.Surface):
+        screen.clear(WHITE)
+
+        if self.quiz.finished:
+            completion_text = render_line("Congratulations! Office Level Complete!", font(TITLE_FONT), BLACK)
+            screen.blit(completion_text, (WIDTH // 2 - completion_text.get_width() // 2, HEIGHT // 2))
+            return
+
+        # The page itself is pre-rendered; only the buttons are drawn on top
+        screen.blit(self.quiz.page(), (0, 0))
+        if not self.quiz.showing_explanation:
+            self.yes_button.draw(screen)
+            self.no_button.draw(screen)
 
 
 if __name__ == "__main__":
-    office_level()
-    pygame.quit()
\ No newline at end of file
+    SceneManager().run(loading_screen(OfficeScene()))
+    pygame.quit()
@@ -1,261 +1,260 @@
-import os 
 import pygame
-import sys
 
-# Set up working directory to the script’s location
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
-
-pygame.init()
+from engine.assets import assets
+from engine.collision import EXIT, CollisionWorld
+from engine.cutscene import Cutscene, Wait, WaitKey
+from engine.fonts import font
+from engine.loader import Load, loading_screen
+from engine.panels import get_panel
+from engine.progress import CHOICE
+from engine.scenes import Scene, SceneManager
+from engine.sprites import player_sheet
+from engine.text import draw_text_wrapped
+from engine.traffic import PEDESTRIAN, Lane, Traffic, traffic_sprites
 
 # Screen settings
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Canadian Law Adventure")
 
 # Colors
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 DIALOGUE_BOX_COLOR = (0, 0, 0, 128)  # Semi-transparent black for the dialogue box
-# Initialize world offset for world movement simulation
-world_offset = 0
-
-# Load Images
-background_image = pygame.image.load("../images/sample.png")
-character_car_image = pygame.image.load("../images/car.png")
-police_car_image = pygame.image.load("../images/car.png")
-exclamation_image = pygame.image.load("../images/exclamation.png")
-npc_image = pygame.image.load("../images/walk_down_1.png")
-
-# Resize images if necessary
-background_image = pygame.transform.scale(background_image, (WIDTH, HEIGHT))
-character_car_image = pygame.transform.scale(character_car_image, (100, 50))
-police_car_image = pygame.transform.scale(police_car_image, (100, 50))
-exclamation_image = pygame.transform.scale(exclamation_image, (30, 30))
+CAR_SPEED = 300  # Pixels per second
+
+# Images, loaded when the scene is entered (converted to the display format and scaled once)
+BACKGROUND_IMAGE = "images/sample.png"
+CAR_IMAGE = "images/car.png"
+EXCLAMATION_IMAGE = "images/exclamation.png"
+NPC_IMAGE = "images/walk_down_1.png"
 
 # Initial positions
-character_car_pos = [WIDTH - 150, HEIGHT // 2 + 65]
-police_car_pos = [WIDTH - 500, HEIGHT // 2 + 65]
-npc_pos = [1200, HEIGHT // 2 + 65]  # Adjust the y-position as needed
-
-# Font settings
-main_font = pygame.font.Font(None, 36)
-
-# Flags to track interactions
-interaction_occurred = False
-npc_interaction_occurred = False  # New flag for NPC interaction
-
-# Add the npc_spawned flag to track NPC spawning
-npc_spawned = False
-
-def draw_text_wrapped(surface, text, font, color, x, y, max_width):
-    """Draw wrapped text."""
-    words = text.split()
-    lines = []
-    current_line = []
-    current_width = 0
-
-    for word in words:
-        word_surface = font.render(word + " ", True, color)
-        word_width = word_surface.get_width()
-
-        if current_width + word_width <= max_width:
-            current_line.append(word)
-            current_width += word_width
-        else:
-            lines.append(" ".join(current_line))
-            current_line = [word]
-            current_width = word_width
-
-    lines.append(" ".join(current_line))
-
-    y_offset = y
-    for line in lines:
-        text_surface = font.render(line, True, color)
-        surface.blit(text_surface, (x, y_offset))
-        y_offset += font.get_height()
-
-    return y_offset
-
-def show_exclamation(position):
-    """Display an exclamation above the given position briefly."""
-    exclamation_pos = (position[0] + 35, position[1] - 40)
-    screen.blit(exclamation_image, exclamation_pos)
-    pygame.display.flip()
-    pygame.time.wait(500)  # Show the exclamation for half a second
-
-def show_dialogue_and_options(dialogue_text, options, feedbacks):
-    """Display the dialogue, options, and handle consequences in one dialogue box."""
-    # Draw the initial dialogue box and text
-    dialogue_box = pygame.Surface((WIDTH, 150), pygame.SRCALPHA)
-    dialogue_box.fill(DIALOGUE_BOX_COLOR)
-    screen.blit(dialogue_box, (0, HEIGHT - 150))
-    draw_text_wrapped(screen, dialogue_text, main_font, WHITE, 20, HEIGHT - 130, WIDTH - 40)
-    pygame.display.flip()
-
-    # Wait for Space key to proceed to options
-    waiting_for_space = True
-    while waiting_for_space:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                waiting_for_space = False
-
-    # Clear previous dialogue text by refreshing the screen and background elements
-    screen.blit(background_image, (0, 0))  # Redraw the background
-    screen.blit(character_car_image, character_car_pos)  # Redraw the character car
-    if not interaction_occurred:
-        screen.blit(police_car_image, police_car_pos)  # Redraw the police car if needed
-    if npc_spawned and not npc_interaction_occurred:
-        screen.blit(npc_image, npc_pos)  # Redraw the NPC if needed
-    dialogue_box.fill(DIALOGUE_BOX_COLOR)  # Clear and redraw the dialogue box
-    screen.blit(dialogue_box, (0, HEIGHT - 150))
-
-    # Display options in the same dialogue box
-    options_text = "How would you respond?"
-    
-    draw_text_wrapped(screen, options_text, main_font, WHITE, 20, HEIGHT - 130, WIDTH - 40)
-    for i, option in enumerate(options):
-        draw_text_wrapped(screen, option, main_font, WHITE, 20, HEIGHT - 90 + i * 30, WIDTH - 40)
-    pygame.display.flip()
-
-    # Handle option selection and display consequences
-    option_selected = None
-    while option_selected is None:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:
-                    option_selected = 1
-                elif event.key == pygame.K_2:
-                    option_selected = 2
-
-    # Refresh the screen and clear options text before displaying feedback
-    screen.blit(background_image, (0, 0))
-    screen.blit(character_car_image, character_car_pos)
-    if not interaction_occurred:
-        screen.blit(police_car_image, police_car_pos)
-    if npc_spawned and not npc_interaction_occurred:
-        screen.blit(npc_image, npc_pos)
-    dialogue_box.fill(DIALOGUE_BOX_COLOR)
-    screen.blit(dialogue_box, (0, HEIGHT - 150))
-
-    # Display consequences based on selected option
-    feedback = feedbacks[option_selected - 1]
-
-    draw_text_wrapped(screen, feedback, main_font, WHITE, 20, HEIGHT - 130, WIDTH - 40)
-    pygame.display.flip()
-    pygame.time.wait(5000)  # Display the feedback for a few seconds
-
-def main():
-    global interaction_occurred, npc_interaction_occurred, world_offset, npc_spawned, character_car_pos
-
-    while True:
-        screen.blit(background_image, (0, 0))
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        keys = pygame.key.get_pressed()
+character_car_start = (WIDTH - 150, HEIGHT // 2 + 65)
+police_car_pos = (WIDTH - 500, HEIGHT // 2 + 65)
+npc_start = (1200, HEIGHT // 2 + 65)  # Adjust the y-position as needed
+
+# Background traffic on the road and sidewalks of the map, looping around a
+# world TRAFFIC_WORLD_WIDTH wide; the camera moves one screen per block driven
+TRAFFIC_LANES = [
+    Lane(330, -1, 1), Lane(350, -1, 0),  # Westbound road lanes
+    Lane(376, 1, 3), Lane(398, 1, 2),  # Eastbound road lanes
+    Lane(298, 0, 5, PEDESTRIAN), Lane(306, 0, 4, PEDESTRIAN),  # North sidewalk
+    Lane(424, 0, 7, PEDESTRIAN), Lane(432, 0, 6, PEDESTRIAN),  # South sidewalk
+]
+TRAFFIC_WORLD_WIDTH = 16 * WIDTH
+TRAFFIC_VEHICLES = 300
+TRAFFIC_PEDESTRIANS = 200
+TRAFFIC_CAR_SIZE = (40, 20)
+PEDESTRIAN_SIZE = (20, 20)
+CAR_TINTS = [(255, 255, 255), (255, 120, 120), (130, 170, 255), (255, 230, 120), (190, 190, 190)]
+
+# Cutscene timing (seconds) and the keys that pick a dialogue option
+EXCLAMATION_TIME = 0.5
+FEEDBACK_TIME = 5.0
+OPTION_KEYS = (pygame.K_1, pygame.K_2)
+
+# Level name the learner's choices are stored under (engine.progress)
+PROGRESS_LEVEL = "police"
+
+# Font size (the font is created on first use)
+MAIN_FONT = 36
+
+
+def dialogue_panel(*lines: str) -> pygame.Surface:
+    """Dialogue box with its text, rendered once per distinct content.
+
+    The first line is the heading text; any further lines are options listed
+    below it, one per row.
+    """
+    def build() -> pygame.Surface:
+        dialogue_box = pygame.Surface((WIDTH, 150), pygame.SRCALPHA)
+        dialogue_box.fill(DIALOGUE_BOX_COLOR)
+        draw_text_wrapped(dialogue_box, lines[0], font(MAIN_FONT), WHITE, 20, 20, WIDTH - 40)
+        for i, option in enumerate(lines[1:]):
+            draw_text_wrapped(dialogue_box, option, font(MAIN_FONT), WHITE, 20, 60 + i * 30, WIDTH - 40)
+        return dialogue_box
+
+    return get_panel(("police-dialogue",) + lines, build)
+
+
+class PoliceScene(Scene):
+    caption = "Canadian Law Adventure"
+
+    def preload(self):
+        # Background, then the cars on screen from the start, then what appears later
+        return [Load(BACKGROUND_IMAGE, (WIDTH, HEIGHT)),
+                Load(CAR_IMAGE, (100, 50), alpha=True, priority=1),
+                Load(CAR_IMAGE, TRAFFIC_CAR_SIZE, alpha=True, priority=1),
+                Load(EXCLAMATION_IMAGE, (30, 30), priority=2),
+                Load(NPC_IMAGE, alpha=True, priority=2)]
+
+    def enter(self):
+        self.background_image = assets.image(BACKGROUND_IMAGE, (WIDTH, HEIGHT))
+        self.character_car_image = assets.image(CAR_IMAGE, (100, 50), alpha=True)
+        self.police_car_image = assets.image(CAR_IMAGE, (100, 50), alpha=True)
+        self.exclamation_image = assets.image(EXCLAMATION_IMAGE, (30, 30))
+        self.npc_image = assets.image(NPC_IMAGE, alpha=True)
+
+        # Traffic sprites: tinted cars both ways, then the walking frames of a small player
+        walkers = player_sheet(PEDESTRIAN_SIZE)
+        self.traffic_sprites = traffic_sprites(
+            assets.image(CAR_IMAGE, TRAFFIC_CAR_SIZE, alpha=True), CAR_TINTS,
+            [walkers.surface.subsurface(rect) for rect in walkers.clips[("walk", "left")]],
+            [walkers.surface.subsurface(rect) for rect in walkers.clips[("walk", "right")]])
+        self.traffic = Traffic(TRAFFIC_LANES, TRAFFIC_WORLD_WIDTH, TRAFFIC_VEHICLES, TRAFFIC_PEDESTRIANS)
+
+        self.character_car_pos = list(character_car_start)
+        self.npc_pos = list(npc_start)
+        # World x of the screen's left edge, for the traffic camera
+        self.world_offset = 0
+
+        # Bodies the player's car can run into; an encounter removes its body once played
+        self.collisions = CollisionWorld()
+        self.collisions.add("player", (*self.character_car_pos, *self.character_car_image.get_size()))
+        self.collisions.add("police", (*police_car_pos, *self.police_car_image.get_size()))
+
+        # Add the npc_spawned flag to track NPC spawning
+        self.npc_spawned = False
+
+        # Encounter being played (exclamation, dialogue, options, feedback) and what it shows
+        self.cutscene = None
+        self.overlay = None
+
+    def handle_event(self, event: pygame.event.Event):
+        # A running cutscene gets the keys it is waiting for; Escape still leaves the scene
+        if self.cutscene is not None and self.cutscene.handle_event(event):
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()  # Back to the menu
+
+    def is_idle(self) -> bool:
+        # Traffic keeps moving; only a dialogue waiting on a key freezes the picture
+        return self.cutscene is not None and self.cutscene.idle
+
+    def draw_world(self, screen: pygame.Surface):
+        # Draw the player's car
+        screen.blit(self.character_car_image, self.character_car_pos)
+
+        # Draw the police car and the NPC while they are still on the map (spawned, encounter not played)
+        if "police" in self.collisions:
+            screen.blit(self.police_car_image, police_car_pos)
+        if "npc" in self.collisions:
+            screen.blit(self.npc_image, self.npc_pos)
+
+    def draw(self, screen: pygame.Surface):
+        screen.clear(self.background_image)
+        # Traffic in view only, under the scene's own cars
+        self.traffic.draw(screen, self.world_offset, self.traffic_sprites, len(CAR_TINTS))
+        self.draw_world(screen)
+        # Exclamation or dialogue box of the running cutscene
+        if self.overlay is not None:
+            screen.blit(*self.overlay)
+
+    def encounter(self, name, position, dialogue_text, options, feedbacks):
+        """Cutscene: exclamation, dialogue, options and the chosen option's feedback, in one dialogue box."""
+        # Display an exclamation above the given position briefly
+        self.overlay = (self.exclamation_image, (position[0] + 35, position[1] - 40))
+        yield Wait(EXCLAMATION_TIME)
+
+        # Show the dialogue until Space is pressed
+        self.overlay = (dialogue_panel(dialogue_text), (0, HEIGHT - 150))
+        yield WaitKey(pygame.K_SPACE)
+
+        # Display options in the same dialogue box
+        options_text = "How would you respond?"
+        self.overlay = (dialogue_panel(options_text, *options), (0, HEIGHT - 150))
+        key = yield WaitKey(*OPTION_KEYS)
+        self.manager.progress.record(PROGRESS_LEVEL, CHOICE, name, OPTION_KEYS.index(key) + 1)
+
+        # Display consequences based on selected option
+        feedback = feedbacks[OPTION_KEYS.index(key)]
+        self.overlay = (dialogue_panel(feedback), (0, HEIGHT - 150))
+        yield Wait(FEEDBACK_TIME)
+        self.overlay = None
+
+    def police_stop(self):
+        # Dialogue and options for police interaction
+        dialogue_text = (
+            "The officer has stopped you and asked for identification. Under Canadian law, "
+            "you generally have the right to ask why you're being stopped. In specific cases, "
+            "like driving, you may need to show ID."
+        )
+        options = [
+            "Press 1 to Comply and politely ask why.",
+            "Press 2 to Refuse to show ID and walk away."
+        ]
+        feedbacks = [
+            "Good choice! You have the right to know why you're being stopped. "
+            "Interacting respectfully can help de-escalate the situation.",
+            "This may not be the best option. Refusing to comply can lead to further questioning. "
+            "In some cases, such as traffic stops, you are legally required to show ID."
+        ]
+        yield from self.encounter("police_stop", police_car_pos, dialogue_text, options, feedbacks)
+        self.collisions.remove("police")
+
+    def pedestrian_crossing(self):
+        # Dialogue and options for NPC interaction
+        dialogue_text = (
+            "You encounter a pedestrian who seems to need assistance crossing the road. "
+            "Under Canadian law, drivers should yield to pedestrians at crosswalks."
+        )
+        options = [
+            "Press 1 to Stop and help the pedestrian cross.",
+            "Press 2 to Ignore and drive past."
+        ]
+        feedbacks = [
+            "Well done! Helping pedestrians ensures safety for everyone.",
+            "Not the best choice. Ignoring pedestrians can be dangerous and may violate traffic laws."
+        ]
+        yield from self.encounter("pedestrian_crossing", self.npc_pos, dialogue_text, options, feedbacks)
+        self.collisions.remove("npc")
+
+    def update(self, dt: float):
+        # The world holds still while a cutscene plays
+        if self.cutscene is not None:
+            self.cutscene.update(dt)
+            if self.cutscene.finished:
+                self.cutscene = None
+            return
+
+        self.traffic.step(dt)
+
+        keys = self.manager.input.get_pressed()
+        character_car_pos = self.character_car_pos
         if keys[pygame.K_LEFT]:
-            character_car_pos[0] -= 0.2
+            character_car_pos[0] -= CAR_SPEED * dt
         if keys[pygame.K_RIGHT]:
-            character_car_pos[0] += 0.2
+            character_car_pos[0] += CAR_SPEED * dt
         if keys[pygame.K_UP]:
-            character_car_pos[1] -= 0.2
+            character_car_pos[1] -= CAR_SPEED * dt
         if keys[pygame.K_DOWN]:
-            character_car_pos[1] += 0.2
-
-        # Draw the player's car
-        screen.blit(character_car_image, character_car_pos)
-
-        # Draw the police car only if interaction has not yet occurred
-        if not interaction_occurred:
-            screen.blit(police_car_image, police_car_pos)
-
-        # Draw the NPC character if it has been spawned and interaction hasn't occurred
-        if npc_spawned and not npc_interaction_occurred:
-            screen.blit(npc_image, npc_pos)
+            character_car_pos[1] += CAR_SPEED * dt
 
         # Move the world if character reaches the left edge
         if character_car_pos[0] < 0:
-            world_offset -= 5  # Shift world to simulate movement
-            character_car_pos = [WIDTH - 150, HEIGHT // 2 + 65]  # Reset character to initial position
+            self.world_offset -= WIDTH  # Drive on into the next block to the west
+            self.character_car_pos = character_car_pos = list(character_car_start)  # Reset character to initial position
 
             # Spawn the NPC the first time the character crosses the left edge
-            if not npc_spawned:
-                npc_pos[0] = WIDTH // 2  # Set the initial position of the NPC
-                npc_spawned = True  # Mark NPC as spawned
-
-        # Check for collision to start interaction with police car
-        character_rect = pygame.Rect(
-            character_car_pos[0],
-            character_car_pos[1],
-            character_car_image.get_width(),
-            character_car_image.get_height()
-        )
-        police_rect = pygame.Rect(
-            police_car_pos[0],
-            police_car_pos[1],
-            police_car_image.get_width(),
-            police_car_image.get_height()
-        )
-
-        if character_rect.colliderect(police_rect) and not interaction_occurred:
-            interaction_occurred = True
-            show_exclamation(police_car_pos)
-            # Dialogue and options for police interaction
-            dialogue_text = (
-                "The officer has stopped you and asked for identification. Under Canadian law, "
-                "you generally have the right to ask why you're being stopped. In specific cases, "
-                "like driving, you may need to show ID."
-            )
-            options = [
-                "Press 1 to Comply and politely ask why.",
-                "Press 2 to Refuse to show ID and walk away."
-            ]
-            feedbacks = [
-                "Good choice! You have the right to know why you're being stopped. "
-                "Interacting respectfully can help de-escalate the situation.",
-                "This may not be the best option. Refusing to comply can lead to further questioning. "
-                "In some cases, such as traffic stops, you are legally required to show ID."
-            ]
-            show_dialogue_and_options(dialogue_text, options, feedbacks)
-
-        # Check for collision to start interaction with NPC
-        if npc_spawned and not npc_interaction_occurred:
-            npc_rect = pygame.Rect(
-                npc_pos[0],
-                npc_pos[1],
-                npc_image.get_width(),
-                npc_image.get_height()
-            )
-            if character_rect.colliderect(npc_rect):
-                npc_interaction_occurred = True
-                show_exclamation(npc_pos)
-                # Dialogue and options for NPC interaction
-                dialogue_text = (
-                    "You encounter a pedestrian who seems to need assistance crossing the road. "
-                    "Under Canadian law, drivers should yield to pedestrians at crosswalks."
-                )
-                options = [
-                    "Press 1 to Stop and help the pedestrian cross.",
-                    "Press 2 to Ignore and drive past."
-                ]
-                feedbacks = [
-                    "Well done! Helping pedestrians ensures safety for everyone.",
-                    "Not the best choice. Ignoring pedestrians can be dangerous and may violate traffic laws."
-                ]
-                show_dialogue_and_options(dialogue_text, options, feedbacks)
-
-        pygame.display.flip()
+            if not self.npc_spawned:
+                self.npc_pos[0] = WIDTH // 2  # Set the initial position of the NPC
+                self.npc_spawned = True  # Mark NPC as spawned
+                self.collisions.add("npc", (*self.npc_pos, *self.npc_image.get_size()))
+
+        # Start the encounter of whatever the car is touching; one still touched once
+        # another encounter ends starts next, as its contact carries on as a "stay"
+        self.collisions.move("player", *character_car_pos)
+        for contact in self.collisions.step():
+            if contact.kind == EXIT:
+                continue
+            other = contact.other("player")
+            if other == "police":
+                self.cutscene = Cutscene(self.police_stop())
+                return
+            if other == "npc":
+                self.cutscene = Cutscene(self.pedestrian_crossing())
+                return
 
 if __name__ == "__main__":
-    main()
+    SceneManager().run(loading_screen(PoliceScene()))
     pygame.quit()
@@ -0,0 +1,115 @@
+"""Record a play session's input, or replay it deterministically for timing.
+
+    python scenarios/replay.py record FILE [--scene NAME]
+    python scenarios/replay.py play FILE [--window] [--output timing.json] [--baseline FILE]
+
+Recording runs the game normally and logs every frame's events and fixed
+update count to FILE. Playing feeds FILE back through the same scenes with
+no sleeping and no real input, so two replays of one recording simulate and
+draw the same frames; the frame digest printed at the end shows it. Timings
+are reported like the benchmark's and can be compared against a baseline.
+"""
+import argparse
+import importlib
+import os
+import sys
+import zlib
+
+import pygame
+
+from benchmark import SCENES, TOLERANCE, TimedSceneManager, compare, format_row, init_headless, \
+    load_json, summarize, write_json
+from engine.display import init_display
+from engine.progress import ProgressStore
+from engine.replay import InputRecorder, RecordingClock, ReplayClock, ReplayInput, read_recording, write_recording
+from engine.scenes import Scene, SceneManager
+
+
+def create_scene(name: str) -> Scene:
+    module_name, class_name, _ = SCENES[name]
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class DigestSceneManager(TimedSceneManager):
+    """Timed manager that also folds every presented frame into a running CRC"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.digest = 0
+
+    def frame(self):
+        super().frame()
+        # Outside the timed phases, so hashing does not count towards frame time
+        self.digest = zlib.crc32(pygame.image.tobytes(self.screen, "RGB"), self.digest)
+
+
+def record(path: str, scene_name: str):
+    init_display()
+    recorder = InputRecorder()
+    manager = SceneManager(clock=RecordingClock(recorder), input=recorder, async_loading=False)
+    try:
+        manager.run(create_scene(scene_name))
+    finally:
+        # Also when the session ends with an exception
+        write_recording(path, scene_name, recorder.frames, manager.clock.fps, round(1 / manager.clock.step))
+        print(f"Recorded {len(recorder.frames)} frames to {path}")
+        pygame.quit()
+
+
+def play(path: str, window: bool) -> dict:
+    scene_name, fps, update_rate, frames = read_recording(path)
+    if window:
+        init_display()
+    else:
+        init_headless()
+    replay = ReplayInput(frames)
+    progress = ProgressStore(":memory:")  # A replay repeats a learner's session; it must not count twice
+    manager = DigestSceneManager(clock=ReplayClock(replay, fps, update_rate), input=replay, async_loading=False,
+                                 progress=progress)
+    manager.start(create_scene(scene_name))
+    while manager.running and manager.stack:
+        manager.frame()
+    progress.close()
+    pygame.quit()
+    if not manager.samples:
+        raise SystemExit(f"{path}: the recording ends before its first frame")
+
+    stats = summarize(manager.samples)
+    stats["digest"] = f"{manager.digest:08x}"
+    print(format_row(scene_name, stats))
+    print(f"Replayed {len(frames)} recorded frames, frame digest {stats['digest']}")
+    return {"recording": os.path.basename(path), "scenes": {scene_name: stats}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="play normally and record the input")
+    record_parser.add_argument("file")
+    record_parser.add_argument("--scene", default="main_menu", choices=sorted(SCENES), help="scene to start in")
+    play_parser = commands.add_parser("play", help="replay a recording and time it")
+    play_parser.add_argument("file")
+    play_parser.add_argument("--window", action="store_true", help="show the replay instead of running headless")
+    play_parser.add_argument("--output", help="write the timings as JSON")
+    play_parser.add_argument("--baseline", help="earlier --output of the same recording to compare against")
+    play_parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.file, args.scene)
+        return 0
+
+    results = play(args.file, args.window)
+    if args.output:
+        write_json(args.output, results)
+    baseline = load_json(args.baseline) if args.baseline else None
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Startup report: import time and time-to-first-frame of every scene.
+
+    python scenarios/startup.py [--runs 3] [--scene NAME ...] [--output startup.json]
+                                [--baseline FILE] [--save-baseline] [--tolerance 0.25]
+
+Each measurement runs in a fresh interpreter, so module imports, image loads
+and font creation are all cold. Per scene it reports:
+  pygame_import_ms  importing pygame itself (outside our control)
+  import_ms         importing the scene's module; no window may open here
+  display_ms        opening the (dummy) window
+  first_frame_ms    entering the scene and presenting its first frame
+The median of --runs runs is kept. With a stored baseline, slower imports or
+first frames make the run exit non-zero, like benchmark.py.
+"""
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict
+
+# Only the standard library is imported up front: a measuring child process
+# must be the one to import pygame and the scenes for the first time
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, "startup_baseline.json")
+TOLERANCE = 0.25  # Allowed slowdown against the baseline, as a fraction
+METRICS = ("pygame_import_ms", "import_ms", "display_ms", "first_frame_ms")
+COMPARED_METRICS = ("import_ms", "first_frame_ms")
+
+
+def measure(module_name: str, class_name: str) -> Dict:
+    """Cold start of one scene in this (fresh) process"""
+    start = time.perf_counter()
+    import pygame
+    pygame_imported = time.perf_counter()
+
+    # Includes the first import of every engine module the scene uses
+    module = importlib.import_module(module_name)
+    module_imported = time.perf_counter()
+    window_at_import = pygame.display.get_surface() is not None
+
+    from benchmark import init_headless
+    from engine.input import ScriptedInput
+    from engine.loop import FixedClock
+    from engine.progress import ProgressStore
+    from engine.scenes import SceneManager
+    init_headless()
+    display_opened = time.perf_counter()
+
+    manager = SceneManager(clock=FixedClock(), input=ScriptedInput([]), progress=ProgressStore(":memory:"))
+    manager.start(getattr(module, class_name)())
+    manager.frame()
+    first_frame = time.perf_counter()
+
+    return {
+        "pygame_import_ms": (pygame_imported - start) * 1000,
+        "import_ms": (module_imported - pygame_imported) * 1000,
+        "display_ms": (display_opened - module_imported) * 1000,
+        "first_frame_ms": (first_frame - display_opened) * 1000,
+        "window_at_import": window_at_import,
+    }
+
+
+def run_child(module_name: str, class_name: str) -> Dict:
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", module_name, class_name],
+                            check=True, capture_output=True, text=True, env=env).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def report(module_name: str, class_name: str, runs: int) -> Dict:
+    samples = [run_child(module_name, class_name) for _ in range(runs)]
+    result = {metric: round(statistics.median(s[metric] for s in samples), 2) for metric in METRICS}
+    result["window_at_import"] = any(s["window_at_import"] for s in samples)
+    return result
+
+
+def main():
+    from benchmark import SCENES, compare, load_json, write_json
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="fresh-process runs per scene (median is kept)")
+    parser.add_argument("--scene", action="append", choices=sorted(SCENES), help="scene to measure (default: all)")
+    parser.add_argument("--output", help="write the report as JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline report to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this report as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = {"runs": args.runs, "scenes": {}}
+    print(f"{'scene':<14} {'pygame':>8} {'import':>8} {'display':>8} {'1st frame':>10}  (ms)")
+    for name in args.scene or SCENES:
+        module_name, class_name, _ = SCENES[name]
+        results["scenes"][name] = stats = report(module_name, class_name, args.runs)
+        warning = "  WINDOW OPENED AT IMPORT" if stats["window_at_import"] else ""
+        print(f"{name:<14} {stats['pygame_import_ms']:8.1f} {stats['import_ms']:8.1f} "
+              f"{stats['display_ms']:8.1f} {stats['first_frame_ms']:10.1f}{warning}")
+
+    if args.output:
+        write_json(args.output, results)
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f"Saved baseline {args.baseline}")
+        return 0
+
+    opened = [name for name, stats in results["scenes"].items() if stats["window_at_import"]]
+    baseline = load_json(args.baseline)
+    regressions = compare(results, baseline, args.tolerance, COMPARED_METRICS) if baseline else []
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    for name in opened:
+        print(f"REGRESSION {name}: importing the module opened a window")
+    return 1 if regressions or opened else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        print(json.dumps(measure(sys.argv[2], sys.argv[3])))
+        sys.exit(0)
+    sys.exit(main())
@@ -1,13 +1,22 @@
 import pygame
-import sys
-from typing import Dict, List, Tuple
-
-pygame.init()
+from typing import Tuple
+
+from engine.assets import assets
+from engine.content import Law, load_pack
+from engine.fonts import font
+from engine.input import any_held
+from engine.loader import Load, loading_screen
+from engine.panels import get_panel
+from engine.progress import ANSWER, VISIT
+from engine.quiz import Quiz
+from engine.scenes import Scene, SceneManager
+from engine.spatial import camera_rect
+from engine.sprites import Animator, movement_state, player_sheet
+from engine.text import draw_text_wrapped, render_line
+from engine.world import ChunkedWorld
 
 # Screen settings
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Canadian Law For Employees")
 
 # Colors
 WHITE = (255, 255, 255)
@@ -20,108 +29,18 @@ DIALOGUE_BOX_COLOR = (0, 0, 0, 128)
 HUD_COLOR = (0, 0, 0, 180)
 
 # Player settings
-player_pos = [350, HEIGHT // 2]
-player_speed = 0.1
+player_pos = (350, HEIGHT // 2)  # Starting position
+player_speed = 200  # Pixels per second
 player_size = (75,75)
-VERTICAL_SPEED = 0.1  # Added vertical speed
+VERTICAL_SPEED = 200  # Pixels per second
 npc_size = (25,25)
 
-# Load Sprites
-player_sprite_down = pygame.image.load('./images/look_down.png').convert_alpha()
-player_sprite_left = pygame.image.load('./images/look_left.png').convert_alpha()
-player_sprite_right = pygame.image.load('./images/look_right.png').convert_alpha()
-player_sprite_up = pygame.image.load('./images/look_up.png').convert_alpha()
-
-player_walk_down_1 = pygame.image.load('./images/walk_down_1.png').convert_alpha()
-player_walk_down_2 = pygame.image.load('./images/walk_down_2.png').convert_alpha()
-player_walk_left_1 = pygame.image.load('./images/walk_left_1.png').convert_alpha()
-player_walk_left_2 = pygame.image.load('./images/walk_left_2.png').convert_alpha()
-player_walk_right_1 = pygame.image.load('./images/walk_right_1.png').convert_alpha()
-player_walk_right_2 = pygame.image.load('./images/walk_right_2.png').convert_alpha()
-player_walk_up_1 = pygame.image.load('./images/walk_up_1.png').convert_alpha()
-player_walk_up_2 = pygame.image.load('./images/walk_up_2.png').convert_alpha()
-
-# Scale the images to the size of the player
-player_sprite_down = pygame.transform.scale(player_sprite_down, player_size)
-player_sprite_left = pygame.transform.scale(player_sprite_left, player_size)
-player_sprite_right = pygame.transform.scale(player_sprite_right, player_size)
-player_sprite_up = pygame.transform.scale(player_sprite_up, player_size)
-
-player_walk_down_1 = pygame.transform.scale(player_walk_down_1, player_size)
-player_walk_down_2 = pygame.transform.scale(player_walk_down_2, player_size)
-player_walk_left_1 = pygame.transform.scale(player_walk_left_1, player_size)
-player_walk_left_2 = pygame.transform.scale(player_walk_left_2, player_size)
-player_walk_right_1 = pygame.transform.scale(player_walk_right_1, player_size)
-player_walk_right_2 = pygame.transform.scale(player_walk_right_2, player_size)
-player_walk_up_1 = pygame.transform.scale(player_walk_up_1, player_size)
-player_walk_up_2 = pygame.transform.scale(player_walk_up_2, player_size)
-
-
-# Load the background image and scale it to fit the screen size
-background_image = pygame.image.load("./images/tut.png").convert()
-
-background_image = pygame.transform.scale(background_image, (WIDTH, HEIGHT))  # Scale the background
-
-
-
+# Background image, scaled to fit the screen size when the level is entered
+BACKGROUND_IMAGE = "images/tut.png"
 
 npc_sprite = pygame.Surface((50, 50))
 npc_sprite.fill(NPC_COLOR)
 
-# Law NPCs with detailed information
-laws_info = [
-    {
-        "title": "Freedom of Expression",
-        "description": "Freedom of expression is protected under the Canadian Charter of Rights and Freedoms.",
-        "details": [
-            "Includes freedom of speech, press, and other forms of communication",
-            "Has reasonable limits to prevent hate speech",
-            "Protects peaceful protests and demonstrations",
-            "Applies to various forms of expression including art and music"
-        ]
-    },
-    {
-        "title": "Privacy Rights",
-        "description": "Personal information is protected under Canadian privacy laws.",
-        "details": [
-            "Organizations must get consent to collect personal data",
-            "Individuals have the right to access their personal information",
-            "Companies must protect stored personal information",
-            "Privacy breaches must be reported to affected individuals"
-        ]
-    },
-    {
-        "title": "Property Laws",
-        "description": "Canadian law protects property rights and establishes ownership rules.",
-        "details": [
-            "Defines ownership and transfer of property",
-            "Protects against theft and damage",
-            "Establishes rules for landlords and tenants",
-            "Covers both physical and intellectual property"
-        ]
-    },
-    {
-        "title": "Anti-Discrimination",
-        "description": "The Canadian Human Rights Act prohibits discrimination based on protected grounds.",
-        "details": [
-            "Protects against discrimination in employment",
-            "Covers housing and public services",
-            "Includes multiple protected grounds like race, gender, and disability",
-            "Requires reasonable accommodation"
-        ]
-    },
-    {
-        "title": "Right to Assembly",
-        "description": "Canadians have the right to peaceful assembly and association.",
-        "details": [
-            "Allows for peaceful protests and demonstrations",
-            "Protects formation of unions and associations",
-            "Must be conducted peacefully and lawfully",
-            "May require permits for large gatherings"
-        ]
-    }
-]
-
 # NPC positions with varied y positions
 npc_positions = [
     (400, HEIGHT // 2 - 100),
@@ -130,45 +49,15 @@ npc_positions = [
     (2800, HEIGHT // 2 + 100),
     (3600, HEIGHT // 2 - 75)
 ]
+INTERACTION_RADIUS = 60  # How close the player must be to interact with an NPC
 
-# Scenario-based quiz questions
-scenarios = [
-    {
-        "scenario": "Sarah wants to organize a peaceful protest against climate change at a public park. The protest will include speeches and signs.",
-        "question": "Is Sarah's planned protest protected under Canadian law?",
-        "answer": "yes",
-        "explanation": "Yes, peaceful protests are protected under freedom of expression and right to assembly, though permits may be required."
-    },
-    {
-        "scenario": "A company wants to share its customer database with partners without getting permission from customers.",
-        "question": "Is this practice allowed under privacy laws?",
-        "answer": "no",
-        "explanation": "No, companies must obtain consent before sharing personal information with third parties."
-    },
-    {
-        "scenario": "Alex borrowed their neighbor's lawn mower and decided to keep it without permission.",
-        "question": "Is this action legal under property laws?",
-        "answer": "no",
-        "explanation": "No, this would be considered theft and violates property laws."
-    },
-    {
-        "scenario": "An employer refuses to hire qualified candidates based on their religion.",
-        "question": "Is this practice legal under Canadian law?",
-        "answer": "no",
-        "explanation": "No, this is discrimination based on religion and is prohibited under the Human Rights Act."
-    },
-    {
-        "scenario": "Workers at a factory want to form a union to negotiate better working conditions.",
-        "question": "Do they have the right to form a union?",
-        "answer": "yes",
-        "explanation": "Yes, the right to form unions is protected under freedom of association."
-    }
-]
+# Law NPC text and quiz questions, one law per NPC position (data/content/tutorial.json)
+CONTENT_PACK = "tutorial"
 
-# Font settings
-title_font = pygame.font.Font(None, 48)
-main_font = pygame.font.Font(None, 36)
-detail_font = pygame.font.Font(None, 24)
+# Font sizes (the fonts are created on first use)
+TITLE_FONT = 48
+MAIN_FONT = 36
+DETAIL_FONT = 24
 
 class Button:
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: Tuple[int, int, int]):
@@ -179,8 +68,8 @@ class Button:
 
     def draw(self, surface: pygame.Surface):
         color = (min(self.color[0] + 20, 255), min(self.color[1] + 20, 255), min(self.color[2] + 20, 255)) if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect)
-        text_surface = main_font.render(self.text, True, WHITE)
+        surface.fill(color, self.rect)
+        text_surface = render_line(self.text, font(MAIN_FONT), WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -192,239 +81,207 @@ class Button:
                 return True
         return False
 
-def draw_text_wrapped(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int], x: int, y: int, max_width: int) -> int:
-    words = text.split()
-    lines = []
-    current_line = []
-    current_width = 0
-    
-    for word in words:
-        word_surface = font.render(word + " ", True, color)
-        word_width = word_surface.get_width()
-        
-        if current_width + word_width <= max_width:
-            current_line.append(word)
-            current_width += word_width
-        else:
-            lines.append(" ".join(current_line))
-            current_line = [word]
-            current_width = word_width
-    
-    lines.append(" ".join(current_line))
-    
-    y_offset = y
-    for line in lines:
-        text_surface = font.render(line, True, color)
-        surface.blit(text_surface, (x, y_offset))
-        y_offset += font.get_height()
-    
-    return y_offset
-
-def check_npc_interaction(player_x: float, player_y: float, npc_x: float, npc_y: float) -> bool:
-    """Check if player is close enough to interact with NPC"""
-    distance = ((player_x - npc_x) ** 2 + (player_y - npc_y) ** 2) ** 0.5
-    return distance < 60
-
-def tutorial_level():
-    in_tutorial = True
-    showing_details = False
-    current_details = None
-    player_x_offset = 0
-    visited_npcs = set()  # Track which NPCs have been visited
-
-
-
-    showing_details = False
-    current_details = None
-    player_x_offset = 0
-    visited_npcs = set()  # Track which NPCs have been visited
-    walking_animation_frame = 0
-
-
-    while in_tutorial:
-          # Draw the background image
-        screen.blit(background_image, (0, 0))
-        
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and current_details is not None:
-                    showing_details = not showing_details
-                elif event.key == pygame.K_ESCAPE:
-                    showing_details = False
-
-        # Movement controls with boundary checking
-        if not showing_details:
-            keys = pygame.key.get_pressed()
+def law_panel(details: Law) -> pygame.Surface:
+    """Full-screen overlay with the information panel for one law, rendered once"""
+    def build() -> pygame.Surface:
+        # Semi-transparent background
+        panel = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        panel.fill((*WHITE, 128))
+
+        # Information panel
+        info_surface = pygame.Surface((WIDTH - 100, HEIGHT - 100))
+        info_surface.fill(WHITE)
+        pygame.draw.rect(info_surface, BLACK, info_surface.get_rect(), 2)
+
+        # Title
+        title_surface = font(TITLE_FONT).render(details.title, True, BLACK)
+        info_surface.blit(title_surface, (20, 20))
+
+        # Description
+        y_offset = draw_text_wrapped(info_surface, details.description, font(MAIN_FONT), BLACK, 20, 80, WIDTH - 140)
+
+        # Details
+        y_offset += 20
+        for detail in details.details:
+            y_offset = draw_text_wrapped(info_surface, "• " + detail, font(DETAIL_FONT), BLACK, 20, y_offset, WIDTH - 140)
+
+        # Close instruction
+        close_text = font(MAIN_FONT).render("Press SPACE or ESC to close", True, BLACK)
+        info_surface.blit(close_text, (20, HEIGHT - 160))
+
+        panel.blit(info_surface, (50, 50))
+        return panel
+
+    key = ("tutorial-law", details.title, details.description, details.details)
+    return get_panel(key, build)
+
+class TutorialScene(Scene):
+    caption = "Canadian Law For Employees"
+
+    def preload(self):
+        return [Load(BACKGROUND_IMAGE, (WIDTH, HEIGHT))]
+
+    def enter(self):
+        # Loaded on first entry and cached, so re-entering the level costs nothing
+        self.background_image = assets.image(BACKGROUND_IMAGE, (WIDTH, HEIGHT))
+        self.player_animation = Animator(player_sheet(player_size), direction="right")  # Frames packed in one atlas
+        self.laws = load_pack(CONTENT_PACK).laws
+        self.showing_details = False
+        self.current_details = None
+        self.player_pos = list(player_pos)
+        self.player_x_offset = 0
+        # NPC stations streamed in chunks around the camera; the backdrop stays fixed to the screen
+        self.world = ChunkedWorld(npc_positions, length=npc_positions[-1][0] + WIDTH)
+        self.world.stream(*self.camera_span())
+        self.visited_npcs = set()  # Track which NPCs have been visited
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE and self.current_details is not None:
+                self.showing_details = not self.showing_details
+            elif event.key == pygame.K_ESCAPE:
+                if self.showing_details:
+                    self.showing_details = False
+                else:
+                    self.manager.pop()  # Back to the menu
+
+    def update(self, dt: float):
+        # Movement controls with boundary checking, scaled by the step's delta time
+        if not self.showing_details:
+            keys = self.manager.input.get_pressed()
             # Horizontal movement
             if keys[pygame.K_RIGHT]:
-                if player_pos[0] < WIDTH // 2 or player_x_offset <= -npc_positions[-1][0] + WIDTH - 200:
-                    player_pos[0] += player_speed
+                if self.player_pos[0] < WIDTH // 2 or self.player_x_offset <= -npc_positions[-1][0] + WIDTH - 200:
+                    self.player_pos[0] += player_speed * dt
                 else:
-                    player_x_offset -= player_speed
-            elif keys[pygame.K_LEFT] and player_pos[0] > 0:
-                player_pos[0] -= player_speed
-            
+                    self.player_x_offset -= player_speed * dt
+            elif keys[pygame.K_LEFT] and self.player_pos[0] > 0:
+                self.player_pos[0] -= player_speed * dt
+
             # Vertical movement
-            if keys[pygame.K_UP] and player_pos[1] > 0:
-                player_pos[1] -= VERTICAL_SPEED
-            elif keys[pygame.K_DOWN] and player_pos[1] < HEIGHT - player_size[1]:
-                player_pos[1] += VERTICAL_SPEED
-
-         # Draw player animation
-        if keys[pygame.K_RIGHT]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_right_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_right_2, (player_pos[0], player_pos[1]))
-        elif keys[pygame.K_LEFT]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_left_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_left_2, (player_pos[0], player_pos[1]))
-        elif keys[pygame.K_UP]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_up_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_up_2, (player_pos[0], player_pos[1]))
-        elif keys[pygame.K_DOWN]:
-            if walking_animation_frame == 0:
-                screen.blit(player_walk_down_1, (player_pos[0], player_pos[1]))
-            else:
-                screen.blit(player_walk_down_2, (player_pos[0], player_pos[1]))
-        else:
-            # When idle, use the "look" images
-            screen.blit(player_sprite_right, (player_pos[0], player_pos[1]))  # Default to right-facing idle state
-
-        # Reset current_details if no NPC is nearby
-        current_details = None
-
-        # Draw and handle all NPCs
-        for i, (npc_x, npc_y) in enumerate(npc_positions):
-            adjusted_x = npc_x + player_x_offset
-            if 0 < adjusted_x < WIDTH:  # Only draw NPCs on screen
-                screen.blit(npc_sprite, (adjusted_x, npc_y))
-                
-                # Check for interaction with this NPC
-                if check_npc_interaction(player_pos[0], player_pos[1], adjusted_x, npc_y):
-                    current_details = laws_info[i]
-                    if not showing_details:
-                        prompt_text = main_font.render("Press SPACE to learn more", True, BLACK)
-                        screen.blit(prompt_text, (WIDTH // 2 - prompt_text.get_width() // 2, HEIGHT - 50))
-                    visited_npcs.add(i)
-
-        # Show detailed information when activated
-        if showing_details and current_details is not None:
-            # Draw semi-transparent background
-            s = pygame.Surface((WIDTH, HEIGHT))
-            s.set_alpha(128)
-            s.fill(WHITE)
-            screen.blit(s, (0, 0))
-            
-            # Draw information panel
-            info_surface = pygame.Surface((WIDTH - 100, HEIGHT - 100))
-            info_surface.fill(WHITE)
-            pygame.draw.rect(info_surface, BLACK, info_surface.get_rect(), 2)
-            
-            # Title
-            title_surface = title_font.render(current_details["title"], True, BLACK)
-            info_surface.blit(title_surface, (20, 20))
-            
-            # Description
-            y_offset = draw_text_wrapped(info_surface, current_details["description"], main_font, BLACK, 20, 80, WIDTH - 140)
-            
-            # Details
-            y_offset += 20
-            for detail in current_details["details"]:
-                y_offset = draw_text_wrapped(info_surface, "• " + detail, detail_font, BLACK, 20, y_offset, WIDTH - 140)
-            
-            # Draw close instruction
-            close_text = main_font.render("Press SPACE or ESC to close", True, BLACK)
-            info_surface.blit(close_text, (20, HEIGHT - 160))
-            
-            screen.blit(info_surface, (50, 50))
+            if keys[pygame.K_UP] and self.player_pos[1] > 0:
+                self.player_pos[1] -= VERTICAL_SPEED * dt
+            elif keys[pygame.K_DOWN] and self.player_pos[1] < HEIGHT - player_size[1]:
+                self.player_pos[1] += VERTICAL_SPEED * dt
+
+            # Walk or stand facing the way the keys point, advanced by the step's delta time
+            self.player_animation.play(*movement_state(keys, idle_direction="right"))
+            self.player_animation.update(dt)
+
+        # Nearest NPC within reach of the player (world coordinates); None resets current_details
+        self.world.stream(*self.camera_span())
+        nearest = self.world.nearest(self.player_pos[0] - self.player_x_offset, self.player_pos[1], INTERACTION_RADIUS)
+        self.current_details = self.laws[nearest] if nearest is not None else None
+        if nearest is not None and nearest not in self.visited_npcs:
+            self.visited_npcs.add(nearest)
+            self.manager.progress.record(CONTENT_PACK, VISIT, nearest)
 
-        # Draw exit
-        exit_x = npc_positions[-1][0] + 400 + player_x_offset
-        exit_rect = pygame.Rect(exit_x, HEIGHT // 2, 50, 50)
-        
         # Only allow exit if all NPCs have been visited
-        if len(visited_npcs) == len(npc_positions):
-            pygame.draw.rect(screen, GREEN, exit_rect)  # Green exit means it's available
-            if exit_rect.collidepoint(player_pos[0] - player_x_offset, player_pos[1]):
-                quiz()
-                return
+        if len(self.visited_npcs) == len(npc_positions) and self.exit_rect().collidepoint(self.player_pos[0] - self.player_x_offset, self.player_pos[1]):
+            self.manager.replace(TutorialQuizScene())
+
+    def is_idle(self) -> bool:
+        # The info panel freezes the level; otherwise only held arrow keys change anything
+        return self.showing_details or not any_held(self.manager.input.get_pressed())
+
+    def camera_span(self) -> Tuple[float, int]:
+        left, _, width, _ = camera_rect(self.player_x_offset, WIDTH, HEIGHT)
+        return left, width
+
+    def exit_rect(self) -> pygame.Rect:
+        exit_x = npc_positions[-1][0] + 400 + self.player_x_offset
+        return pygame.Rect(exit_x, HEIGHT // 2, 50, 50)
+
+    def draw(self, screen: pygame.Surface):
+        # Restore the background image (only where something was drawn last frame)
+        screen.clear(self.background_image)
+
+        # Draw the player's current animation frame
+        self.player_animation.draw(screen, self.player_pos)
+
+        # Draw the NPCs inside the camera view only
+        for i in self.world.visible(*camera_rect(self.player_x_offset, WIDTH, HEIGHT)):
+            npc_x, npc_y = npc_positions[i]
+            screen.blit(npc_sprite, (npc_x + self.player_x_offset, npc_y))
+
+        if self.current_details is not None and not self.showing_details:
+            prompt_text = render_line("Press SPACE to learn more", font(MAIN_FONT), BLACK)
+            screen.blit(prompt_text, (WIDTH // 2 - prompt_text.get_width() // 2, HEIGHT - 50))
+
+        # Show detailed information when activated (one pre-composited blit)
+        if self.showing_details and self.current_details is not None:
+            screen.blit(law_panel(self.current_details), (0, 0))
+
+        # Draw exit
+        if len(self.visited_npcs) == len(npc_positions):
+            screen.fill(GREEN, self.exit_rect())  # Green exit means it's available
         else:
-            pygame.draw.rect(screen, RED, exit_rect)  # Red exit means player needs to visit more NPCs
+            screen.fill(RED, self.exit_rect())  # Red exit means player needs to visit more NPCs
             # Draw instruction about visiting all NPCs
-            remaining_text = main_font.render(f"Visit all {len(npc_positions) - len(visited_npcs)} remaining NPCs", True, RED)
+            remaining_text = render_line(f"Visit all {len(npc_positions) - len(self.visited_npcs)} remaining NPCs", font(MAIN_FONT), RED)
             screen.blit(remaining_text, (WIDTH // 2 - remaining_text.get_width() // 2, 20))
 
-        pygame.display.flip()
-
-def quiz():
-    current_scenario = 0
-    showing_explanation = False
-    
-    yes_button = Button(WIDTH // 4 - 100, HEIGHT - 100, 200, 50, "YES", GREEN)
-    no_button = Button(3 * WIDTH // 4 - 100, HEIGHT - 100, 200, 50, "NO", RED)
-
-    while current_scenario < len(scenarios):
-        screen.fill(WHITE)
-        
-        scenario = scenarios[current_scenario]
-        
-        if not showing_explanation:
-            # Draw scenario
-            y_offset = draw_text_wrapped(screen, "Scenario:", title_font, BLACK, 50, 50, WIDTH - 100)
-            y_offset = draw_text_wrapped(screen, scenario["scenario"], main_font, BLACK, 50, y_offset + 20, WIDTH - 100)
-            
-            # Draw question
-            y_offset = draw_text_wrapped(screen, "Question:", title_font, BLACK, 50, y_offset + 40, WIDTH - 100)
-            y_offset = draw_text_wrapped(screen, scenario["question"], main_font, BLACK, 50, y_offset + 20, WIDTH - 100)
-            
-            # Draw buttons
-            yes_button.draw(screen)
-            no_button.draw(screen)
-        else:
-            # Draw explanation
-            y_offset = draw_text_wrapped(screen, "Explanation:", title_font, BLACK, 50, 50, WIDTH - 100)
-            y_offset = draw_text_wrapped(screen, scenario["explanation"], main_font, BLACK, 50, y_offset + 20, WIDTH - 100)
-            
-            # Draw continue instruction
-            continue_text = main_font.render("Press SPACE to continue", True, BLACK)
-            screen.blit(continue_text, (WIDTH // 2 - continue_text.get_width() // 2, HEIGHT - 100))
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN and showing_explanation:
-                if event.key == pygame.K_SPACE:
-                    showing_explanation = False
-                    current_scenario += 1
-            elif not showing_explanation:
-                if yes_button.handle_event(event):
-                    if scenario["answer"] == "yes":
-                        showing_explanation = True
-                elif no_button.handle_event(event):
-                    if scenario["answer"] == "no":
-                        showing_explanation = True
-
-        pygame.display.flip()
-
-    # Show completion screen
-    screen.fill(WHITE)
-    completion_text = title_font.render("Congratulations! Tutorial Complete!", True, BLACK)
-    screen.blit(completion_text, (WIDTH // 2 - completion_text.get_width() // 2, HEIGHT // 2))
-    pygame.display.flip()
-    
-    # Wait for a moment
-    pygame.time.wait(3000)
+
+class TutorialQuizScene(Scene):
+    caption = "Canadian Law For Employees"
+    COMPLETION_TIME = 3.0  # Seconds the completion screen stays up
+
+    def enter(self):
+        # Question and explanation pages, each rendered on a worker before it is shown
+        self.quiz = Quiz(load_pack(CONTENT_PACK).scenarios, (WIDTH, HEIGHT))
+        self.completion_timer = 0.0
+
+        self.yes_button = Button(WIDTH // 4 - 100, HEIGHT - 100, 200, 50, "YES", GREEN)
+        self.no_button = Button(3 * WIDTH // 4 - 100, HEIGHT - 100, 200, 50, "NO", RED)
+
+    def exit(self):
+        self.quiz.close()
+
+    def is_idle(self) -> bool:
+        # Pages wait for a click or key; the completion screen runs a timer
+        return not self.quiz.finished
+
+    def handle_event(self, event: pygame.event.Event):
+        quiz = self.quiz
+        if quiz.finished:
+            return
+        if event.type == pygame.KEYDOWN and quiz.showing_explanation:
+            if event.key == pygame.K_SPACE:
+                quiz.advance()
+        elif not quiz.showing_explanation:
+            # Only the right answer turns to the explanation; every attempt is kept for the teacher
+            if self.yes_button.handle_event(event):
+                self.answer("yes")
+            elif self.no_button.handle_event(event):
+                self.answer("no")
+
+    def answer(self, choice: str):
+        question = self.quiz.current
+        self.manager.progress.record(CONTENT_PACK, ANSWER, question, choice, self.quiz.answer(choice))
+
+    def update(self, dt: float):
+        # Keep the completion screen up for a moment, then return to the menu
+        if self.quiz.finished:
+            self.completion_timer += dt
+            if self.completion_timer >= self.COMPLETION_TIME:
+                self.manager.pop()
+
+    def draw(self, screen: pygame.Surface):
+        screen.clear(WHITE)
+
+        if self.quiz.finished:
+            # Show completion screen
+            completion_text = render_line("Congratulations! Tutorial Complete!", font(TITLE_FONT), BLACK)
+            screen.blit(completion_text, (WIDTH // 2 - completion_text.get_width() // 2, HEIGHT // 2))
+            return
+
+        # The page itself is pre-rendered; only the buttons are drawn on top
+        screen.blit(self.quiz.page(), (0, 0))
+        if not self.quiz.showing_explanation:
+            self.yes_button.draw(screen)
+            self.no_button.draw(screen)
+
 
 if __name__ == "__main__":
-    tutorial_level()
-    pygame.quit()
\ No newline at end of file
+    SceneManager().run(loading_screen(TutorialScene()))
+    pygame.quit()